@@ -1,33 +1,101 @@
 """Ambient Music integration — service registration, fade engine, and lifecycle management."""
 
 import asyncio
-from typing import Iterable
+import contextlib
+from typing import Any, Awaitable, Callable, Iterable, Iterator
 import time
+import uuid
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    State,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.service import async_extract_entity_ids
-from homeassistant.const import ATTR_ENTITY_ID
-from async_timeout import timeout
+from homeassistant.helpers.start import async_at_started
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_STOP
+from async_timeout import Timeout, timeout
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
-from .const import DOMAIN, CONF_MEDIA_PLAYERS
-from .fade_engine import fade_volume as _fade_volume_engine, volume_set as _volume_set_engine
-from .watchers import async_setup_watchers
+from .const import (
+    DOMAIN,
+    CONF_MEDIA_PLAYERS,
+    CONF_PLAYLISTS,
+    CONF_PLAYLIST_RADIO_MODE,
+    CONF_PLAYLIST_PROVIDER,
+    CONF_PLAYLIST_URI,
+    CONF_BLOCKERS,
+    CONF_DIRECT_TRANSPORT,
+    CONF_TRANSPORT_URL,
+    CONF_SCHEDULES,
+    CONF_TRIGGERS,
+    DEFAULT_TRIGGERS,
+    SIGNAL_OPTIONS_UPDATED,
+    DUCK_DEFAULT_ATTACK,
+    DUCK_DEFAULT_HOLD,
+    DUCK_DEFAULT_RELEASE,
+    DUCK_DEFAULT_VOLUME,
+    MAX_FADE_SECONDS,
+)
+from .binary_sensor import playlist_sensor_unique_id
+from .ducking import DuckController
+from .fade_engine import FadeMixer, FadeResult, get_known_volume, resolve_speakers
+from .ma_client import MusicAssistantTransport, async_get_server_url, to_ws_url
+from .models import AmbientMusicData
+from .playback import (
+    STATE_FADING_DOWN,
+    STATE_IDLE,
+    STATE_PLAYING,
+    STATE_STARTING,
+    STATE_STOPPING,
+    PlaybackZone,
+)
+from .providers import repair_playlist_record
+from .scheduler import ScheduleEngine, ScheduleWindow
+from .store import RuntimeStore
+from .watchers import StateWatchers, TriggerRule
 
 PLATFORMS = [
     "number", 
     "select", 
     "binary_sensor",
-    "switch"
+    "switch",
+    "sensor",
 ]
 
+# Unique IDs of entities this integration no longer creates.
+_RETIRED_UNIQUE_IDS = {"ambient_music_previous_volume"}
+
+# Option keys applied without reloading the config entry.
+_HOT_APPLY_OPTIONS = {
+    CONF_MEDIA_PLAYERS, CONF_PLAYLISTS, CONF_BLOCKERS, CONF_SCHEDULES, CONF_TRIGGERS
+}
+
+# Interrupted operations due to finish longer ago than this are not resumed after a restart.
+_RESUME_MAX_AGE_SECONDS: float = 3600.0
+# A resumed fade takes at least this long, so it never jumps.
+_RESUME_MIN_FADE_SECONDS: float = 2.0
+# Fades longer than this run without an overall timeout; each volume call keeps its own.
+_LONG_FADE_SECONDS: float = 120.0
+
+
+def _operation_timeout(duration: float, margin: float) -> float | None:
+    """Return the timeout for an operation built around a fade of *duration* seconds."""
+    return None if duration > _LONG_FADE_SECONDS else duration + margin
+
+
 class _ServiceDebouncer:
     """Prevents rapid-fire duplicate service calls within a configurable cooldown window."""
 
@@ -47,86 +115,317 @@ class _ServiceDebouncer:
         _LOGGER.debug(f"Service '{service_name}' debounced, called too recently")
         return False
 
+OUTCOME_COMPLETED = "completed"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+OUTCOME_HANDED_OVER = "handed_over"
+OUTCOME_INTERRUPTED = "interrupted"
+
+
+class _Operation:
+    """One running service operation and the physical speakers it currently owns."""
+
+    def __init__(self, hass: HomeAssistant, description: str, speakers: set[str]):
+        self.hass = hass
+        self.description = description
+        self.speakers = speakers
+        self.released: set[str] = set()
+        self.task: asyncio.Task | None = None
+        self.timeout: Timeout | None = None
+        self._held_timeout: float | None = None
+        self.outcome: str | None = None
+        self.results: list[FadeResult] = []
+        self.phases_ms: dict[str, float] = {}
+
+    @property
+    def owned_speakers(self) -> set[str]:
+        """Speakers this operation still controls."""
+        return self.speakers - self.released
+
+    def filter_targets(self, entity_ids: Iterable[str]) -> list[str]:
+        """Return *entity_ids* with released speakers removed, expanding groups only if needed."""
+        entity_ids = list(entity_ids)
+        if not self.released:
+            return entity_ids
+        return [s for s in resolve_speakers(self.hass, entity_ids) if s not in self.released]
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time one step of the operation into ``phases_ms`` under *name*."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases_ms[name] = _elapsed_ms(started)
+
+    def as_response(self) -> dict[str, Any]:
+        """Outcome, fade results and phase timings, as returned in service responses."""
+        return {
+            "outcome": self.outcome,
+            "handed_over": sorted(self.released),
+            "phases_ms": dict(self.phases_ms),
+            **FadeResult.combine(self.results).as_dict(),
+        }
+
+    def hold_timeout(self) -> None:
+        """Stop the overall timeout while the operation's fade is paused."""
+        if self.timeout is None or self.timeout.deadline is None or self._held_timeout is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._held_timeout = max(self.timeout.deadline - loop.time(), 0.0)
+        self.timeout.reject()
+
+    def release_timeout(self) -> None:
+        """Re-arm a held timeout with the time that was left when it was held."""
+        if self.timeout is None or self._held_timeout is None:
+            return
+        loop = asyncio.get_running_loop()
+        self.timeout.update(loop.time() + self._held_timeout)
+        self._held_timeout = None
+
+
 class _OperationTaskManager:
-    """Tracks one active asyncio.Task per media-player entity, cancelling the old task on overlap."""
+    """
+    Tracks which operation owns each physical speaker, handing speakers over on overlap.
+
+    Targets are resolved through group membership, so a fade on a group conflicts with
+    a fade on any of its members.  Only the overlapping speakers are taken from the older
+    operation, which keeps running for the rest; it is cancelled once it owns nothing.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: RuntimeStore | None = None):
+        self.hass = hass
+        self.store = store
+        self.active_operations: dict[str, _Operation] = {}
+
+    def operations_for(self, target_ids: list[str]) -> list[_Operation]:
+        """Return the operations that own any speaker behind *target_ids*."""
+        speakers = resolve_speakers(self.hass, target_ids)
+        return list({
+            id(op): op for s in speakers if (op := self.active_operations.get(s))
+        }.values())
 
-    def __init__(self):
-        self.active_tasks: dict[str, asyncio.Task] = {}
-    
     def cancel_for_targets(self, target_ids: list[str]) -> None:
-        """Cancel any in-flight tasks for the given entity IDs."""
-        for entity_id in target_ids:
-            if entity_id in self.active_tasks:
-                task = self.active_tasks[entity_id]
-                if not task.done():
-                    task.cancel()
-                del self.active_tasks[entity_id]
-    
-    async def run_operation(self, target_ids: list[str], coro, *, description: str, timeout_seconds: float) -> None:
+        """Take the speakers behind *target_ids* away from any in-flight operations."""
+        self._release_speakers(set(resolve_speakers(self.hass, target_ids)))
+
+    def interrupt_all(self) -> None:
+        """Cancel every running operation; during shutdown their resume plans are kept."""
+        for op in {id(op): op for op in self.active_operations.values()}.values():
+            if op.task is not None and not op.task.done():
+                op.task.cancel()
+
+    def _release_speakers(self, speakers: set[str]) -> None:
+        """Release *speakers* from their owners, cancelling owners left with no speakers."""
+        owners = {id(op): op for s in speakers if (op := self.active_operations.get(s))}
+        for op in owners.values():
+            overlap = op.owned_speakers & speakers
+            op.released.update(overlap)
+            for speaker in overlap:
+                if self.active_operations.get(speaker) is op:
+                    del self.active_operations[speaker]
+            if not op.owned_speakers:
+                if op.task is not None and not op.task.done():
+                    op.task.cancel()
+            else:
+                _LOGGER.debug(
+                    "Handing over speakers %s from '%s'", sorted(overlap), op.description
+                )
+
+    async def run_operation(
+        self,
+        target_ids: list[str],
+        operation: Callable[[_Operation], Awaitable[None]],
+        *,
+        description: str,
+        timeout_seconds: float | None,
+        resume: dict[str, Any] | None = None,
+    ) -> _Operation:
         """
-        Cancel any existing operation for the targets, then run a new one with a timeout.
+        Take over the targets' speakers from existing operations, then run a new one with a timeout.
 
-        :param target_ids: Media-player entity IDs this operation targets.
-        :param coro: Awaitable to execute.
+        Returns the finished operation, with its outcome, fade results and phase timings.
+
+        :param target_ids: Media-player entity IDs this operation targets (may include groups).
+        :param operation: Coroutine function called with the new _Operation; it must pass
+            ``op.released`` to the fade engine and ``op.filter_targets`` other commands.
         :param description: Human-readable label used in log messages.
-        :param timeout_seconds: Maximum seconds before the operation is aborted.
+        :param timeout_seconds: Maximum seconds before the operation is aborted, or None
+            for long fades, which only sleep between steps.
+        :param resume: Optional plan persisted while the operation runs, so it can be
+            resumed if Home Assistant stops before it finishes.
         """
-        self.cancel_for_targets(target_ids)
-        
+        speakers = set(resolve_speakers(self.hass, target_ids))
+        self._release_speakers(speakers)
+        op = _Operation(self.hass, description, speakers)
+        operation_id = uuid.uuid4().hex
+        if resume is not None and self.store is not None:
+            self.store.begin_operation(operation_id, resume)
+
         async def _wrapped_operation():
+            interrupted = False
+            started = time.perf_counter()
             try:
-                async with timeout(timeout_seconds):
-                    await coro
+                async with timeout(timeout_seconds) as op.timeout:
+                    await operation(op)
+                op.outcome = OUTCOME_COMPLETED
             except asyncio.CancelledError:
                 _LOGGER.debug(f"Operation cancelled: {description}")
+                # Keep the plan when shutdown, not a newer operation, cancelled this one.
+                interrupted = self.hass.is_stopping
+                op.outcome = OUTCOME_INTERRUPTED if interrupted else OUTCOME_HANDED_OVER
                 raise
             except asyncio.TimeoutError:
+                op.outcome = OUTCOME_TIMEOUT
                 _LOGGER.warning(
                     "Timeout (%.1fs) while executing '%s' in ambient_music",
                     timeout_seconds,
                     description,
                 )
             except Exception:
+                op.outcome = OUTCOME_ERROR
                 _LOGGER.exception(
                     "Unexpected error while executing '%s' in ambient_music", description
                 )
             finally:
-                for entity_id in target_ids:
-                    if entity_id in self.active_tasks and self.active_tasks[entity_id].done():
-                        del self.active_tasks[entity_id]
-        
-        task = asyncio.create_task(_wrapped_operation())
-        for entity_id in target_ids:
-            self.active_tasks[entity_id] = task
-        
+                op.phases_ms["total"] = _elapsed_ms(started)
+                for speaker in op.speakers:
+                    if self.active_operations.get(speaker) is op:
+                        del self.active_operations[speaker]
+                if self.store is not None and not interrupted:
+                    self.store.end_operation(operation_id)
+
+        op.task = asyncio.create_task(_wrapped_operation())
+        for speaker in speakers:
+            self.active_operations[speaker] = op
+
         try:
-            await task
+            await op.task
         except asyncio.CancelledError:
-            pass
+            # A handover only cancels op.task; propagate if the caller itself was cancelled.
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+        return op
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """YAML setup stub — all configuration is via config entries."""
     return True
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """
+    Migrate options to the current schema.
+
+    Version 2 stores every playlist as a record with its provider and URI resolved,
+    replacing legacy bare-ID strings and ``{id, radio_mode}`` dicts.  A provider guessed
+    from an ambiguous ID is logged and flagged ``provider_guessed`` on the record.
+    """
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        playlists = {}
+        for name, value in (entry.options.get(CONF_PLAYLISTS) or {}).items():
+            if isinstance(value, dict):
+                playlist_id = str(value.get("id", ""))
+                radio_mode = bool(value.get(CONF_PLAYLIST_RADIO_MODE, False))
+            else:
+                playlist_id, radio_mode = str(value or ""), False
+            record, others = repair_playlist_record(
+                {"id": playlist_id, CONF_PLAYLIST_RADIO_MODE: radio_mode}
+            )
+            if others:
+                _LOGGER.warning(
+                    "Playlist '%s' has an ID valid for %s; assumed %s. Re-enter it as a URL "
+                    "to pick the provider explicitly",
+                    name,
+                    ", ".join([record["provider"], *others]),
+                    record["provider"],
+                )
+            playlists[str(name)] = record
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_PLAYLISTS: playlists}, version=2
+        )
+        _LOGGER.debug("Migrated Ambient Music options to version 2")
+
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ambient Music from a config entry — registers services, watchers, and platforms."""
+    setup_started = time.perf_counter()
     service_debouncer = _ServiceDebouncer()
-    task_manager = _OperationTaskManager()
+    store = RuntimeStore(hass, entry.entry_id)
+    await store.async_load()
+    task_manager = _OperationTaskManager(hass, store)
+    data = AmbientMusicData(store=store, options=dict(entry.options))
+    data.setup_timings["store_load"] = _elapsed_ms(setup_started)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data
+    volume_shadow = data.volume_shadow
+    volume_shadow.on_record = store.record_volumes
+    breakers = data.breakers
     
     async def _options_updated(hass: HomeAssistant, updated_entry: ConfigEntry):
-        await hass.config_entries.async_reload(updated_entry.entry_id)
+        """
+        Apply an options change in place, reloading only for settings that need a rebuild.
+
+        Players are read live by the services, so running operations are untouched;
+        playlist and blocker changes are pushed to the entities over a dispatcher signal.
+        """
+        current = dict(updated_entry.options)
+        changed = {
+            key for key in data.options.keys() | current.keys()
+            if data.options.get(key) != current.get(key)
+        }
+        if not changed:
+            return
+        if changed - _HOT_APPLY_OPTIONS:
+            await hass.config_entries.async_reload(updated_entry.entry_id)
+            return
+        data.options = current
+        if CONF_SCHEDULES in changed and data.scheduler is not None:
+            await data.scheduler.async_set_windows(_schedule_windows(current))
+        if CONF_TRIGGERS in changed and data.watchers is not None:
+            data.watchers.async_set_rules(_trigger_rules(current))
+        _LOGGER.debug("Applying options changes in place: %s", sorted(changed))
+        async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id), changed)
 
     entry.async_on_unload(entry.add_update_listener(_options_updated))
 
-    async def _cleanup_orphan_entity(_now=None):
-            ent_reg = er.async_get(hass)
-            old_entity_id = "number.ambient_music_previous_volume"
+    cleanup_started = time.perf_counter()
+    _async_cleanup_orphan_entities(hass, entry)
+    data.setup_timings["orphan_cleanup"] = _elapsed_ms(cleanup_started)
+
+    transport: MusicAssistantTransport | None = None
+    if entry.options.get(CONF_DIRECT_TRANSPORT, False):
+        custom_url = entry.options.get(CONF_TRANSPORT_URL)
+        ws_url = to_ws_url(custom_url) if custom_url else async_get_server_url(hass)
+        if ws_url:
+            transport = MusicAssistantTransport(hass, ws_url)
+            data.transport = transport
+            entry.async_create_background_task(
+                hass, transport.async_run(), "ambient_music_ma_transport"
+            )
+            entry.async_on_unload(transport.async_stop)
+        else:
+            _LOGGER.warning(
+                "Direct Music Assistant transport is enabled but no server URL was found; "
+                "using Home Assistant services"
+            )
 
-            if ent_reg.async_get(old_entity_id):
-                _LOGGER.warning("Removing orphaned entity registry entry: %s", old_entity_id)
-                ent_reg.async_remove(old_entity_id)
+    # One tick loop drives every fade of this entry.
+    mixer = FadeMixer(hass, transport, volume_shadow, breakers)
+    data.mixer = mixer
+    entry.async_on_unload(mixer.async_stop)
 
-    hass.bus.async_listen_once("homeassistant_started", _cleanup_orphan_entity)
+    @callback
+    def _async_stop_fades(_event: Event) -> None:
+        # Interrupted operations keep their persisted plan and are resumed after the restart.
+        task_manager.interrupt_all()
+        mixer.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_fades)
+    )
 
     def _configured_players() -> list[str]:
         """Return the media-player entity IDs saved in the config entry options."""
@@ -190,6 +489,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Ambient Music service called without any target, no media players are configured in options, or a playlist uri was not given"
             )
             return
+        entity_ids = list(entity_ids)
+        if transport is not None:
+            entity_ids = await transport.play_media(entity_ids, uri, radio_mode)
+            if not entity_ids:
+                return
         if hass.services.has_service("music_assistant", "play_media"):
             await hass.services.async_call(
                 "music_assistant",
@@ -234,13 +538,186 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         st = hass.states.get("binary_sensor.ambient_music_blockers_clear")
         return bool(st and st.state == "on")
 
-    fade_schema = vol.Schema(
-        {
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
-            vol.Required("target_volume"): vol.Coerce(float),
-            vol.Required("duration"): vol.Coerce(float),
-            vol.Optional("curve", default="logarithmic"): vol.In(["logarithmic", "bezier", "linear"]),
+    def _default_volume() -> float:
+        return _get_state_float("number.ambient_music_default_volume", 0.35)
+
+    async def _fade_to_levels(
+        op: _Operation,
+        targets: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Fade *targets* to *target_volume*, or each to its own level from *levels*, plus offsets.
+
+        Everything runs as one mixer fade with shared timing; a native group is only split
+        into its members when they need different levels.
+        """
+        with op.phase("fade"):
+            op.results.append(
+                await mixer.async_fade(
+                    targets,
+                    target_volume,
+                    duration,
+                    curve,
+                    released=op.released,
+                    levels=levels,
+                    offsets=offsets,
+                )
+            )
+
+    def _fade_operation(
+        targets: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+    ) -> Callable[[_Operation], Awaitable[None]]:
+        """Build the operation behind fade_volume (and resumed fade-ups)."""
+        async def _fade(op: _Operation) -> None:
+            await _fade_to_levels(op, targets, target_volume, duration, curve, levels, offsets)
+
+        return _fade
+
+    def _silence_operation(
+        targets: list[str],
+        fade_down: float,
+        pin_zero: bool = False,
+        record_levels: bool = True,
+    ) -> Callable[[_Operation], Awaitable[None]]:
+        """
+        Build the operation behind stop_playing and pause_for_switchover.
+
+        :param pin_zero: Re-send volume 0 after the fade (switchover).
+        :param record_levels: Persist each speaker's level before fading, so the next
+            play restores it; off when resuming a half-finished fade.
+        """
+        async def _silence(op: _Operation) -> None:
+            if record_levels:
+                levels = {
+                    speaker: level
+                    for speaker in op.filter_targets(resolve_speakers(hass, targets))
+                    if (level := get_known_volume(hass, speaker, volume_shadow))
+                }
+                if levels:
+                    store.record_pre_stop(levels, _default_volume())
+            with op.phase("fade_down"):
+                op.results.append(
+                    await mixer.async_fade(
+                        targets, 0.0, fade_down, "logarithmic", released=op.released
+                    )
+                )
+            if pin_zero:
+                with op.phase("pin_zero"):
+                    op.results.append(
+                        await mixer.async_set_volume(targets, 0.0, released=op.released)
+                    )
+            with op.phase("pause"):
+                await _pause(op.filter_targets(targets))
+
+        return _silence
+
+    def _silence_plan(targets: list[str], fade_down: float) -> dict[str, Any]:
+        return {"kind": "stop", "targets": targets, "duration": fade_down}
+
+    def _fade_plan(
+        targets: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "kind": "fade",
+            "targets": targets,
+            "target_volume": target_volume,
+            "duration": duration,
+            "curve": curve,
+            "levels": levels or {},
+            "offsets": offsets or {},
+        }
+
+    def _is_audible() -> bool:
+        """Return True if any configured player is currently playing."""
+        return any(
+            (st := hass.states.get(player)) is not None and st.state == "playing"
+            for player in _configured_players()
+        )
+
+    zone = PlaybackZone(
+        fade_down=lambda: _async_switchover_down(_configured_players()),
+        start=lambda: _async_start_playlist(_configured_players()),
+        can_start=_blockers_clear,
+        is_audible=_is_audible,
+    )
+    data.zone = zone
+
+    def _is_zone(targets: list[str]) -> bool:
+        return set(targets) == set(_configured_players())
+
+    async def _zone_phase(
+        targets: list[str],
+        state: str,
+        job: Callable[[], Awaitable[_Operation | None]],
+        settled_state: str,
+    ) -> _Operation | None:
+        """Run *job*, tracked as a zone phase when it targets exactly the configured players."""
+        if _is_zone(targets):
+            return await zone.async_run_phase(state, job, settled_state)
+        return await job()
+
+    def _service_response(
+        op: _Operation | None = None, *, debounced: bool = False, blocked: bool = False
+    ) -> ServiceResponse:
+        """
+        Build the optional response of the playback and fade services.
+
+        :param op: The operation the call ran, or None if it ran nothing.
+        :param debounced: The call was dropped by the service debouncer.
+        :param blocked: The call was dropped because blockers were not clear.
+        """
+        response: dict[str, Any] = {
+            "debounced": debounced,
+            "blocked": blocked,
+            "outcome": None,
+            "handed_over": [],
+            "phases_ms": {},
+            **FadeResult().as_dict(),
         }
+        if op is not None:
+            response.update(op.as_response())
+        return response
+
+    fade_schema = vol.All(
+        vol.Schema(
+            {
+                vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+                vol.Optional("target_volume"): vol.Coerce(float),
+                vol.Optional("targets"): {
+                    cv.entity_domain("media_player"): vol.All(
+                        vol.Coerce(float), vol.Range(min=0.0, max=1.0)
+                    )
+                },
+                vol.Optional("offsets"): {
+                    cv.entity_domain("media_player"): vol.All(
+                        vol.Coerce(float), vol.Range(min=-1.0, max=1.0)
+                    )
+                },
+                vol.Required("duration"): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.0, max=MAX_FADE_SECONDS)
+                ),
+                vol.Optional("curve", default="logarithmic"): vol.In(
+                    ["logarithmic", "bezier", "linear"]
+                ),
+                vol.Optional("dry_run", default=False): cv.boolean,
+            }
+        ),
+        cv.has_at_least_one_key("target_volume", "targets"),
     )
 
     async def _set_repeat(entity_ids: Iterable[str], mode: str):
@@ -250,6 +727,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Ambient Music service called without any target, and/or no media players are configured in options"
             )
             return
+        entity_ids = list(entity_ids)
+        if transport is not None:
+            entity_ids = await transport.repeat(entity_ids, mode)
+            if not entity_ids:
+                return
         if hass.services.has_service("media_player", "repeat_set"):
             try:
                 await hass.services.async_call(
@@ -270,6 +752,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Ambient Music service called without any target, and/or no media players are configured in options"
             )
             return
+        entity_ids = list(entity_ids)
+        if transport is not None:
+            entity_ids = await transport.shuffle(entity_ids, shuffle)
+            if not entity_ids:
+                return
         try:
             await hass.services.async_call(
                 "media_player",
@@ -282,26 +769,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def svc_fade_volume(call: ServiceCall):
         """Service handler: fade target players to a specified volume over a given duration."""
-        targets = await _resolve_targets(call)
-        target_volume = float(call.data["target_volume"])
+        levels: dict[str, float] = dict(call.data.get("targets") or {})
+        offsets: dict[str, float] = dict(call.data.get("offsets") or {})
+        if "target_volume" in call.data:
+            target_volume = float(call.data["target_volume"])
+            targets = sorted(set(await _resolve_targets(call)) | set(levels))
+        else:
+            # Only the mapped players fade, each to its own level.
+            target_volume = 0.0
+            targets = sorted(levels)
         duration = float(call.data["duration"])
         curve = call.data.get("curve", "logarithmic")
+        if call.data.get("dry_run"):
+            return {
+                "dry_run": True,
+                "schedule": mixer.plan(targets, target_volume, duration, curve, levels, offsets),
+            }
 
-        fade_timeout = duration + 10.0
-        
-        async def _fade() -> None:
-            await _fade_volume_engine(hass, targets, target_volume, duration, curve)
+        fade_timeout = _operation_timeout(duration, 10.0)
 
-        await task_manager.run_operation(
+        op = await task_manager.run_operation(
             targets,
-            _fade(),
+            _fade_operation(targets, target_volume, duration, curve, levels, offsets),
             description=(
-                f"svc_fade_volume to {target_volume} over {duration}s for {targets}"
+                f"svc_fade_volume to {levels or target_volume} over {duration}s for {targets}"
             ),
-            timeout_seconds=fade_timeout
+            timeout_seconds=fade_timeout,
+            resume=_fade_plan(targets, target_volume, duration, curve, levels, offsets),
         )
+        return _service_response(op)
 
-    hass.services.async_register(DOMAIN, "fade_volume", svc_fade_volume, schema=fade_schema)
+    hass.services.async_register(
+        DOMAIN,
+        "fade_volume",
+        svc_fade_volume,
+        schema=fade_schema,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     pause_schema = vol.Schema(
         {
@@ -310,32 +814,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }
     )
 
-    async def svc_pause_for_switchover(call: ServiceCall):
-        """Service handler: fade down to silence and pause — used during playlist switchovers."""
-        if not service_debouncer.should_execute("pause_for_switchover"):
-            return
-        if call.data.get("blockers_cleared", True) and not _blockers_clear():
-            return
-        targets = await _resolve_targets(call)
+    async def _async_switchover_down(targets: list[str]) -> _Operation:
+        """Fade *targets* to silence, pin them at 0 and pause them."""
         fade_down = _get_state_float("number.ambient_music_volume_fade_down_seconds", 5.0)
 
         switchover_timeout = fade_down + 10.0
 
-        async def _switchover() -> None:
-            await _fade_volume_engine(hass, targets, 0.0, fade_down, "logarithmic")
-            await _volume_set_engine(hass, targets, 0.0)
-            await _pause(targets)
-
-        await task_manager.run_operation(
+        return await task_manager.run_operation(
             targets,
-            _switchover(),
+            _silence_operation(targets, fade_down, pin_zero=True),
             description=(
                 f"svc_pause_for_switchover playlist to volume 0 over {fade_down}s for {targets}"
             ),
-            timeout_seconds=switchover_timeout
+            timeout_seconds=switchover_timeout,
+            resume=_silence_plan(targets, fade_down),
+        )
+
+    async def svc_pause_for_switchover(call: ServiceCall):
+        """Service handler: fade down to silence and pause — used during playlist switchovers."""
+        if not service_debouncer.should_execute("pause_for_switchover"):
+            return _service_response(debounced=True)
+        if call.data.get("blockers_cleared", True) and not _blockers_clear():
+            return _service_response(blocked=True)
+        targets = await _resolve_targets(call)
+        op = await _zone_phase(
+            targets, STATE_FADING_DOWN, lambda: _async_switchover_down(targets), STATE_IDLE
         )
+        return _service_response(op)
 
-    hass.services.async_register(DOMAIN, "pause_for_switchover", svc_pause_for_switchover, schema=pause_schema)
+    hass.services.async_register(
+        DOMAIN,
+        "pause_for_switchover",
+        svc_pause_for_switchover,
+        schema=pause_schema,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     play_schema = vol.Schema(
         {
@@ -344,21 +857,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             vol.Optional("fade_up_duration"): vol.Coerce(float),
             vol.Optional("target_volume"): vol.Coerce(float),
             vol.Optional("curve", default="logarithmic"): vol.In(["logarithmic", "bezier", "linear"]),
+            vol.Optional("dry_run", default=False): cv.boolean,
         }
     )
 
-    async def svc_play_current_playlist(call: ServiceCall):
-        """Service handler: start the currently selected playlist, fading up to the target volume."""
-        if not service_debouncer.should_execute("play_current_playlist"):
-            return
-        if call.data.get("blockers_cleared", True) and not _blockers_clear():
-            return
-        targets = await _resolve_targets(call)
+    def _start_settings(
+        targets: list[str], target_vol: float | None, fade_up: float | None
+    ) -> tuple[State, str, bool, float, float, dict[str, float]] | None:
+        """
+        Resolve what starting the selected playlist on *targets* would do.
+
+        :return: (playlist select state, uri, radio mode, target volume, fade-up seconds,
+            per-speaker restore levels), or None if there are no targets or no playlist.
+        """
         if not targets:
             _LOGGER.warning(
                 "Ambient Music service called without any target, and/or no media players are configured in options"
             )
-            return
+            return None
 
         sel = hass.states.get("select.ambient_music_playlists")
         uri = sel and sel.attributes.get("current_playlist_uri")
@@ -367,40 +883,117 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.warning(
                 "Ambient Music service called without any playlist ID"
             )
-            return
+            return None
 
-        target_vol = call.data.get("target_volume")
+        # Without an explicit target, each speaker returns to the level it had when it
+        # was last stopped, as long as the default volume has not changed since.
+        levels: dict[str, float] = {}
         if target_vol is None:
-            target_vol = _get_state_float("number.ambient_music_default_volume", 0.35)
+            target_vol = _default_volume()
+            levels = store.pre_stop_volumes(resolve_speakers(hass, targets), target_vol)
 
-        fade_up = call.data.get("fade_up_duration")
         if fade_up is None:
             fade_up = _get_state_float("number.ambient_music_volume_fade_up_seconds", 5.0)
+        return sel, uri, bool(radio_mode), float(target_vol), float(fade_up), levels
 
-        curve = call.data.get("curve", "logarithmic")
+    async def _async_start_playlist(
+        targets: list[str],
+        target_vol: float | None = None,
+        fade_up: float | None = None,
+        curve: str = "logarithmic",
+    ) -> _Operation | None:
+        """Start the selected playlist on *targets* and fade up; return None if none is set."""
+        settings = _start_settings(targets, target_vol, fade_up)
+        if settings is None:
+            return None
+        sel, uri, radio_mode, target_vol, fade_up, levels = settings
 
-        play_timeout = fade_up + 20.0
+        play_timeout = _operation_timeout(fade_up, 20.0)
 
-        async def _start_playing() -> None:
+        async def _start_playing(op: _Operation) -> None:
             # Silence first, start playback, then fade up to target volume.
             # volume_set_engine resolves group members and skips unavailable speakers,
             # which handles MA sync groups that lack volume control before playback starts.
-            await _volume_set_engine(hass, targets, 0.0)
-            await _play_playlist(targets, uri, radio_mode=bool(radio_mode))
-            await _set_repeat(targets, "all")
-            await _set_shuffle(targets, True)
-            await _fade_volume_engine(hass, targets, float(target_vol), float(fade_up), curve)
+            # Speakers already silent (e.g. a stop fade just finished) are not re-commanded.
+            with op.phase("silence"):
+                op.results.append(
+                    await mixer.async_set_volume(
+                        targets, 0.0, skip_if_at_level=True, released=op.released
+                    )
+                )
+            with op.phase("play_media"):
+                await _play_playlist(op.filter_targets(targets), uri, radio_mode=radio_mode)
+            store.record_playlist(op.filter_targets(targets), sel.state, uri)
+            with op.phase("repeat_shuffle"):
+                await _set_repeat(op.filter_targets(targets), "all")
+                await _set_shuffle(op.filter_targets(targets), True)
+            await _fade_to_levels(op, targets, target_vol, fade_up, curve, levels)
 
-        await task_manager.run_operation(
+        return await task_manager.run_operation(
             targets,
-            _start_playing(),
+            _start_playing,
             description=(
                 f"svc_play_current_playlist (uri={uri}) to volume {target_vol} over {fade_up}s for {targets}"
             ),
-            timeout_seconds=play_timeout
+            timeout_seconds=play_timeout,
+            resume=_fade_plan(targets, target_vol, fade_up, curve, levels),
         )
 
-    hass.services.async_register(DOMAIN, "play_current_playlist", svc_play_current_playlist, schema=play_schema)
+    def _play_dry_run(
+        targets: list[str], target_vol: float | None, fade_up: float | None, curve: str
+    ) -> ServiceResponse:
+        """Describe what play_current_playlist would do, without touching any player."""
+        settings = _start_settings(targets, target_vol, fade_up)
+        if settings is None:
+            return {"dry_run": True, "playlist": None, "silence": [], "schedule": None}
+        sel, uri, _, target_vol, fade_up, levels = settings
+        return {
+            "dry_run": True,
+            "playlist": {"name": sel.state, "uri": uri},
+            # Set to 0 before playback starts; speakers already silent are left alone.
+            "silence": [
+                speaker
+                for speaker in resolve_speakers(hass, targets)
+                if (get_known_volume(hass, speaker, volume_shadow) or 0.0) > 0.0
+            ],
+            "schedule": mixer.plan(targets, target_vol, fade_up, curve, levels, start_level=0.0),
+        }
+
+    async def svc_play_current_playlist(call: ServiceCall):
+        """Service handler: start the currently selected playlist, fading up to the target volume."""
+        if call.data.get("dry_run"):
+            # Not debounced, so planning never holds back a real start.
+            response = _play_dry_run(
+                await _resolve_targets(call),
+                call.data.get("target_volume"),
+                call.data.get("fade_up_duration"),
+                call.data.get("curve", "logarithmic"),
+            )
+            response["blocked"] = call.data.get("blockers_cleared", True) and not _blockers_clear()
+            return response
+        if not service_debouncer.should_execute("play_current_playlist"):
+            return _service_response(debounced=True)
+        if call.data.get("blockers_cleared", True) and not _blockers_clear():
+            return _service_response(blocked=True)
+        targets = await _resolve_targets(call)
+        target_vol = call.data.get("target_volume")
+        fade_up = call.data.get("fade_up_duration")
+        curve = call.data.get("curve", "logarithmic")
+        op = await _zone_phase(
+            targets,
+            STATE_STARTING,
+            lambda: _async_start_playlist(targets, target_vol, fade_up, curve),
+            STATE_PLAYING,
+        )
+        return _service_response(op)
+
+    hass.services.async_register(
+        DOMAIN,
+        "play_current_playlist",
+        svc_play_current_playlist,
+        schema=play_schema,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     stop_schema = vol.Schema(
         {
@@ -408,53 +1001,330 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }
     )
 
-    async def svc_stop_playing(call: ServiceCall):
-        """Service handler: fade down to silence and pause playback."""
-        if not service_debouncer.should_execute("stop_playing"):
-            return
-        targets = await _resolve_targets(call)
+    async def _async_stop_playing(targets: list[str]) -> _Operation | None:
+        """Fade *targets* down to silence and pause them, as a zone phase for the zone."""
         if not targets:
             _LOGGER.warning(
                 "Ambient Music service called without any target, and/or no media players are configured in options"
             )
-            return
+            return None
         fade_down = _get_state_float("number.ambient_music_volume_fade_down_seconds", 5.0)
 
         stop_timeout = fade_down + 10.0
 
-        async def _stop() -> None:
-            await _fade_volume_engine(hass, targets, 0.0, fade_down, "logarithmic")
-            await _pause(targets)
+        async def _stop() -> _Operation:
+            return await task_manager.run_operation(
+                targets,
+                _silence_operation(targets, fade_down),
+                description=(
+                    f"svc_stop_playing playlist to volume 0 over {fade_down}s for {targets}"
+                ),
+                timeout_seconds=stop_timeout,
+                resume=_silence_plan(targets, fade_down),
+            )
 
-        await task_manager.run_operation(
-            targets,
-            _stop(),
-            description=(
-                f"svc_stop_playing playlist to volume 0 over {fade_down}s for {targets}"
+        if _is_zone(targets):
+            zone.async_clear_request()
+        return await _zone_phase(targets, STATE_STOPPING, _stop, STATE_IDLE)
+
+    async def svc_stop_playing(call: ServiceCall):
+        """Service handler: fade down to silence and pause playback."""
+        if not service_debouncer.should_execute("stop_playing"):
+            return _service_response(debounced=True)
+        return _service_response(await _async_stop_playing(await _resolve_targets(call)))
+
+    hass.services.async_register(
+        DOMAIN,
+        "stop_playing",
+        svc_stop_playing,
+        schema=stop_schema,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    ducker = DuckController(hass, mixer, volume_shadow)
+    data.ducker = ducker
+    entry.async_on_unload(ducker.async_stop)
+
+    duck_schema = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional("volume", default=DUCK_DEFAULT_VOLUME): vol.All(
+                vol.Coerce(float), vol.Range(min=0.0, max=1.0)
+            ),
+            vol.Optional("attack", default=DUCK_DEFAULT_ATTACK): vol.All(
+                vol.Coerce(float), vol.Range(min=0.0, max=5.0)
             ),
-            timeout_seconds=stop_timeout
+            vol.Optional("hold", default=DUCK_DEFAULT_HOLD): vol.All(
+                vol.Coerce(float), vol.Range(min=0.0, max=3600.0)
+            ),
+            vol.Optional("release", default=DUCK_DEFAULT_RELEASE): vol.All(
+                vol.Coerce(float), vol.Range(min=0.0, max=60.0)
+            ),
+        }
+    )
+
+    async def svc_duck(call: ServiceCall):
+        """Service handler: duck for an announcement, restoring after the hold and release."""
+        targets = await _resolve_targets(call)
+        if not targets:
+            return
+        await ducker.async_duck(
+            targets,
+            call.data["volume"],
+            call.data["attack"],
+            call.data["hold"],
+            call.data["release"],
         )
 
-    hass.services.async_register(DOMAIN, "stop_playing", svc_stop_playing, schema=stop_schema)
+    hass.services.async_register(DOMAIN, "duck", svc_duck, schema=duck_schema)
+
+    fade_control_schema = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
+
+    async def svc_pause_fade(call: ServiceCall):
+        """Service handler: hold running fades at their current level (all if no entity_id)."""
+        paused = mixer.async_pause(call.data.get(ATTR_ENTITY_ID))
+        # The owning operations keep running; their timeouts wait for the resume.
+        for op in task_manager.operations_for(paused):
+            op.hold_timeout()
+
+    async def svc_resume_fade(call: ServiceCall):
+        """Service handler: continue paused fades from where they were held."""
+        resumed = mixer.async_resume(call.data.get(ATTR_ENTITY_ID))
+        for op in task_manager.operations_for(resumed):
+            op.release_timeout()
+
+    async def svc_abort_fade(call: ServiceCall):
+        """Service handler: end running fades at their current level."""
+        owners = task_manager.operations_for(mixer.async_abort(call.data.get(ATTR_ENTITY_ID)))
+        # The operations carry on with whatever follows their fade.
+        for op in owners:
+            op.release_timeout()
+
+    for name, handler in (
+        ("pause_fade", svc_pause_fade),
+        ("resume_fade", svc_resume_fade),
+        ("abort_fade", svc_abort_fade),
+    ):
+        hass.services.async_register(DOMAIN, name, handler, schema=fade_control_schema)
+
+    # The bulky select and blocker attributes are not recorded; these return them on demand.
+    async def svc_list_playlists(call: ServiceCall) -> ServiceResponse:
+        """Service handler: return every configured playlist record and the selected one."""
+        sel = hass.states.get("select.ambient_music_playlists")
+        return {
+            "current": sel.state if sel else None,
+            "playlists": {
+                name: {
+                    "id": rec.get("id", ""),
+                    "uri": rec.get(CONF_PLAYLIST_URI, ""),
+                    "provider": rec.get(CONF_PLAYLIST_PROVIDER, ""),
+                    "radio_mode": bool(rec.get(CONF_PLAYLIST_RADIO_MODE, False)),
+                }
+                for name, rec in (entry.options.get(CONF_PLAYLISTS) or {}).items()
+            },
+        }
 
-    cleanup_watchers = await async_setup_watchers(
+    async def svc_list_blockers(call: ServiceCall) -> ServiceResponse:
+        """Service handler: return the latest result of every blocker."""
+        st = hass.states.get("binary_sensor.ambient_music_blockers_clear")
+        attrs = st.attributes if st else {}
+        return {
+            "all_passed": bool(st and st.state == "on"),
+            "blockers": list(attrs.get("blockers") or []),
+        }
+
+    hass.services.async_register(
+        DOMAIN, "list_playlists", svc_list_playlists, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN, "list_blockers", svc_list_blockers, supports_response=SupportsResponse.ONLY
+    )
+
+    async def _async_trigger_play() -> _Operation | None:
+        """Trigger-rule play: the configured players, only while blockers are clear."""
+        if not _blockers_clear():
+            return None
+        players = _configured_players()
+        return await _zone_phase(
+            players, STATE_STARTING, lambda: _async_start_playlist(players), STATE_PLAYING
+        )
+
+    # Trigger rules call these directly, without the service debouncer: each rule fires
+    # once per state flip or time, and play and stop are serialised by the watchers.
+    watchers = StateWatchers(
         hass,
-        entry.entry_id,
-        svc_play_current_playlist,
-        svc_pause_for_switchover,
-        svc_stop_playing,
-        service_debouncer
+        _async_trigger_play,
+        lambda: _async_stop_playing(_configured_players()),
+        zone,
+        _trigger_rules(entry.options),
     )
-    entry.async_on_unload(cleanup_watchers)
+    data.watchers = watchers
+    watchers.async_start()
+    entry.async_on_unload(watchers.async_stop)
 
     entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "fade_volume"))
     entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "pause_for_switchover"))
     entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "play_current_playlist"))
     entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "stop_playing"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "duck"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "pause_fade"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "resume_fade"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "abort_fade"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "list_playlists"))
+    entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, "list_blockers"))
+
+    async def _resume_operation(plan: dict[str, Any]) -> None:
+        """Finish an operation the previous run left half-done, over its remaining time."""
+        targets = [t for t in plan.get("targets", []) if isinstance(t, str)]
+        try:
+            elapsed = time.time() - float(plan.get("started", 0.0))
+            duration = float(plan.get("duration", 0.0))
+        except (TypeError, ValueError):
+            return
+        if not targets or elapsed - duration > _RESUME_MAX_AGE_SECONDS:
+            return
+        # Continues from each speaker's current level, so a long ramp picks up where it was.
+        remaining = max(duration - elapsed, _RESUME_MIN_FADE_SECONDS)
+
+        if plan.get("kind") == "stop":
+            operation = _silence_operation(targets, remaining, record_levels=False)
+            resume = _silence_plan(targets, remaining)
+        elif plan.get("kind") == "fade":
+            target_volume = float(plan.get("target_volume", 0.0))
+            curve = plan.get("curve", "logarithmic")
+            levels = plan.get("levels") or {}
+            offsets = plan.get("offsets") or {}
+            operation = _fade_operation(targets, target_volume, remaining, curve, levels, offsets)
+            resume = _fade_plan(targets, target_volume, remaining, curve, levels, offsets)
+        else:
+            return
+
+        _LOGGER.debug("Resuming interrupted %s for %s over %.1fs", plan["kind"], targets, remaining)
+        await task_manager.run_operation(
+            targets,
+            operation,
+            description=f"resumed {plan['kind']} for {targets}",
+            timeout_seconds=_operation_timeout(remaining, 10.0),
+            resume=resume,
+        )
+
+    async def _resume_interrupted(_hass: HomeAssistant) -> None:
+        # Oldest first, so a newer interrupted operation takes its speakers over again.
+        plans = sorted(store.pop_interrupted_operations(), key=lambda p: p.get("started", 0.0))
+        for plan in plans:
+            entry.async_create_background_task(
+                hass, _resume_operation(plan), "ambient_music_resume_operation"
+            )
+
+    entry.async_on_unload(async_at_started(hass, _resume_interrupted))
+
+    # Always created (possibly empty) so schedules added later apply without a reload.
+    scheduler = ScheduleEngine(hass, _schedule_windows(entry.options))
+    data.scheduler = scheduler
+    entry.async_on_unload(scheduler.async_stop)
+
+    async def _timed_forward(platform: str) -> None:
+        started = time.perf_counter()
+        await hass.config_entries.async_forward_entry_setups(entry, [platform])
+        data.setup_timings[f"platform.{platform}"] = _elapsed_ms(started)
+
+    # Platforms still set up concurrently; each is timed on its own.
+    await asyncio.gather(*(_timed_forward(platform) for platform in PLATFORMS))
+    data.setup_timings["total"] = _elapsed_ms(setup_started)
+    _LOGGER.debug("Setup timings (ms): %s", data.setup_timings)
+
+    async def _start_scheduler(_hass: HomeAssistant) -> None:
+        await scheduler.async_start()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(async_at_started(hass, _start_scheduler))
+
+    async def _recheck_playlists(_hass: HomeAssistant) -> None:
+        entry.async_create_background_task(
+            hass, _async_recheck_playlists(hass, entry), "ambient_music_recheck_playlists"
+        )
+
+    entry.async_on_unload(async_at_started(hass, _recheck_playlists))
     return True
 
+async def _async_recheck_playlists(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Re-validate stored playlist records once, off the setup path, in a single options write.
+
+    Records whose provider does not match their ID (hand-edited options) get a corrected
+    provider and URI; ambiguous guesses, including those flagged by the version 1
+    migration, are logged so the playlist can be re-entered as a URL.
+    """
+    playlists = dict(entry.options.get(CONF_PLAYLISTS) or {})
+    changed = False
+    for name, record in playlists.items():
+        repaired, others = repair_playlist_record(record)
+        if others:
+            _LOGGER.warning(
+                "Playlist '%s' has an ID valid for %s; assumed %s. Re-enter it as a URL "
+                "to pick the provider explicitly",
+                name,
+                ", ".join([repaired["provider"], *others]),
+                repaired["provider"],
+            )
+        if repaired != record:
+            playlists[name] = repaired
+            changed = True
+    if changed:
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_PLAYLISTS: playlists}
+        )
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+def _async_cleanup_orphan_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Remove this entry's registry entries for deleted playlists and retired entities.
+
+    Only the entry's own registrations are scanned, through the registry's
+    per-config-entry index, rather than every entity in Home Assistant.
+    """
+    ent_reg = er.async_get(hass)
+    valid_playlist_ids = {
+        playlist_sensor_unique_id(name) for name in entry.options.get(CONF_PLAYLISTS, {}) or {}
+    }
+    for reg_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+        unique_id = reg_entry.unique_id or ""
+        if unique_id in _RETIRED_UNIQUE_IDS or (
+            reg_entry.domain == "binary_sensor"
+            and unique_id.startswith("ambient_music_")
+            and unique_id.endswith("_enabled")
+            and unique_id not in valid_playlist_ids
+        ):
+            _LOGGER.debug("Removing orphaned entity registry entry: %s", reg_entry.entity_id)
+            ent_reg.async_remove(reg_entry.entity_id)
+
+def _schedule_windows(options) -> list[ScheduleWindow]:
+    """Return the valid schedule windows stored in *options*."""
+    return [
+        window
+        for raw in options.get(CONF_SCHEDULES, []) or []
+        if (window := ScheduleWindow.from_option(raw)) is not None
+    ]
+
+def _trigger_rules(options) -> list[TriggerRule]:
+    """Return the valid trigger rules stored in *options*, or the defaults if never edited."""
+    raw_rules = options.get(CONF_TRIGGERS)
+    if raw_rules is None:
+        raw_rules = DEFAULT_TRIGGERS
+    return [
+        rule
+        for raw in raw_rules or []
+        if (rule := TriggerRule.from_option(raw)) is not None
+    ]
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the runtime state file of a removed config entry."""
+    await RuntimeStore(hass, entry.entry_id).async_remove()
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload all platforms for this config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    """Unload all platforms for this config entry and drop its runtime data."""
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    return unloaded
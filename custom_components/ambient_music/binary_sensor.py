@@ -6,21 +6,28 @@ from datetime import timedelta
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_util
 
+from .blockers import Blocker, compile_blocker
 from .const import (
     CONF_PLAYLISTS, DEVICE_INFO,
-    CONF_BLOCKERS, BLOCKER_NAME, BLOCKER_TYPE, BLOCKER_INVERT,
-    BLOCKER_ENTITY_ID, BLOCKER_STATE, BLOCKER_TEMPLATE
+    CONF_BLOCKERS, BLOCKER_NAME, BLOCKER_TYPE, BLOCKER_INVERT, SIGNAL_OPTIONS_UPDATED
 )
 
 SELECT_ENTITY_ID = "select.ambient_music_playlists"
 MASTER_SWITCH_ENTITY_ID = "switch.ambient_music_master_enable"
+# Template blockers have no precise trigger, so they are re-rendered this often.
+TEMPLATE_POLL_SECONDS = 10
 
 def _slugify_playlist(playlist_name: str) -> str:
     """Convert a playlist display name to a lowercase alphanumeric slug."""
@@ -30,20 +37,14 @@ def _slugify_playlist(playlist_name: str) -> str:
     return slug
 
 
-def _get_playlist_names(entry: ConfigEntry) -> list[str]:
-    """Return the list of playlist display names from the config entry options."""
-    raw = entry.options.get(CONF_PLAYLISTS, {})
-    if not isinstance(raw, dict):
-        return []
-    return list(raw.keys())
+def playlist_sensor_unique_id(playlist_name: str) -> str:
+    """Return the unique ID of a playlist's enabled sensor."""
+    return f"ambient_music_{_slugify_playlist(playlist_name)}_enabled"
 
 
-def _to_bool(val) -> bool:
-    """Coerce common truthy string representations to bool."""
-    if isinstance(val, bool):
-        return val
-    s = str(val).strip().lower()
-    return s in ("1", "true", "on", "yes", "y", "enabled")
+def _get_playlist_names(entry: ConfigEntry) -> list[str]:
+    """Return the list of playlist display names from the config entry options."""
+    return list(entry.options.get(CONF_PLAYLISTS) or {})
 
 
 class PlaylistEnabledSensor(BinarySensorEntity, RestoreEntity):
@@ -57,7 +58,7 @@ class PlaylistEnabledSensor(BinarySensorEntity, RestoreEntity):
         self.hass = hass
         self._playlist_name = playlist_name
         self._attr_name = f"Ambient Music {playlist_name} Enabled"
-        self._attr_unique_id = f"ambient_music_{_slugify_playlist(playlist_name)}_enabled"
+        self._attr_unique_id = playlist_sensor_unique_id(playlist_name)
         self._attr_is_on = None
 
     async def async_added_to_hass(self) -> None:
@@ -67,7 +68,9 @@ class PlaylistEnabledSensor(BinarySensorEntity, RestoreEntity):
         if last and last.state in ("on", "off"):
             self._attr_is_on = (last.state == "on")
 
-        async_track_state_change_event(self.hass, SELECT_ENTITY_ID, self._handle_select_change)
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, SELECT_ENTITY_ID, self._handle_select_change)
+        )
 
         self._evaluate_and_maybe_write()
 
@@ -100,14 +103,15 @@ class BlockersClear(BinarySensorEntity, RestoreEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "blockers_clear"
     _attr_unique_id = "ambient_music_blockers_clear"
+    # Per-blocker results are kept out of the recorder; list_blockers returns them.
+    _unrecorded_attributes = frozenset({"blockers"})
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         self.hass = hass
         self._entry = entry
-        self._blockers: list[dict] = []
-        self._listened_entities: set[str] = set()
+        self._blockers: list[tuple[dict, Blocker | None]] = []
         self._unsubs: list = []
-        self._interval_added = False
+        self._listen_key: tuple | None = None
         self._attr_is_on = None
         self._attr_extra_state_attributes = None
 
@@ -125,86 +129,85 @@ class BlockersClear(BinarySensorEntity, RestoreEntity):
             if last.attributes:
                 self._attr_extra_state_attributes = dict(last.attributes)
 
-        await self._refresh_blockers_and_listeners()
+        self._refresh_blockers_and_listeners()
         self._evaluate_and_maybe_write()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self._handle_options_updated,
+            )
+        )
+
+    @callback
+    def _handle_options_updated(self, changed: set[str]) -> None:
+        """Recompile blockers; listeners are only rebuilt if what they watch changed."""
+        if CONF_BLOCKERS in changed:
+            self._refresh_blockers_and_listeners()
+            self._evaluate_and_maybe_write()
 
     async def async_will_remove_from_hass(self) -> None:
+        self._unsubscribe()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _unsubscribe(self) -> None:
         for u in self._unsubs:
             u()
         self._unsubs.clear()
-        self._listened_entities.clear()
-        await super().async_will_remove_from_hass()
+        self._listen_key = None
 
-    async def _refresh_blockers_and_listeners(self) -> None:
-        """Re-read blockers from options and rebuild state-change subscriptions if the entity set changed."""
+    @callback
+    def _refresh_blockers_and_listeners(self) -> None:
+        """
+        Recompile blockers from options and subscribe to exactly what can change them.
+
+        State, numeric and attribute blockers listen to their entity, time windows get a
+        time trigger at each edge, and only template blockers need the periodic poll.
+        """
         blockers = self._entry.options.get(CONF_BLOCKERS, [])
         if not isinstance(blockers, list):
             blockers = []
-        self._blockers = blockers
-
-        new_entities: set[str] = set()
-        for blk in blockers:
-            if blk.get(BLOCKER_TYPE) == "state":
-                ent = blk.get(BLOCKER_ENTITY_ID)
-                if ent:
-                    new_entities.add(str(ent))
-        new_entities.add(MASTER_SWITCH_ENTITY_ID)
-
-        if new_entities != self._listened_entities:
-            for u in self._unsubs:
-                u()
-            self._unsubs.clear()
-            self._listened_entities = set()
-
-            for ent in new_entities:
-                self._unsubs.append(
-                    async_track_state_change_event(self.hass, ent, self._handle_change)
-                )
-            self._listened_entities = new_entities
+        self._blockers = [(blk, compile_blocker(self.hass, blk)) for blk in blockers]
+        compiled = [b for _, b in self._blockers if b is not None]
+
+        entities = frozenset({MASTER_SWITCH_ENTITY_ID}).union(*(b.entities for b in compiled))
+        times = frozenset().union(*(b.times for b in compiled))
+        polled = any(b.polled for b in compiled)
+        key = (entities, times, polled)
+        if key == self._listen_key:
+            return
 
-            if not self._interval_added:
-                self._unsubs.append(
-                    async_track_time_interval(self.hass, self._handle_interval, timedelta(seconds=10))
+        self._unsubscribe()
+        self._unsubs.append(
+            async_track_state_change_event(self.hass, list(entities), self._handle_change)
+        )
+        for t in times:
+            self._unsubs.append(
+                async_track_time_change(
+                    self.hass,
+                    self._handle_time,
+                    hour=t // 3600,
+                    minute=t // 60 % 60,
+                    second=t % 60,
                 )
-                self._interval_added = True
+            )
+        if polled:
+            self._unsubs.append(
+                async_track_time_interval(
+                    self.hass, self._handle_time, timedelta(seconds=TEMPLATE_POLL_SECONDS)
+                )
+            )
+        self._listen_key = key
 
     @callback
     def _handle_change(self, _event) -> None:
-        self.hass.async_create_task(self._async_refresh_and_eval())
+        self._evaluate_and_maybe_write()
 
     @callback
-    def _handle_interval(self, _now) -> None:
-        self.hass.async_create_task(self._async_refresh_and_eval())
-
-    async def _async_refresh_and_eval(self) -> None:
-        await self._refresh_blockers_and_listeners()
+    def _handle_time(self, _now) -> None:
         self._evaluate_and_maybe_write()
 
-    def _eval_blocker(self, blk: dict) -> bool:
-        """
-        Evaluate a single blocker condition.
-
-        :param blk: Blocker dict with type, entity_id/template, state, and invert keys.
-        :return: True if the blocker is passing (not blocking playback).
-        """
-        try:
-            if blk.get(BLOCKER_TYPE) == "state":
-                ent = blk.get(BLOCKER_ENTITY_ID)
-                target = blk.get(BLOCKER_STATE, "")
-                st = self.hass.states.get(ent)
-                cond_ok = (st is not None) and (str(st.state) == str(target))
-            else:
-                tpl_text = blk.get(BLOCKER_TEMPLATE, "")
-                tpl = Template(tpl_text, self.hass)
-                res = tpl.async_render(variables={})
-                cond_ok = _to_bool(res)
-
-            invert = bool(blk.get(BLOCKER_INVERT, False))
-            passed = cond_ok if invert else not cond_ok
-            return passed
-        except Exception:
-            return False
-
     @callback
     def _evaluate_and_maybe_write(self) -> None:
         """Re-evaluate all blockers and the master switch; write state only if something changed."""
@@ -221,8 +224,10 @@ class BlockersClear(BinarySensorEntity, RestoreEntity):
 
         all_ok = master_ok
 
-        for blk in self._blockers:
-            passed = self._eval_blocker(blk)
+        now = dt_util.now()
+        for blk, blocker in self._blockers:
+            # A malformed blocker blocks, so a broken option cannot silently allow playback.
+            passed = blocker.passed(self.hass, now) if blocker is not None else False
             results.append({
                 "name": blk.get(BLOCKER_NAME, ""),
                 "type": blk.get(BLOCKER_TYPE, ""),
@@ -251,22 +256,31 @@ class BlockersClear(BinarySensorEntity, RestoreEntity):
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    """Create per-playlist enabled sensors and the blockers-clear sensor, pruning orphans first."""
+    """Create per-playlist enabled sensors and the blockers-clear sensor."""
     playlists = _get_playlist_names(entry)
-
-    # Remove orphaned playlist-enabled sensors whose playlists no longer exist in config
     ent_reg = er.async_get(hass)
-    valid_slugs = {_slugify_playlist(p) for p in playlists}
-    for entity_id, entity_entry in list(ent_reg.entities.items()):
-        if (
-            entity_entry.domain == "binary_sensor"
-            and entity_entry.unique_id.startswith("ambient_music_")
-            and entity_entry.unique_id.endswith("_enabled")
-        ):
-            slug = entity_entry.unique_id[len("ambient_music_"):-len("_enabled")]
-            if slug not in valid_slugs:
-                ent_reg.async_remove(entity_id)
 
-    sensors = [PlaylistEnabledSensor(hass, name) for name in playlists]
-    sensors.append(BlockersClear(hass, entry))
-    async_add_entities(sensors, True)
+    playlist_sensors = {name: PlaylistEnabledSensor(hass, name) for name in playlists}
+    async_add_entities([*playlist_sensors.values(), BlockersClear(hass, entry)], True)
+
+    async def _handle_options_updated(changed: set[str]) -> None:
+        """Add sensors for new playlists and remove those of deleted ones, leaving the rest."""
+        if CONF_PLAYLISTS not in changed:
+            return
+        names = _get_playlist_names(entry)
+        for name in [n for n in playlist_sensors if n not in names]:
+            sensor = playlist_sensors.pop(name)
+            entity_id = sensor.entity_id
+            await sensor.async_remove()
+            if entity_id and ent_reg.async_get(entity_id):
+                ent_reg.async_remove(entity_id)
+        added = [PlaylistEnabledSensor(hass, n) for n in names if n not in playlist_sensors]
+        playlist_sensors.update((sensor._playlist_name, sensor) for sensor in added)
+        if added:
+            async_add_entities(added, True)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id), _handle_options_updated
+        )
+    )
@@ -0,0 +1,238 @@
+"""Blocker predicates — stored blocker options compiled into objects the sensor evaluates."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+
+from .const import (
+    BLOCKER_ABOVE,
+    BLOCKER_AFTER,
+    BLOCKER_ATTRIBUTE,
+    BLOCKER_BEFORE,
+    BLOCKER_BELOW,
+    BLOCKER_ENTITY_ID,
+    BLOCKER_INVERT,
+    BLOCKER_NAME,
+    BLOCKER_STATE,
+    BLOCKER_TEMPLATE,
+    BLOCKER_TYPE,
+    BLOCKER_VALUE,
+)
+from .scheduler import parse_time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _to_bool(val) -> bool:
+    """Coerce common truthy string representations to bool."""
+    if isinstance(val, bool):
+        return val
+    s = str(val).strip().lower()
+    return s in ("1", "true", "on", "yes", "y", "enabled")
+
+
+def _to_float(val) -> float | None:
+    """Return *val* as a float, or None if it is empty or not numeric."""
+    if val is None or val == "":
+        return None
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class Blocker:
+    """
+    Base class of a compiled blocker.
+
+    Subclasses implement :meth:`active` and declare what can change their result: the
+    entities to listen to, the local times of day at which it flips, or that it must be
+    polled.  The sensor subscribes to exactly those.
+
+    :param name: Display name.
+    :param invert: Block while the condition is false instead of while it is true.
+    """
+
+    name: str
+    invert: bool
+
+    kind = ""
+    polled = False
+
+    @property
+    def entities(self) -> frozenset[str]:
+        """Entities whose state changes can change the result."""
+        return frozenset()
+
+    @property
+    def times(self) -> frozenset[int]:
+        """Seconds since local midnight at which the result can change."""
+        return frozenset()
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        """Return True if the blocker's condition currently holds."""
+        raise NotImplementedError
+
+    def passed(self, hass: HomeAssistant, now: datetime) -> bool:
+        """Return True if the blocker is passing (not blocking playback); errors block."""
+        try:
+            cond_ok = self.active(hass, now)
+        except Exception:  # noqa: BLE001 - a broken blocker blocks rather than raising
+            _LOGGER.debug("Blocker %s failed to evaluate", self.name, exc_info=True)
+            return False
+        return cond_ok if self.invert else not cond_ok
+
+
+@dataclass(frozen=True)
+class StateBlocker(Blocker):
+    """Blocks while *entity_id* is in *state*."""
+
+    entity_id: str = ""
+    state: str = ""
+
+    kind = "state"
+
+    @property
+    def entities(self) -> frozenset[str]:
+        return frozenset({self.entity_id})
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        st = hass.states.get(self.entity_id)
+        return st is not None and str(st.state) == self.state
+
+
+@dataclass(frozen=True)
+class NumericBlocker(Blocker):
+    """
+    Blocks while the state (or *attribute*) of *entity_id* is above and/or below a bound.
+
+    With both bounds the value must lie strictly between them; a non-numeric value never
+    blocks, as in Home Assistant's numeric_state condition.
+    """
+
+    entity_id: str = ""
+    attribute: str | None = None
+    above: float | None = None
+    below: float | None = None
+
+    kind = "numeric"
+
+    @property
+    def entities(self) -> frozenset[str]:
+        return frozenset({self.entity_id})
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        st = hass.states.get(self.entity_id)
+        if st is None:
+            return False
+        value = _to_float(st.attributes.get(self.attribute) if self.attribute else st.state)
+        if value is None:
+            return False
+        if self.above is not None and not value > self.above:
+            return False
+        return self.below is None or value < self.below
+
+
+@dataclass(frozen=True)
+class TimeWindowBlocker(Blocker):
+    """Blocks from *after* until *before* (seconds since local midnight), across midnight."""
+
+    after: int = 0
+    before: int = 0
+
+    kind = "time"
+
+    @property
+    def times(self) -> frozenset[int]:
+        return frozenset({self.after, self.before})
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        t = now.hour * 3600 + now.minute * 60 + now.second
+        if self.after < self.before:
+            return self.after <= t < self.before
+        return t >= self.after or t < self.before
+
+
+@dataclass(frozen=True)
+class AttributeBlocker(Blocker):
+    """Blocks while *attribute* of *entity_id* equals *value*, or is set when *value* is None."""
+
+    entity_id: str = ""
+    attribute: str = ""
+    value: str | None = None
+
+    kind = "attribute"
+
+    @property
+    def entities(self) -> frozenset[str]:
+        return frozenset({self.entity_id})
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        st = hass.states.get(self.entity_id)
+        if st is None:
+            return False
+        current = st.attributes.get(self.attribute)
+        if self.value is None:
+            return current not in (None, "", [], {})
+        return current is not None and str(current) == self.value
+
+
+@dataclass(frozen=True)
+class TemplateBlocker(Blocker):
+    """Blocks while *template* renders truthy; the sensor polls these."""
+
+    template: Template | None = None
+
+    kind = "template"
+    polled = True
+
+    def active(self, hass: HomeAssistant, now: datetime) -> bool:
+        return _to_bool(self.template.async_render(variables={}, parse_result=False))
+
+
+def compile_blocker(hass: HomeAssistant, raw: dict) -> Blocker | None:
+    """
+    Build the blocker for a stored options dict.
+
+    :param hass: Home Assistant instance (templates are bound to it).
+    :param raw: Blocker dict from the ``blockers`` option.
+    :return: The compiled blocker, or None if *raw* is malformed.
+    """
+    btype = raw.get(BLOCKER_TYPE)
+    name = str(raw.get(BLOCKER_NAME, ""))
+    invert = bool(raw.get(BLOCKER_INVERT, False))
+    entity_id = str(raw.get(BLOCKER_ENTITY_ID) or "")
+
+    if btype == "state":
+        if not entity_id:
+            return None
+        return StateBlocker(name, invert, entity_id, str(raw.get(BLOCKER_STATE, "")))
+    if btype == "numeric":
+        above = _to_float(raw.get(BLOCKER_ABOVE))
+        below = _to_float(raw.get(BLOCKER_BELOW))
+        if not entity_id or (above is None and below is None):
+            return None
+        attribute = str(raw.get(BLOCKER_ATTRIBUTE) or "") or None
+        return NumericBlocker(name, invert, entity_id, attribute, above, below)
+    if btype == "time":
+        after = parse_time(raw.get(BLOCKER_AFTER))
+        before = parse_time(raw.get(BLOCKER_BEFORE))
+        if after is None or before is None or after == before:
+            return None
+        return TimeWindowBlocker(name, invert, after, before)
+    if btype == "attribute":
+        attribute = str(raw.get(BLOCKER_ATTRIBUTE) or "")
+        if not entity_id or not attribute:
+            return None
+        value = str(raw.get(BLOCKER_VALUE) or "") or None
+        return AttributeBlocker(name, invert, entity_id, attribute, value)
+    if btype == "template":
+        text = str(raw.get(BLOCKER_TEMPLATE) or "")
+        if not text:
+            return None
+        return TemplateBlocker(name, invert, Template(text, hass))
+    return None
@@ -1,5 +1,6 @@
 """Config and options flows for Ambient Music — playlist, blocker, and media-player management."""
 
+import logging
 import uuid
 import voluptuous as vol
 from homeassistant import config_entries
@@ -14,6 +15,11 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
     BooleanSelector,
     BooleanSelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    TimeSelector,
+    TimeSelectorConfig,
 )
 
 from .const import (
@@ -22,6 +28,10 @@ from .const import (
     CONF_PLAYLISTS,
     CONF_BLOCKERS,
     CONF_PLAYLIST_RADIO_MODE,
+    CONF_PLAYLIST_PROVIDER,
+    CONF_DIRECT_TRANSPORT,
+    CONF_TRANSPORT_URL,
+    CONF_SCHEDULES,
     BLOCKER_ID,
     BLOCKER_NAME,
     BLOCKER_TYPE,
@@ -29,40 +39,54 @@ from .const import (
     BLOCKER_ENTITY_ID,
     BLOCKER_STATE,
     BLOCKER_TEMPLATE,
+    BLOCKER_ATTRIBUTE,
+    BLOCKER_ABOVE,
+    BLOCKER_BELOW,
+    BLOCKER_AFTER,
+    BLOCKER_BEFORE,
+    BLOCKER_VALUE,
+    BLOCKER_TYPES,
+    SCHEDULE_ID,
+    SCHEDULE_NAME,
+    SCHEDULE_DAYS,
+    SCHEDULE_START,
+    SCHEDULE_END,
+    SCHEDULE_PLAYLIST,
+    SCHEDULE_VOLUME,
+    SCHEDULE_ENABLED,
+    SCHEDULE_PRIORITY,
+    CONF_TRIGGERS,
+    DEFAULT_TRIGGERS,
+    TRIGGER_ACTION,
+    TRIGGER_ACTIONS,
+    TRIGGER_AT,
+    TRIGGER_DAYS,
+    TRIGGER_EVENT,
+    TRIGGER_EVENT_TIME,
+    TRIGGER_ID,
+    TRIGGER_NAME,
+    WEEKDAYS,
 )
 
 from .const import CONF_PLAYLIST_ID as CONF_ID
-from .providers import parse_playlist_input
+from .playlist_import import rows_from_file, rows_from_text, validate_rows
+from .providers import build_playlist_record, parse_playlist_input
+from .scheduler import parse_time
+
+_LOGGER = logging.getLogger(__name__)
+
+_IMPORT_ERRORS_SHOWN: int = 20
+_LIBRARY_PAGE_SIZE: int = 500
+_LIBRARY_MAX_ITEMS: int = 5000
 
 
 def _get_players_and_map(hass: HomeAssistant, entry: config_entries.ConfigEntry):
-    """Return (players_list, normalised_playlist_map) from the config entry options."""
+    """Return (players_list, {name: playlist record}) from the config entry options."""
     opts = entry.options or {}
     players = list(opts.get(CONF_MEDIA_PLAYERS, []) or [])
-    raw_playlist_map = dict(opts.get(CONF_PLAYLISTS, {}) or {})
-    
-    playlist_map = {}
-    for k, v in raw_playlist_map.items():
-        if isinstance(v, dict):
-            playlist_map[str(k)] = v
-        else:
-            playlist_map[str(k)] = {"id": str(v), CONF_PLAYLIST_RADIO_MODE: False}
-    
+    playlist_map = dict(opts.get(CONF_PLAYLISTS, {}) or {})
     return players, playlist_map
 
-def _playlist_to_id(playlist_data) -> str:
-    """Extract the raw playlist ID string from either a dict or legacy scalar value."""
-    if isinstance(playlist_data, dict):
-        return playlist_data.get("id", "")
-    return str(playlist_data) if playlist_data else ""
-
-
-def _playlist_to_radio_mode(playlist_data) -> bool:
-    """Extract the radio-mode flag from a playlist data dict."""
-    if isinstance(playlist_data, dict):
-        return bool(playlist_data.get(CONF_PLAYLIST_RADIO_MODE, False))
-    return False
-
 
 def _get_blockers(entry: config_entries.ConfigEntry) -> list[dict]:
     """Return a deep copy of the blocker list from the config entry options."""
@@ -126,11 +150,11 @@ def _find_blocker(blockers: list[dict], name: str) -> dict | None:
     return None
 
 def _blocker_type_schema(default_type: str | None = None) -> vol.Schema:
-    """Build the form schema for selecting a blocker type (state or template)."""
+    """Build the form schema for selecting a blocker type."""
     return vol.Schema({
         vol.Required(BLOCKER_TYPE, default=default_type or "state"): SelectSelector(
             SelectSelectorConfig(
-                options=["state", "template"],
+                options=BLOCKER_TYPES,
                 multiple=False,
                 custom_value=False,
             )
@@ -158,10 +182,255 @@ def _add_blocker_template_schema(name: str = "", template_text: str = "", invert
         vol.Required(BLOCKER_INVERT, default=invert): BooleanSelector(BooleanSelectorConfig()),
     })
 
+def _add_blocker_numeric_schema(
+    name: str = "",
+    entity_id: str = "",
+    attribute: str = "",
+    above: float | None = None,
+    below: float | None = None,
+    invert: bool = False,
+) -> vol.Schema:
+    """Build the form schema for adding/editing a numeric above/below blocker."""
+    return vol.Schema({
+        vol.Required(BLOCKER_NAME, default=name): TextSelector(TextSelectorConfig(multiline=False)),
+        vol.Required(BLOCKER_ENTITY_ID, default=entity_id): EntitySelector(
+            EntitySelectorConfig(multiple=False)
+        ),
+        vol.Optional(BLOCKER_ATTRIBUTE, default=attribute): TextSelector(
+            TextSelectorConfig(multiline=False)
+        ),
+        vol.Optional(BLOCKER_ABOVE, description={"suggested_value": above}): NumberSelector(
+            NumberSelectorConfig(step="any", mode=NumberSelectorMode.BOX)
+        ),
+        vol.Optional(BLOCKER_BELOW, description={"suggested_value": below}): NumberSelector(
+            NumberSelectorConfig(step="any", mode=NumberSelectorMode.BOX)
+        ),
+        vol.Required(BLOCKER_INVERT, default=invert): BooleanSelector(BooleanSelectorConfig()),
+    })
+
+def _add_blocker_time_schema(
+    name: str = "", after: str = "22:00:00", before: str = "07:00:00", invert: bool = False
+) -> vol.Schema:
+    """Build the form schema for adding/editing a time-window blocker."""
+    return vol.Schema({
+        vol.Required(BLOCKER_NAME, default=name): TextSelector(TextSelectorConfig(multiline=False)),
+        vol.Required(BLOCKER_AFTER, default=after): TimeSelector(TimeSelectorConfig()),
+        vol.Required(BLOCKER_BEFORE, default=before): TimeSelector(TimeSelectorConfig()),
+        vol.Required(BLOCKER_INVERT, default=invert): BooleanSelector(BooleanSelectorConfig()),
+    })
+
+def _add_blocker_attribute_schema(
+    name: str = "", entity_id: str = "", attribute: str = "", value: str = "", invert: bool = False
+) -> vol.Schema:
+    """Build the form schema for adding/editing an attribute blocker."""
+    return vol.Schema({
+        vol.Required(BLOCKER_NAME, default=name): TextSelector(TextSelectorConfig(multiline=False)),
+        vol.Required(BLOCKER_ENTITY_ID, default=entity_id): EntitySelector(
+            EntitySelectorConfig(multiple=False)
+        ),
+        vol.Required(BLOCKER_ATTRIBUTE, default=attribute): TextSelector(
+            TextSelectorConfig(multiline=False)
+        ),
+        vol.Optional(BLOCKER_VALUE, default=value): TextSelector(
+            TextSelectorConfig(multiline=False)
+        ),
+        vol.Required(BLOCKER_INVERT, default=invert): BooleanSelector(BooleanSelectorConfig()),
+    })
+
+def _blocker_schema(btype: str, blk: dict | None = None) -> vol.Schema:
+    """Build the add/edit form schema for a blocker of *btype*, pre-filled from *blk*."""
+    blk = blk or {}
+    name = blk.get(BLOCKER_NAME, "")
+    invert = bool(blk.get(BLOCKER_INVERT, False))
+    if btype == "state":
+        return _add_blocker_state_schema(
+            name, blk.get(BLOCKER_ENTITY_ID, ""), blk.get(BLOCKER_STATE, ""), invert
+        )
+    if btype == "numeric":
+        return _add_blocker_numeric_schema(
+            name,
+            blk.get(BLOCKER_ENTITY_ID, ""),
+            blk.get(BLOCKER_ATTRIBUTE, ""),
+            blk.get(BLOCKER_ABOVE),
+            blk.get(BLOCKER_BELOW),
+            invert,
+        )
+    if btype == "time":
+        return _add_blocker_time_schema(
+            name, blk.get(BLOCKER_AFTER, "22:00:00"), blk.get(BLOCKER_BEFORE, "07:00:00"), invert
+        )
+    if btype == "attribute":
+        return _add_blocker_attribute_schema(
+            name,
+            blk.get(BLOCKER_ENTITY_ID, ""),
+            blk.get(BLOCKER_ATTRIBUTE, ""),
+            blk.get(BLOCKER_VALUE, ""),
+            invert,
+        )
+    return _add_blocker_template_schema(name, blk.get(BLOCKER_TEMPLATE, ""), invert)
+
+def _blocker_fields(btype: str, user_input: dict) -> tuple[dict, dict]:
+    """
+    Validate the type-specific fields of a blocker form.
+
+    :param btype: Blocker type.
+    :param user_input: Submitted form data.
+    :return: The fields to store (including invert) and a dict of form errors.
+    """
+    errors: dict[str, str] = {}
+    fields: dict = {BLOCKER_INVERT: bool(user_input.get(BLOCKER_INVERT, False))}
+
+    if btype in ("state", "numeric", "attribute"):
+        fields[BLOCKER_ENTITY_ID] = str(user_input.get(BLOCKER_ENTITY_ID) or "").strip()
+        if not fields[BLOCKER_ENTITY_ID]:
+            errors[BLOCKER_ENTITY_ID] = "required"
+
+    if btype == "state":
+        fields[BLOCKER_STATE] = str(user_input.get(BLOCKER_STATE) or "").strip()
+        if not fields[BLOCKER_STATE]:
+            errors[BLOCKER_STATE] = "required"
+    elif btype == "numeric":
+        above = user_input.get(BLOCKER_ABOVE)
+        below = user_input.get(BLOCKER_BELOW)
+        fields[BLOCKER_ATTRIBUTE] = str(user_input.get(BLOCKER_ATTRIBUTE) or "").strip()
+        fields[BLOCKER_ABOVE] = float(above) if above is not None else None
+        fields[BLOCKER_BELOW] = float(below) if below is not None else None
+        if above is None and below is None:
+            errors["base"] = "numeric_bound_required"
+        elif above is not None and below is not None and float(above) >= float(below):
+            errors["base"] = "invalid_numeric_range"
+    elif btype == "time":
+        fields[BLOCKER_AFTER] = str(user_input.get(BLOCKER_AFTER) or "")
+        fields[BLOCKER_BEFORE] = str(user_input.get(BLOCKER_BEFORE) or "")
+        after = parse_time(fields[BLOCKER_AFTER])
+        before = parse_time(fields[BLOCKER_BEFORE])
+        if after is None or before is None or after == before:
+            errors["base"] = "invalid_time_window"
+    elif btype == "attribute":
+        fields[BLOCKER_ATTRIBUTE] = str(user_input.get(BLOCKER_ATTRIBUTE) or "").strip()
+        fields[BLOCKER_VALUE] = str(user_input.get(BLOCKER_VALUE) or "").strip()
+        if not fields[BLOCKER_ATTRIBUTE]:
+            errors[BLOCKER_ATTRIBUTE] = "required"
+    else:
+        fields[BLOCKER_TEMPLATE] = str(user_input.get(BLOCKER_TEMPLATE) or "").strip()
+        if not fields[BLOCKER_TEMPLATE]:
+            errors[BLOCKER_TEMPLATE] = "required"
+
+    return fields, errors
+
+def _import_options_schema(schema: dict) -> vol.Schema:
+    """Append the radio-mode default and skip-invalid toggles shared by every import form."""
+    return vol.Schema({
+        **schema,
+        vol.Required(CONF_PLAYLIST_RADIO_MODE, default=False): BooleanSelector(
+            BooleanSelectorConfig()
+        ),
+        vol.Required("skip_invalid", default=False): BooleanSelector(BooleanSelectorConfig()),
+    })
+
+def _import_paste_schema(lines: str = "") -> vol.Schema:
+    """Build the paste-import form: one "name, ID or URL[, radio]" per line."""
+    return _import_options_schema({
+        vol.Required("lines", default=lines): TextSelector(TextSelectorConfig(multiline=True)),
+    })
+
+def _import_file_schema(path: str = "") -> vol.Schema:
+    """Build the file-import form (path to a CSV or JSON file on the Home Assistant host)."""
+    return _import_options_schema({
+        vol.Required("path", default=path): TextSelector(TextSelectorConfig(multiline=False)),
+    })
+
+def _import_library_schema(names: list[str]) -> vol.Schema:
+    """Build the library-import form listing Music Assistant playlists not yet configured."""
+    return _import_options_schema({
+        vol.Required("playlists", default=[]): SelectSelector(
+            SelectSelectorConfig(options=names, multiple=True, custom_value=False)
+        ),
+    })
+
+def _format_import_errors(errors: list[str]) -> str:
+    """Render per-line import errors for the form description, truncating long lists."""
+    shown = errors[:_IMPORT_ERRORS_SHOWN]
+    if len(errors) > len(shown):
+        shown.append(f"…and {len(errors) - len(shown)} more")
+    return "\n".join(f"- {line}" for line in shown)
+
+def _get_schedules(entry: config_entries.ConfigEntry) -> list[dict]:
+    """Return a deep copy of the schedule window list from the config entry options."""
+    ls = entry.options.get(CONF_SCHEDULES, [])
+    return deepcopy(ls) if isinstance(ls, list) else []
+
+def _schedule_schema(
+    playlist_names: list[str],
+    name: str = "",
+    days: list[str] | None = None,
+    start: str = "22:00:00",
+    end: str = "07:00:00",
+    enabled: str = "unchanged",
+    priority: float = 0,
+) -> vol.Schema:
+    """Build the form schema for adding a schedule window."""
+    default_days = days if days is not None else list(WEEKDAYS)
+    schema = {
+        vol.Required(SCHEDULE_NAME, default=name): TextSelector(
+            TextSelectorConfig(multiline=False)
+        ),
+        vol.Required(SCHEDULE_DAYS, default=default_days): SelectSelector(
+            SelectSelectorConfig(options=WEEKDAYS, multiple=True, custom_value=False)
+        ),
+        vol.Required(SCHEDULE_START, default=start): TimeSelector(TimeSelectorConfig()),
+        vol.Required(SCHEDULE_END, default=end): TimeSelector(TimeSelectorConfig()),
+    }
+    if playlist_names:
+        schema[vol.Optional(SCHEDULE_PLAYLIST)] = SelectSelector(
+            SelectSelectorConfig(options=playlist_names, multiple=False, custom_value=False)
+        )
+    schema[vol.Optional(SCHEDULE_VOLUME)] = NumberSelector(
+        NumberSelectorConfig(min=0, max=1, step=0.01, mode=NumberSelectorMode.SLIDER)
+    )
+    schema[vol.Required(SCHEDULE_ENABLED, default=enabled)] = SelectSelector(
+        SelectSelectorConfig(options=["unchanged", "on", "off"], multiple=False, custom_value=False)
+    )
+    schema[vol.Required(SCHEDULE_PRIORITY, default=priority)] = NumberSelector(
+        NumberSelectorConfig(min=0, max=100, step=1, mode=NumberSelectorMode.BOX)
+    )
+    return vol.Schema(schema)
+
+def _get_triggers(entry: config_entries.ConfigEntry) -> list[dict]:
+    """Return a deep copy of the trigger rules from the options, or the defaults if unset."""
+    ls = entry.options.get(CONF_TRIGGERS)
+    if ls is None:
+        ls = DEFAULT_TRIGGERS
+    return deepcopy(ls) if isinstance(ls, list) else []
+
+def _trigger_schema(
+    name: str = "",
+    event: str = TRIGGER_EVENT_TIME,
+    action: str = "stop",
+    at: str = "23:00:00",
+    days: list[str] | None = None,
+) -> vol.Schema:
+    """Build the form schema for adding a trigger rule; time and days only apply to time rules."""
+    actions = sorted({a for allowed in TRIGGER_ACTIONS.values() for a in allowed})
+    default_days = days if days is not None else list(WEEKDAYS)
+    return vol.Schema({
+        vol.Required(TRIGGER_NAME, default=name): TextSelector(TextSelectorConfig(multiline=False)),
+        vol.Required(TRIGGER_EVENT, default=event): SelectSelector(
+            SelectSelectorConfig(options=list(TRIGGER_ACTIONS), multiple=False, custom_value=False)
+        ),
+        vol.Required(TRIGGER_ACTION, default=action): SelectSelector(
+            SelectSelectorConfig(options=actions, multiple=False, custom_value=False)
+        ),
+        vol.Optional(TRIGGER_AT, default=at): TimeSelector(TimeSelectorConfig()),
+        vol.Optional(TRIGGER_DAYS, default=default_days): SelectSelector(
+            SelectSelectorConfig(options=WEEKDAYS, multiple=True, custom_value=False)
+        ),
+    })
+
 class AmbientMusicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Single-instance config flow — creates the integration entry with no user input."""
 
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(self, user_input=None):
         await self.async_set_unique_id(DOMAIN)
@@ -179,15 +448,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self._edit_target = None
         self._pending_blocker_type = None
         self._edit_blocker_name = None
+        self._library_playlists: dict[str, str] | None = None
 
     async def async_step_init(self, user_input=None):
         return self.async_show_menu(
             step_id="init",
             menu_options={
                 "add_playlist": "Add Playlist",
+                "import_playlists": "Import Playlists",
                 "manage_blockers": "Manage Blockers",
                 "manage_playlists": "Manage Playlists",
+                "manage_schedules": "Manage Schedules",
+                "manage_triggers": "Manage Triggers",
                 "media_players": "Media Players",
+                "advanced": "Advanced Settings",
                 "get_blueprints": "Get Automation Blueprints",
             },
         )
@@ -209,6 +483,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(user_input[CONF_MEDIA_PLAYERS]),
                 CONF_PLAYLISTS: dict(playlist_map),
                 CONF_BLOCKERS: _get_blockers(self.config_entry),
@@ -224,6 +499,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             }),
         )
 
+    async def async_step_advanced(self, user_input=None):
+        opts = self.config_entry.options or {}
+
+        if user_input is not None:
+            options = {
+                **self.config_entry.options,
+                CONF_DIRECT_TRANSPORT: bool(user_input.get(CONF_DIRECT_TRANSPORT, False)),
+                CONF_TRANSPORT_URL: str(user_input.get(CONF_TRANSPORT_URL, "") or "").strip(),
+            }
+            return self.async_create_entry(title="", data=options)
+
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_DIRECT_TRANSPORT, default=bool(opts.get(CONF_DIRECT_TRANSPORT, False))
+                ): BooleanSelector(BooleanSelectorConfig()),
+                vol.Optional(
+                    CONF_TRANSPORT_URL, default=str(opts.get(CONF_TRANSPORT_URL, "") or "")
+                ): TextSelector(TextSelectorConfig(multiline=False)),
+            }),
+        )
+
     async def async_step_add_playlist(self, user_input=None):
         players, playlist_map = _get_players_and_map(self.hass, self.config_entry)
         blockers = _get_blockers(self.config_entry)
@@ -253,12 +551,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 )
 
             new_map = dict(playlist_map)
-            new_map[name] = {
-                "id": playlist_id,
-                CONF_PLAYLIST_RADIO_MODE: radio_mode,
-            }
+            new_map[name] = build_playlist_record(playlist_id, provider_name, radio_mode)
 
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: players,
                 CONF_PLAYLISTS: new_map,
                 CONF_BLOCKERS: blockers,
@@ -317,6 +613,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             
             players, _ = _get_players_and_map(self.hass, self.config_entry)
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: new_map,
                 CONF_BLOCKERS: _get_blockers(self.config_entry),
@@ -340,8 +637,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         players, playlist_map = _get_players_and_map(self.hass, self.config_entry)
         old_name = self._edit_target or ""
         old_data = playlist_map.get(old_name, {})
-        old_id = _playlist_to_id(old_data)
-        old_radio_mode = _playlist_to_radio_mode(old_data)
+        old_id = old_data.get("id", "")
+        old_radio_mode = bool(old_data.get(CONF_PLAYLIST_RADIO_MODE, False))
 
         if user_input is not None:
             raw = str(user_input.get(CONF_ID, "")).strip()
@@ -361,11 +658,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 )
 
             new_map = dict(playlist_map)
-            new_map[old_name] = {
-                "id": editid,
-                CONF_PLAYLIST_RADIO_MODE: radio_mode,
-            }
+            if editid == old_id and old_data.get(CONF_PLAYLIST_PROVIDER):
+                # A re-submitted bare ID cannot tell Deezer from Qobuz; keep the stored provider.
+                provider_name = old_data[CONF_PLAYLIST_PROVIDER]
+            new_map[old_name] = build_playlist_record(editid, provider_name, radio_mode)
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: new_map,
                 CONF_BLOCKERS: _get_blockers(self.config_entry),
@@ -387,6 +685,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             new_map = {k: v for k, v in playlist_map.items() if k not in to_remove}
 
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: new_map,
                 CONF_BLOCKERS: _get_blockers(self.config_entry),
@@ -406,6 +705,327 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             }),
         )
 
+    async def async_step_import_playlists(self, user_input=None):
+        return self.async_show_menu(
+            step_id="import_playlists",
+            menu_options={
+                "import_paste": "Paste Playlists",
+                "import_file": "Import From File",
+                "import_library": "Import From Music Assistant Library",
+            },
+        )
+
+    async def async_step_import_paste(self, user_input=None):
+        if user_input is None:
+            return self._show_import_form("import_paste", _import_paste_schema())
+        return self._finish_import(
+            "import_paste",
+            _import_paste_schema(user_input.get("lines", "")),
+            rows_from_text(str(user_input.get("lines", ""))),
+            user_input,
+        )
+
+    async def async_step_import_file(self, user_input=None):
+        if user_input is None:
+            return self._show_import_form("import_file", _import_file_schema())
+
+        path = str(user_input.get("path", "")).strip()
+        schema = _import_file_schema(path)
+        if not path or not self.hass.config.is_allowed_path(path):
+            return self._show_import_form("import_file", schema, error="import_path_not_allowed")
+        try:
+            rows = await self.hass.async_add_executor_job(rows_from_file, path)
+        except OSError:
+            return self._show_import_form("import_file", schema, error="import_file_unreadable")
+        except ValueError:
+            return self._show_import_form("import_file", schema, error="import_file_invalid")
+        return self._finish_import("import_file", schema, rows, user_input)
+
+    async def async_step_import_library(self, user_input=None):
+        if self._library_playlists is None:
+            self._library_playlists = await self._async_fetch_library_playlists()
+        if not self._library_playlists:
+            return self.async_abort(reason="import_library_unavailable")
+
+        _, playlist_map = _get_players_and_map(self.hass, self.config_entry)
+        existing = {n.lower() for n in playlist_map}
+        names = [n for n in self._library_playlists if n.lower() not in existing]
+        schema = _import_library_schema(names)
+        if user_input is None:
+            return self._show_import_form("import_library", schema)
+
+        rows = [
+            (f"'{name}'", [name, self._library_playlists[name]])
+            for name in user_input.get("playlists", [])
+            if name in self._library_playlists
+        ]
+        return self._finish_import("import_library", schema, rows, user_input)
+
+    async def _async_fetch_library_playlists(self) -> dict[str, str]:
+        """Return {name: uri} for every playlist in the first loaded Music Assistant library."""
+        if not self.hass.services.has_service("music_assistant", "get_library"):
+            return {}
+        ma_entries = [
+            e for e in self.hass.config_entries.async_entries("music_assistant")
+            if e.state is config_entries.ConfigEntryState.LOADED
+        ]
+        if not ma_entries:
+            return {}
+
+        playlists: dict[str, str] = {}
+        offset = 0
+        while offset < _LIBRARY_MAX_ITEMS:
+            try:
+                response = await self.hass.services.async_call(
+                    "music_assistant",
+                    "get_library",
+                    {
+                        "config_entry_id": ma_entries[0].entry_id,
+                        "media_type": "playlist",
+                        "limit": _LIBRARY_PAGE_SIZE,
+                        "offset": offset,
+                    },
+                    blocking=True,
+                    return_response=True,
+                )
+            except Exception as err:
+                _LOGGER.debug("Music Assistant get_library failed: %s", err)
+                break
+            items = (response or {}).get("items") or []
+            for item in items:
+                name, uri = str(item.get("name", "")).strip(), item.get("uri")
+                if name and uri and name not in playlists:
+                    playlists[name] = str(uri)
+            if len(items) < _LIBRARY_PAGE_SIZE:
+                break
+            offset += _LIBRARY_PAGE_SIZE
+        return playlists
+
+    def _show_import_form(
+        self, step_id: str, schema: vol.Schema, error: str | None = None, details: str = ""
+    ):
+        return self.async_show_form(
+            step_id=step_id,
+            data_schema=schema,
+            errors={"base": error} if error else None,
+            description_placeholders={"import_errors": details},
+        )
+
+    def _finish_import(self, step_id: str, schema: vol.Schema, rows, user_input: dict):
+        """Validate every row in one pass, then commit the valid playlists in one options write."""
+        players, playlist_map = _get_players_and_map(self.hass, self.config_entry)
+        if not rows:
+            return self._show_import_form(step_id, schema, error="import_empty")
+
+        result = validate_rows(
+            rows, playlist_map, bool(user_input.get(CONF_PLAYLIST_RADIO_MODE, False))
+        )
+        if result.errors and not user_input.get("skip_invalid", False):
+            return self._show_import_form(
+                step_id,
+                schema,
+                error="import_invalid_lines",
+                details=_format_import_errors(result.errors),
+            )
+        if not result.playlists:
+            return self._show_import_form(
+                step_id, schema, error="import_empty", details=_format_import_errors(result.errors)
+            )
+
+        options = {
+            **self.config_entry.options,
+            CONF_MEDIA_PLAYERS: list(players),
+            CONF_PLAYLISTS: {**playlist_map, **result.playlists},
+            CONF_BLOCKERS: _get_blockers(self.config_entry),
+        }
+        return self.async_create_entry(title="", data=options)
+
+    async def async_step_manage_schedules(self, user_input=None):
+        schedules = _get_schedules(self.config_entry)
+
+        return self.async_show_menu(
+            step_id="manage_schedules",
+            menu_options={
+                "add_schedule": "Add Schedule",
+                "remove_schedules": "Remove Schedules",
+            } if schedules else {
+                "add_schedule": "Add Schedule",
+            },
+        )
+
+    async def async_step_add_schedule(self, user_input=None):
+        _, playlist_map = _get_players_and_map(self.hass, self.config_entry)
+        playlist_names = list(playlist_map.keys())
+        schedules = _get_schedules(self.config_entry)
+
+        if user_input is not None:
+            errors = {}
+            name = str(user_input.get(SCHEDULE_NAME, "")).strip()
+            days = [d for d in user_input.get(SCHEDULE_DAYS, []) if d in WEEKDAYS]
+            playlist = user_input.get(SCHEDULE_PLAYLIST) or None
+            volume = user_input.get(SCHEDULE_VOLUME)
+            enabled_choice = user_input.get(SCHEDULE_ENABLED, "unchanged")
+            enabled = None if enabled_choice == "unchanged" else enabled_choice == "on"
+
+            if not name:
+                errors[SCHEDULE_NAME] = "required"
+            elif name.lower() in {str(w.get(SCHEDULE_NAME, "")).lower() for w in schedules}:
+                errors[SCHEDULE_NAME] = "already_configured"
+            if not days:
+                errors[SCHEDULE_DAYS] = "required"
+            if playlist is None and volume is None and enabled is None:
+                errors["base"] = "schedule_no_effect"
+
+            if errors:
+                return self.async_show_form(
+                    step_id="add_schedule",
+                    data_schema=_schedule_schema(
+                        playlist_names,
+                        name=name,
+                        days=days,
+                        start=user_input.get(SCHEDULE_START, "22:00:00"),
+                        end=user_input.get(SCHEDULE_END, "07:00:00"),
+                        enabled=enabled_choice,
+                        priority=user_input.get(SCHEDULE_PRIORITY, 0),
+                    ),
+                    errors=errors,
+                )
+
+            new_window = {
+                SCHEDULE_ID: str(uuid.uuid4()),
+                SCHEDULE_NAME: name,
+                SCHEDULE_DAYS: days,
+                SCHEDULE_START: user_input[SCHEDULE_START],
+                SCHEDULE_END: user_input[SCHEDULE_END],
+                SCHEDULE_PLAYLIST: playlist,
+                SCHEDULE_VOLUME: float(volume) if volume is not None else None,
+                SCHEDULE_ENABLED: enabled,
+                SCHEDULE_PRIORITY: int(user_input.get(SCHEDULE_PRIORITY, 0) or 0),
+            }
+            options = {
+                **self.config_entry.options,
+                CONF_SCHEDULES: schedules + [new_window],
+            }
+            return self.async_create_entry(title="", data=options)
+
+        return self.async_show_form(
+            step_id="add_schedule", data_schema=_schedule_schema(playlist_names)
+        )
+
+    async def async_step_remove_schedules(self, user_input=None):
+        schedules = _get_schedules(self.config_entry)
+        names = [str(w.get(SCHEDULE_NAME, "")) for w in schedules if w.get(SCHEDULE_NAME)]
+
+        if not names:
+            return self.async_show_form(
+                step_id="remove_schedules",
+                data_schema=vol.Schema({}),
+                errors={"base": "no_schedules"},
+            )
+
+        if user_input is not None:
+            to_remove = set(user_input.get("names", []))
+            options = {
+                **self.config_entry.options,
+                CONF_SCHEDULES: [w for w in schedules if w.get(SCHEDULE_NAME, "") not in to_remove],
+            }
+            return self.async_create_entry(title="", data=options)
+
+        schema = vol.Schema({
+            vol.Required("names", default=[]): SelectSelector(
+                SelectSelectorConfig(options=names, multiple=True, custom_value=False)
+            )
+        })
+        return self.async_show_form(step_id="remove_schedules", data_schema=schema)
+
+    async def async_step_manage_triggers(self, user_input=None):
+        triggers = _get_triggers(self.config_entry)
+
+        return self.async_show_menu(
+            step_id="manage_triggers",
+            menu_options={
+                "add_trigger": "Add Trigger",
+                "remove_triggers": "Remove Triggers",
+            } if triggers else {
+                "add_trigger": "Add Trigger",
+            },
+        )
+
+    async def async_step_add_trigger(self, user_input=None):
+        triggers = _get_triggers(self.config_entry)
+
+        if user_input is not None:
+            errors = {}
+            name = str(user_input.get(TRIGGER_NAME, "")).strip()
+            event = user_input.get(TRIGGER_EVENT)
+            action = user_input.get(TRIGGER_ACTION)
+            days = [d for d in user_input.get(TRIGGER_DAYS, []) if d in WEEKDAYS]
+
+            if not name:
+                errors[TRIGGER_NAME] = "required"
+            elif name.lower() in {str(t.get(TRIGGER_NAME, "")).lower() for t in triggers}:
+                errors[TRIGGER_NAME] = "already_configured"
+            if action not in TRIGGER_ACTIONS.get(event, []):
+                errors[TRIGGER_ACTION] = "invalid_trigger_action"
+            if event == TRIGGER_EVENT_TIME and not days:
+                errors[TRIGGER_DAYS] = "required"
+
+            if errors:
+                return self.async_show_form(
+                    step_id="add_trigger",
+                    data_schema=_trigger_schema(
+                        name=name,
+                        event=event,
+                        action=action,
+                        at=user_input.get(TRIGGER_AT, "23:00:00"),
+                        days=days,
+                    ),
+                    errors=errors,
+                )
+
+            new_trigger = {
+                TRIGGER_ID: str(uuid.uuid4()),
+                TRIGGER_NAME: name,
+                TRIGGER_EVENT: event,
+                TRIGGER_ACTION: action,
+            }
+            if event == TRIGGER_EVENT_TIME:
+                new_trigger[TRIGGER_AT] = user_input.get(TRIGGER_AT, "23:00:00")
+                new_trigger[TRIGGER_DAYS] = days
+            options = {
+                **self.config_entry.options,
+                CONF_TRIGGERS: triggers + [new_trigger],
+            }
+            return self.async_create_entry(title="", data=options)
+
+        return self.async_show_form(step_id="add_trigger", data_schema=_trigger_schema())
+
+    async def async_step_remove_triggers(self, user_input=None):
+        triggers = _get_triggers(self.config_entry)
+        names = [str(t.get(TRIGGER_NAME, "")) for t in triggers if t.get(TRIGGER_NAME)]
+
+        if not names:
+            return self.async_show_form(
+                step_id="remove_triggers",
+                data_schema=vol.Schema({}),
+                errors={"base": "no_triggers"},
+            )
+
+        if user_input is not None:
+            to_remove = set(user_input.get("names", []))
+            options = {
+                **self.config_entry.options,
+                CONF_TRIGGERS: [t for t in triggers if t.get(TRIGGER_NAME, "") not in to_remove],
+            }
+            return self.async_create_entry(title="", data=options)
+
+        schema = vol.Schema({
+            vol.Required("names", default=[]): SelectSelector(
+                SelectSelectorConfig(options=names, multiple=True, custom_value=False)
+            )
+        })
+        return self.async_show_form(step_id="remove_triggers", data_schema=schema)
+
     async def async_step_manage_blockers(self, user_input=None):
         blockers = _get_blockers(self.config_entry)
         names = _blocker_names(blockers)
@@ -432,78 +1052,39 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         btype = self._pending_blocker_type or "state"
 
         if user_input is not None:
-            errors = {}
-
-            if btype == "state":
-                name = str(user_input[BLOCKER_NAME]).strip()
-                entity_id = str(user_input[BLOCKER_ENTITY_ID]).strip()
-                state_val = str(user_input[BLOCKER_STATE]).strip()
-                invert = bool(user_input[BLOCKER_INVERT])
-
-                if not name:
-                    errors[BLOCKER_NAME] = "required"
-                elif name.lower() in {n.lower() for n in _blocker_names(blockers)}:
-                    errors[BLOCKER_NAME] = "already_configured"
-                if not entity_id:
-                    errors[BLOCKER_ENTITY_ID] = "required"
-                if not state_val:
-                    errors[BLOCKER_STATE] = "required"
-
-                if errors:
-                    return self.async_show_form(
-                        step_id="add_blocker_details",
-                        data_schema=_add_blocker_state_schema(name, entity_id, state_val, invert),
-                        errors=errors,
-                    )
-
-                new_blocker = {
-                    BLOCKER_ID: str(uuid.uuid4()),
-                    BLOCKER_NAME: name,
-                    BLOCKER_TYPE: "state",
-                    BLOCKER_ENTITY_ID: entity_id,
-                    BLOCKER_STATE: state_val,
-                    BLOCKER_INVERT: invert,
-                }
-
-            else:
-                name = str(user_input[BLOCKER_NAME]).strip()
-                template_text = str(user_input[BLOCKER_TEMPLATE]).strip()
-                invert = bool(user_input[BLOCKER_INVERT])
-
-                if not name:
-                    errors[BLOCKER_NAME] = "required"
-                elif name.lower() in {n.lower() for n in _blocker_names(blockers)}:
-                    errors[BLOCKER_NAME] = "already_configured"
-                if not template_text:
-                    errors[BLOCKER_TEMPLATE] = "required"
-
-                if errors:
-                    return self.async_show_form(
-                        step_id="add_blocker_details",
-                        data_schema=_add_blocker_template_schema(name, template_text, invert),
-                        errors=errors,
-                    )
+            name = str(user_input[BLOCKER_NAME]).strip()
+            fields, errors = _blocker_fields(btype, user_input)
+            if not name:
+                errors[BLOCKER_NAME] = "required"
+            elif name.lower() in {n.lower() for n in _blocker_names(blockers)}:
+                errors[BLOCKER_NAME] = "already_configured"
 
-                new_blocker = {
-                    BLOCKER_ID: str(uuid.uuid4()),
-                    BLOCKER_NAME: name,
-                    BLOCKER_TYPE: "template",
-                    BLOCKER_TEMPLATE: template_text,
-                    BLOCKER_INVERT: invert,
-                }
+            if errors:
+                return self.async_show_form(
+                    step_id="add_blocker_details",
+                    data_schema=_blocker_schema(btype, {**user_input, BLOCKER_NAME: name}),
+                    errors=errors,
+                )
 
+            new_blocker = {
+                BLOCKER_ID: str(uuid.uuid4()),
+                BLOCKER_NAME: name,
+                BLOCKER_TYPE: btype,
+                **fields,
+            }
             new_blockers = blockers + [new_blocker]
             players, playlist_map = _get_players_and_map(self.hass, self.config_entry)
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: dict(playlist_map),
                 CONF_BLOCKERS: new_blockers,
             }
             return self.async_create_entry(title="", data=options)
 
-        if btype == "state":
-            return self.async_show_form(step_id="add_blocker_details", data_schema=_add_blocker_state_schema())
-        return self.async_show_form(step_id="add_blocker_details", data_schema=_add_blocker_template_schema())
+        return self.async_show_form(
+            step_id="add_blocker_details", data_schema=_blocker_schema(btype)
+        )
 
     async def async_step_edit_blocker_choose(self, user_input=None):
         blockers = _get_blockers(self.config_entry)
@@ -538,65 +1119,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_abort(reason="unknown_blocker")
 
         btype = blk[BLOCKER_TYPE]
-
-        if btype == "state":
-            schema = _add_blocker_state_schema(
-                name=blk.get(BLOCKER_NAME, ""),
-                entity_id=blk.get(BLOCKER_ENTITY_ID, ""),
-                state_val=blk.get(BLOCKER_STATE, ""),
-                invert=bool(blk.get(BLOCKER_INVERT, False)),
-            )
-        else:
-            schema = _add_blocker_template_schema(
-                name=blk.get(BLOCKER_NAME, ""),
-                template_text=blk.get(BLOCKER_TEMPLATE, ""),
-                invert=bool(blk.get(BLOCKER_INVERT, False)),
-            )
+        schema = _blocker_schema(btype, blk)
 
         if user_input is not None:
-            errors = {}
-
             new_name = str(user_input[BLOCKER_NAME]).strip()
+            fields, errors = _blocker_fields(btype, user_input)
             if not new_name:
                 errors[BLOCKER_NAME] = "required"
             elif new_name.lower() != blk.get(BLOCKER_NAME, "").lower() and new_name.lower() in {
                 n.lower() for n in _blocker_names(blockers)
             }:
                 errors[BLOCKER_NAME] = "already_configured"
+            if errors:
+                return self.async_show_form(
+                    step_id="edit_blocker", data_schema=schema, errors=errors
+                )
 
-            if btype == "state":
-                entity_id = str(user_input[BLOCKER_ENTITY_ID]).strip()
-                state_val = str(user_input[BLOCKER_STATE]).strip()
-                invert = bool(user_input[BLOCKER_INVERT])
-                if not entity_id:
-                    errors[BLOCKER_ENTITY_ID] = "required"
-                if not state_val:
-                    errors[BLOCKER_STATE] = "required"
-                if errors:
-                    return self.async_show_form(step_id="edit_blocker", data_schema=schema, errors=errors)
-
-                updated = dict(blk)
-                updated.update({
-                    BLOCKER_NAME: new_name,
-                    BLOCKER_ENTITY_ID: entity_id,
-                    BLOCKER_STATE: state_val,
-                    BLOCKER_INVERT: invert,
-                })
-
-            else:
-                template_text = str(user_input[BLOCKER_TEMPLATE]).strip()
-                invert = bool(user_input[BLOCKER_INVERT])
-                if not template_text:
-                    errors[BLOCKER_TEMPLATE] = "required"
-                if errors:
-                    return self.async_show_form(step_id="edit_blocker", data_schema=schema, errors=errors)
-
-                updated = dict(blk)
-                updated.update({
-                    BLOCKER_NAME: new_name,
-                    BLOCKER_TEMPLATE: template_text,
-                    BLOCKER_INVERT: invert,
-                })
+            updated = dict(blk)
+            updated.update({BLOCKER_NAME: new_name, **fields})
 
             idx = next((i for i, b in enumerate(blockers) if b.get(BLOCKER_NAME, "") == old_name), -1)
             if idx < 0:
@@ -606,6 +1146,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             new_blockers[idx] = updated
 
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: dict(playlist_map),
                 CONF_BLOCKERS: new_blockers,
@@ -631,6 +1172,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             new_blockers = [b for b in blockers if b.get(BLOCKER_NAME, "") not in to_remove]
 
             options = {
+                **self.config_entry.options,
                 CONF_MEDIA_PLAYERS: list(players),
                 CONF_PLAYLISTS: dict(playlist_map),
                 CONF_BLOCKERS: new_blockers,
@@ -7,8 +7,28 @@ CONF_MEDIA_PLAYERS = "media_players"
 CONF_PLAYLISTS = "playlists"
 CONF_PLAYLIST_ID = "playlist_id"
 CONF_PLAYLIST_RADIO_MODE = "radio_mode"
+CONF_PLAYLIST_PROVIDER = "provider"
+CONF_PLAYLIST_URI = "uri"
 CONF_BLOCKERS = "blockers"
+CONF_DIRECT_TRANSPORT = "direct_transport"
+CONF_TRANSPORT_URL = "transport_url"
+CONF_SCHEDULES = "schedules"
+CONF_TRIGGERS = "triggers"
 VOLUME_SET_CALL_TIMEOUT: float = 5.0
+BREAKER_FAILURE_THRESHOLD: int = 2
+STORE_SAVE_DELAY: float = 10.0
+MAX_FADE_SECONDS: float = 7200.0
+# Minimum seconds between state writes of the fade progress sensor.
+FADE_PROGRESS_UPDATE_INTERVAL: float = 1.0
+
+# --- Ducking defaults (seconds, volume 0.0–1.0) ---
+DUCK_DEFAULT_VOLUME: float = 0.1
+DUCK_DEFAULT_ATTACK: float = 0.15
+DUCK_DEFAULT_HOLD: float = 5.0
+DUCK_DEFAULT_RELEASE: float = 2.0
+
+# Dispatcher signal (formatted with the entry ID) carrying the set of changed option keys.
+SIGNAL_OPTIONS_UPDATED = "ambient_music_options_updated_{}"
   
 # --- Blocker dict keys ---
 BLOCKER_ID = "id"
@@ -18,6 +38,71 @@ BLOCKER_INVERT = "invert"
 BLOCKER_ENTITY_ID = "entity_id"
 BLOCKER_STATE = "state"
 BLOCKER_TEMPLATE = "template"
+BLOCKER_ATTRIBUTE = "attribute"
+BLOCKER_ABOVE = "above"
+BLOCKER_BELOW = "below"
+BLOCKER_AFTER = "after"
+BLOCKER_BEFORE = "before"
+BLOCKER_VALUE = "value"
+BLOCKER_TYPES = ["state", "numeric", "time", "attribute", "template"]
+
+# --- Schedule window dict keys ---
+SCHEDULE_ID = "id"
+SCHEDULE_NAME = "name"
+SCHEDULE_DAYS = "days"
+SCHEDULE_START = "start"
+SCHEDULE_END = "end"
+SCHEDULE_PLAYLIST = "playlist"
+SCHEDULE_VOLUME = "volume"
+SCHEDULE_ENABLED = "enabled"
+SCHEDULE_PRIORITY = "priority"
+SCHEDULE_PREVIEW_COUNT: int = 5
+
+# --- Trigger rule dict keys ---
+TRIGGER_ID = "id"
+TRIGGER_NAME = "name"
+TRIGGER_EVENT = "event"
+TRIGGER_ACTION = "action"
+TRIGGER_AT = "at"
+TRIGGER_DAYS = "days"
+
+TRIGGER_EVENT_BLOCKERS_CLEAR = "blockers_clear"
+TRIGGER_EVENT_BLOCKERS_ACTIVE = "blockers_active"
+TRIGGER_EVENT_PLAYLIST_CHANGED = "playlist_changed"
+TRIGGER_EVENT_TIME = "time"
+TRIGGER_ACTION_PLAY = "play"
+TRIGGER_ACTION_STOP = "stop"
+TRIGGER_ACTION_SWITCHOVER = "switchover"
+# Actions each trigger event can run.
+TRIGGER_ACTIONS = {
+    TRIGGER_EVENT_BLOCKERS_CLEAR: [TRIGGER_ACTION_PLAY],
+    TRIGGER_EVENT_BLOCKERS_ACTIVE: [TRIGGER_ACTION_STOP],
+    TRIGGER_EVENT_PLAYLIST_CHANGED: [TRIGGER_ACTION_SWITCHOVER],
+    TRIGGER_EVENT_TIME: [TRIGGER_ACTION_PLAY, TRIGGER_ACTION_STOP],
+}
+# Rules in force until triggers are edited in the options flow.
+DEFAULT_TRIGGERS = [
+    {
+        TRIGGER_ID: "default_blockers_clear",
+        TRIGGER_NAME: "Play when blockers clear",
+        TRIGGER_EVENT: TRIGGER_EVENT_BLOCKERS_CLEAR,
+        TRIGGER_ACTION: TRIGGER_ACTION_PLAY,
+    },
+    {
+        TRIGGER_ID: "default_blockers_active",
+        TRIGGER_NAME: "Stop when blocked",
+        TRIGGER_EVENT: TRIGGER_EVENT_BLOCKERS_ACTIVE,
+        TRIGGER_ACTION: TRIGGER_ACTION_STOP,
+    },
+    {
+        TRIGGER_ID: "default_playlist_changed",
+        TRIGGER_NAME: "Switch over on playlist change",
+        TRIGGER_EVENT: TRIGGER_EVENT_PLAYLIST_CHANGED,
+        TRIGGER_ACTION: TRIGGER_ACTION_SWITCHOVER,
+    },
+]
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
 
 DEVICE_INFO = {
     "identifiers": {(DOMAIN,)},
@@ -0,0 +1,42 @@
+"""Diagnostics for Ambient Music — breakers, mixer, blockers, transport, watchers and timings."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import AmbientMusicData
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return runtime diagnostics for the config entry."""
+    data: AmbientMusicData | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is None:
+        return {"options": dict(entry.options), "loaded": False}
+
+    transport = data.transport
+    return {
+        "options": dict(entry.options),
+        "loaded": True,
+        "speaker_breakers": data.breakers.as_dict(),
+        "mixer": data.mixer.as_dict() if data.mixer else None,
+        "ducking": data.ducker.as_dict() if data.ducker else None,
+        "setup_timings_ms": dict(data.setup_timings),
+        "watchers": data.watchers.as_dict() if data.watchers else None,
+        "playback": data.zone.as_dict() if data.zone else None,
+        # Not recorded in history, so included here.
+        "blockers": (
+            blockers.attributes.get("blockers")
+            if (blockers := hass.states.get("binary_sensor.ambient_music_blockers_clear"))
+            else None
+        ),
+        "transport": {
+            "enabled": transport is not None,
+            "url": transport.url if transport else None,
+            "connected": transport.connected if transport else False,
+            "server_version": transport.server_info.get("server_version") if transport else None,
+        },
+    }
@@ -0,0 +1,170 @@
+"""Announcement ducking — fast attack, hold and release with reference-counted restore."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .fade_engine import FadeMixer, VolumeShadow, get_known_volume, resolve_speakers
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _DuckedSpeaker:
+    """Duck bookkeeping for one speaker."""
+
+    pre_level: float
+    level: float = 0.0
+    count: int = 0
+    # Shadow timestamp of the last level the ducker itself commanded.
+    commanded_at: float | None = None
+
+
+class DuckController:
+    """
+    Lowers speakers for announcements and restores them afterwards.
+
+    The level before the first duck is stored per speaker.  Ducks are counted, so
+    overlapping announcements keep a speaker down until the last one's hold expires, and
+    the stored level is only restored then.  All fades go through the entry's mixer,
+    which keeps one ramp per speaker, so an attack simply replaces a running release.
+    A speaker commanded by anything else while ducked is not restored.
+
+    A fade already running on a speaker (a fade-up, a sunrise, a stop) is suspended in
+    the mixer rather than replaced: its clock keeps running while ducked, the release
+    fades back to where that ramp will be by then, and the ramp then carries on.
+    """
+
+    def __init__(self, hass: HomeAssistant, mixer: FadeMixer, shadow: VolumeShadow) -> None:
+        self.hass = hass
+        self.mixer = mixer
+        self.shadow = shadow
+        self._speakers: dict[str, _DuckedSpeaker] = {}
+        self._holds: set[Callable[[], None]] = set()
+        self._releases: set[asyncio.Task] = set()
+        self.ducks = 0
+
+    async def async_duck(
+        self,
+        entity_ids: list[str],
+        volume: float,
+        attack: float,
+        hold: float,
+        release: float,
+    ) -> list[str]:
+        """
+        Duck *entity_ids* to *volume* and schedule the release; return once the attack is done.
+
+        :param entity_ids: Media-player entity IDs (groups are resolved to speakers).
+        :param volume: Ducked level; speakers already below it are left where they are.
+        :param attack: Seconds to reach the ducked level; under one mixer step is a jump.
+        :param hold: Seconds to stay ducked before this duck is released.
+        :param release: Seconds to fade back once no duck holds the speaker.
+        :return: The speakers that were ducked (those with a known volume).
+        """
+        ducked: list[str] = []
+        newly_ducked: list[str] = []
+        for speaker in resolve_speakers(self.hass, entity_ids):
+            state = self._speakers.get(speaker)
+            if state is None:
+                pre_level = get_known_volume(self.hass, speaker, self.shadow)
+                if pre_level is None:
+                    _LOGGER.debug("Not ducking %s; its volume is unknown", speaker)
+                    continue
+                state = self._speakers[speaker] = _DuckedSpeaker(pre_level)
+                newly_ducked.append(speaker)
+            state.count += 1
+            state.level = min(float(volume), state.pre_level)
+            ducked.append(speaker)
+        if not ducked:
+            return []
+
+        self.ducks += 1
+        self.mixer.async_suspend(newly_ducked)
+        levels = {speaker: self._speakers[speaker].level for speaker in ducked}
+        # Every speaker has its own level, so the shared target is never used.
+        await self.mixer.async_fade(
+            ducked, 0.0, attack, "linear", levels=levels, overlay=True
+        )
+        for speaker in ducked:
+            if (state := self._speakers.get(speaker)) is not None:
+                state.commanded_at = self._last_command(speaker)
+        self._schedule_release(ducked, hold, release)
+        return ducked
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel pending holds and releases without restoring (the entry is unloading)."""
+        for unsub in list(self._holds):
+            unsub()
+        self._holds.clear()
+        for task in list(self._releases):
+            task.cancel()
+        self._speakers.clear()
+
+    def as_dict(self) -> dict:
+        """Ducked speakers and counters for diagnostics."""
+        return {
+            "ducks": self.ducks,
+            "speakers": {
+                speaker: {"pre_level": s.pre_level, "level": s.level, "count": s.count}
+                for speaker, s in self._speakers.items()
+            },
+        }
+
+    def _last_command(self, speaker: str) -> float | None:
+        entry = self.shadow.get(speaker)
+        return entry[1] if entry else None
+
+    @callback
+    def _schedule_release(self, speakers: list[str], hold: float, release: float) -> None:
+        unsub: Callable[[], None] | None = None
+
+        @callback
+        def _hold_expired(_now) -> None:
+            self._holds.discard(unsub)
+            task = self.hass.async_create_task(
+                self._async_release(speakers, release), "ambient_music_duck_release"
+            )
+            self._releases.add(task)
+            task.add_done_callback(self._releases.discard)
+
+        unsub = async_call_later(self.hass, hold, _hold_expired)
+        self._holds.add(unsub)
+
+    async def _async_release(self, speakers: list[str], release: float) -> None:
+        """Drop one duck from *speakers* and restore those no other duck still holds."""
+        levels: dict[str, float] = {}
+        for speaker in speakers:
+            state = self._speakers.get(speaker)
+            if state is None:
+                continue
+            state.count -= 1
+            if state.count > 0:
+                continue
+            last = self._last_command(speaker)
+            if last is not None and state.commanded_at is not None and last > state.commanded_at:
+                _LOGGER.debug("Not restoring %s; it was commanded while ducked", speaker)
+                del self._speakers[speaker]
+                continue
+            # A suspended fade is met where its ramp will be once the release ends.
+            resumed = self.mixer.suspended_level(speaker, release)
+            levels[speaker] = resumed if resumed is not None else state.pre_level
+        if not levels:
+            return
+
+        await self.mixer.async_fade(
+            list(levels), 0.0, release, "logarithmic", levels=levels, overlay=True
+        )
+        restored: list[str] = []
+        for speaker in levels:
+            state = self._speakers.get(speaker)
+            # A duck that arrived during the release keeps the stored level.
+            if state is not None and state.count == 0:
+                del self._speakers[speaker]
+                restored.append(speaker)
+        self.mixer.async_unsuspend(restored)
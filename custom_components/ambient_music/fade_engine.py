@@ -1,17 +1,58 @@
 """Ambient Music fade engine — async volume transitions with speaker availability awareness."""
 
 import asyncio
+import contextlib
 import logging
+import math
+import time
 from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components.media_player import MediaPlayerEntityFeature
+from homeassistant.core import HomeAssistant, callback
 
-from .const import VOLUME_SET_CALL_TIMEOUT
+from .const import BREAKER_FAILURE_THRESHOLD, VOLUME_SET_CALL_TIMEOUT
+from .ma_client import MusicAssistantTransport
 
 _LOGGER = logging.getLogger(__name__)
 
-_STEPS_PER_SECOND: int = 4
 _STEP_INTERVAL: float = 0.25
+# Longest sleep between two ticks of a fade, however little it moves.
+_MAX_STEP_INTERVAL: float = 60.0
+# Smallest level change worth a call.  Loudness follows the level roughly
+# logarithmically, so a just-noticeable step is a constant ratio between levels (about
+# 1 dB); near zero, where that ratio shrinks below the finest step Music Assistant
+# takes (one percent), a step is one percent instead.
+_JND_DB: float = 1.0
+_JND_RATIO: float = 10 ** (_JND_DB / 20)
+_JND_FLOOR: float = 0.01
+# Level where the ratio step grows past the floor (about 0.08).
+_JND_KNEE: float = _JND_FLOOR / (_JND_RATIO - 1)
+# Slack for level rounding when comparing against one noticeable step.
+_JND_TOLERANCE: float = 0.01
+# Points a curve is sampled at to find its steepest part when spacing steps.
+_CURVE_SAMPLES: int = 64
+# Ticks per noticeable step on the steepest part, so a step is sent close to when it is due.
+_TICKS_PER_STEP: int = 2
+# Levels are rounded to this many decimals so speakers at the same level share a call.
+_LEVEL_DECIMALS: int = 3
+# Fades due within this many seconds of a tick are advanced on it, keeping them in step.
+_TICK_SLACK: float = 0.01
+
+GROUP_MODE_NATIVE = "native"
+GROUP_MODE_PER_MEMBER = "per_member"
+
+# A commanded level younger than this is trusted over the (lagging) volume_level attribute.
+_SHADOW_HANDOFF_SECONDS: float = 5.0
+_LEVEL_TOLERANCE: float = 0.001
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Seconds a quarantined speaker waits before each successive half-open probe.
+_BREAKER_BACKOFF_SECONDS: tuple[float, ...] = (10.0, 30.0, 60.0, 120.0, 300.0)
+_BREAKER_PROBE_TIMEOUT: float = 2.0
 
 
 @dataclass
@@ -21,135 +62,978 @@ class FadeResult:
     commanded_speakers: list[str] = field(default_factory=list)
     skipped_speakers: list[tuple[str, str]] = field(default_factory=list)
     call_timeouts: int = 0
+    group_modes: dict[str, str] = field(default_factory=dict)
+    breaker_states: dict[str, str] = field(default_factory=dict)
+    # True when the mixer sent some steps in volume_set calls shared with another fade.
+    merged: bool = False
+    aborted: bool = False
 
     @property
     def all_unavailable(self) -> bool:
         """Return True when no speakers were successfully commanded."""
         return not self.commanded_speakers
 
+    @classmethod
+    def combine(cls, results: list["FadeResult"]) -> "FadeResult":
+        """Fold the results of several fades and volume sets of one operation together."""
+        combined = cls()
+        skipped: dict[str, str] = {}
+        for result in results:
+            combined.commanded_speakers.extend(result.commanded_speakers)
+            skipped.update(result.skipped_speakers)
+            combined.call_timeouts += result.call_timeouts
+            combined.group_modes.update(result.group_modes)
+            combined.breaker_states.update(result.breaker_states)
+            combined.merged = combined.merged or result.merged
+            combined.aborted = combined.aborted or result.aborted
+        combined.commanded_speakers = _dedupe(combined.commanded_speakers)
+        combined.skipped_speakers = list(skipped.items())
+        return combined
 
-async def fade_volume(
-    hass: HomeAssistant,
-    entity_ids: list[str],
-    target_volume: float,
-    duration: float,
-    curve: str,
-    volume_set_timeout: float = VOLUME_SET_CALL_TIMEOUT,
-) -> FadeResult:
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-friendly form, used for service responses."""
+        return {
+            "commanded_speakers": list(self.commanded_speakers),
+            "skipped_speakers": [
+                {"entity_id": entity_id, "reason": reason}
+                for entity_id, reason in self.skipped_speakers
+            ],
+            "call_timeouts": self.call_timeouts,
+            "group_modes": dict(self.group_modes),
+            "breaker_states": dict(self.breaker_states),
+            "merged": self.merged,
+            "aborted": self.aborted,
+        }
+
+
+class VolumeShadow:
     """
-    Fade volume for the given entity IDs to target_volume over duration seconds.
+    Last volume level commanded to each speaker, with the time it was sent.
 
-    Group members are resolved automatically — if an entity has a ``group_members``
-    attribute, individual members are targeted instead.  Unavailable speakers are
-    skipped (and re-evaluated each step) so a single offline speaker never blocks the fade.
+    Speakers report ``volume_level`` with a lag, so a fade that supersedes a cancelled
+    one would otherwise start from a stale value and jump.  Levels recorded within
+    ``_SHADOW_HANDOFF_SECONDS`` are used instead of the state attribute.
 
-    :param hass: Home Assistant instance.
-    :param entity_ids: Media-player entity IDs (may include groups).
-    :param target_volume: Desired end volume (0.0–1.0).
-    :param duration: Fade duration in seconds; 0 or negative means jump immediately.
-    :param curve: Easing curve — "logarithmic", "bezier", or "linear".
-    :param volume_set_timeout: Per-call timeout for each volume_set service call.
-    :return: FadeResult with details of commanded/skipped speakers and timeouts.
+    ``on_record``, when set, is called with every recorded batch so the levels can be
+    persisted.
     """
-    commanded: set[str] = set()
-    skipped_by_entity: dict[str, str] = {}
-    warned_skips: set[tuple[str, str]] = set()
-    call_timeouts: int = 0
 
-    def _record_skips(skipped: list[tuple[str, str]]) -> None:
+    def __init__(self) -> None:
+        self._levels: dict[str, tuple[float, float]] = {}
+        self.on_record: Callable[[list[str], float], None] | None = None
+
+    def record(self, entity_ids: list[str], volume_level: float) -> None:
+        """Remember *volume_level* as the latest commanded level for each entity."""
+        now = time.monotonic()
+        for entity_id in entity_ids:
+            self._levels[entity_id] = (float(volume_level), now)
+        if self.on_record is not None:
+            self.on_record(entity_ids, volume_level)
+
+    def get(self, entity_id: str) -> tuple[float, float] | None:
+        """Return (level, monotonic_timestamp) of the last command, or None."""
+        return self._levels.get(entity_id)
+
+    def recent_level(self, entity_id: str) -> float | None:
+        """Return the last commanded level if it is recent enough to trust, else None."""
+        entry = self._levels.get(entity_id)
+        if entry is None:
+            return None
+        level, sent_at = entry
+        if time.monotonic() - sent_at > _SHADOW_HANDOFF_SECONDS:
+            return None
+        return level
+
+
+@dataclass
+class _SpeakerBreaker:
+    """Circuit-breaker bookkeeping for one speaker."""
+
+    state: str = BREAKER_CLOSED
+    consecutive_timeouts: int = 0
+    trips: int = 0
+    next_probe_at: float = 0.0
+
+
+class SpeakerBreakers:
+    """
+    Per-speaker circuit breakers for volume_set calls.
+
+    A speaker whose calls time out ``failure_threshold`` times in a row is quarantined
+    (open) and left out of following steps.  Once its backoff has elapsed it is probed
+    (half-open) with a short, isolated call: success closes the breaker, another timeout
+    re-opens it with the next, longer backoff.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD) -> None:
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self._breakers: dict[str, _SpeakerBreaker] = {}
+
+    def state(self, entity_id: str) -> str:
+        """Return the breaker state for *entity_id* (closed if never tripped)."""
+        breaker = self._breakers.get(entity_id)
+        return breaker.state if breaker else BREAKER_CLOSED
+
+    def is_quarantined(self, entity_id: str) -> bool:
+        """Return True if the speaker is open and not yet due for a probe."""
+        breaker = self._breakers.get(entity_id)
+        return (
+            breaker is not None
+            and breaker.state == BREAKER_OPEN
+            and time.monotonic() < breaker.next_probe_at
+        )
+
+    def split_probes(self, entity_ids: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Split admitted speakers into (normal, probes), moving due speakers to half-open.
+
+        Probes are sent in isolation so an unresponsive speaker cannot stall the batch.
+        """
+        normal: list[str] = []
+        probes: list[str] = []
+        for entity_id in entity_ids:
+            breaker = self._breakers.get(entity_id)
+            if breaker is None or breaker.state == BREAKER_CLOSED:
+                normal.append(entity_id)
+                continue
+            breaker.state = BREAKER_HALF_OPEN
+            probes.append(entity_id)
+        return normal, probes
+
+    def record_success(self, entity_ids: list[str]) -> None:
+        """Close the breakers of speakers that answered."""
+        for entity_id in entity_ids:
+            breaker = self._breakers.get(entity_id)
+            if breaker is None:
+                continue
+            if breaker.state != BREAKER_CLOSED:
+                _LOGGER.info("Speaker recovered, closing circuit breaker: entity_id=%s", entity_id)
+            del self._breakers[entity_id]
+
+    def record_timeout(self, entity_ids: list[str]) -> None:
+        """Count a timeout for each speaker, opening its breaker at the threshold."""
+        now = time.monotonic()
+        for entity_id in entity_ids:
+            breaker = self._breakers.setdefault(entity_id, _SpeakerBreaker())
+            breaker.consecutive_timeouts += 1
+            if (
+                breaker.state == BREAKER_CLOSED
+                and breaker.consecutive_timeouts < self.failure_threshold
+            ):
+                continue
+            backoff_idx = min(breaker.trips, len(_BREAKER_BACKOFF_SECONDS) - 1)
+            backoff = _BREAKER_BACKOFF_SECONDS[backoff_idx]
+            breaker.trips += 1
+            breaker.state = BREAKER_OPEN
+            breaker.next_probe_at = now + backoff
+            _LOGGER.warning(
+                "Quarantining unresponsive speaker: entity_id=%s timeouts=%d retry_in=%.0fs",
+                entity_id,
+                breaker.consecutive_timeouts,
+                backoff,
+            )
+
+    def states_for(self, entity_ids: list[str]) -> dict[str, str]:
+        """Return {entity_id: state} for the given speakers whose breaker is not closed."""
+        return {
+            eid: self._breakers[eid].state
+            for eid in entity_ids
+            if eid in self._breakers and self._breakers[eid].state != BREAKER_CLOSED
+        }
+
+    def as_dict(self) -> dict[str, dict]:
+        """Return every tracked breaker for diagnostics."""
+        now = time.monotonic()
+        return {
+            eid: {
+                "state": breaker.state,
+                "consecutive_timeouts": breaker.consecutive_timeouts,
+                "trips": breaker.trips,
+                "next_probe_in": max(breaker.next_probe_at - now, 0.0),
+            }
+            for eid, breaker in self._breakers.items()
+        }
+
+
+class _MixerFade:
+    """One fade driven by a FadeMixer, with the bookkeeping behind its FadeResult."""
+
+    def __init__(
+        self,
+        entity_ids: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        released: set[str] | None,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+    ) -> None:
+        self.entity_ids = list(entity_ids)
+        self.target_volume = float(target_volume)
+        self.levels = {eid: float(level) for eid, level in (levels or {}).items()}
+        self.offsets = {eid: float(offset) for eid, offset in (offsets or {}).items() if offset}
+        # Group members whose end level differs from their group's; see FadeMixer.async_fade.
+        self.individual: set[str] = set()
+        self.duration = duration
+        self.curve = curve
+        self.released = released
+        # Set on the first tick, so fades started between two ticks stay in step.
+        self.started: float | None = None
+        # Monotonic time the fade was paused at; the ramp is held while this is set.
+        self.paused_at: float | None = None
+        self.step_interval: float = _STEP_INTERVAL
+        self.next_tick: float | None = None
+        self.claimed: set[str] = set()
+        self.commanded: set[str] = set()
+        self.group_modes: dict[str, str] = {}
+        self.skipped: dict[str, str] = {}
+        self.call_timeouts = 0
+        self.merged = False
+        self.aborted = False
+        # Overlay fades (ducks) keep ramps suspended on their targets; see FadeMixer.
+        self.overlay = False
+        self._warned: set[tuple[str, str]] = set()
+        self.done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def target_for(self, key: str) -> float:
+        """Return the end level for command target *key*: its own level plus its offset."""
+        level = self.levels.get(key, self.target_volume) + self.offsets.get(key, 0.0)
+        return min(max(level, 0.0), 1.0)
+
+    def elapsed(self, now: float) -> float:
+        """Seconds of the fade that have run by *now*, not counting a current pause."""
+        if self.started is None:
+            return 0.0
+        return (self.paused_at or now) - self.started
+
+    def level_at(self, ramp: "_Ramp", now: float) -> tuple[float, bool]:
+        """Return (level, finished) for *ramp* at *now*; the target is due at the end."""
+        elapsed = self.elapsed(now)
+        if elapsed >= self.duration - _TICK_SLACK:
+            return ramp.target, True
+        factor = _compute_curve_factor(elapsed / self.duration, self.curve)
+        return ramp.start + factor * (ramp.target - ramp.start), False
+
+    def schedule_next(self, now: float) -> None:
+        """Set the next tick one step on, but never past the end of the fade."""
+        self.next_tick = now + min(self.step_interval, self.duration - self.elapsed(now))
+
+    def record_skips(self, skipped: list[tuple[str, str]]) -> None:
         for entity_id, reason in skipped:
-            skipped_by_entity[entity_id] = reason
+            self.skipped[entity_id] = reason
             key = (entity_id, reason)
-            if key in warned_skips:
+            if key in self._warned:
                 continue
-            warned_skips.add(key)
+            self._warned.add(key)
             _LOGGER.warning(
                 "Skipping unavailable speaker: entity_id=%s reason=%s",
                 entity_id,
                 reason,
             )
 
-    if not entity_ids:
-        return FadeResult()
+    def result(self, breakers: SpeakerBreakers | None) -> FadeResult:
+        return FadeResult(
+            commanded_speakers=sorted(self.commanded),
+            skipped_speakers=list(self.skipped.items()),
+            call_timeouts=self.call_timeouts,
+            group_modes=self.group_modes,
+            breaker_states=(
+                breakers.states_for([*self.commanded, *self.skipped]) if breakers else {}
+            ),
+            merged=self.merged,
+            aborted=self.aborted,
+        )
 
-    # Resolve group members and classify availability
-    resolved = _resolve_group_members(hass, entity_ids)
-    available, skipped = _classify_speakers(hass, resolved)
-    _record_skips(skipped)
 
-    if not available:
-        _LOGGER.warning("All speakers unavailable; skipping fade")
-        return FadeResult(skipped_speakers=list(skipped_by_entity.items()))
+@dataclass
+class _Ramp:
+    """
+    The fade currently driving one command target, with its start and end levels.
+
+    *sent* is the last level sent, or the known level before the first send (None if
+    unknown, so the first tick always sends).
+    """
+
+    fade: _MixerFade
+    start: float
+    target: float
+    sent: float | None = None
+
 
-    # Duration ≤ 0: single immediate volume_set, no fade loop
-    if duration <= 0:
-        call_timeouts += await _guarded_volume_set(
-            hass, available, target_volume, volume_set_timeout
+class FadeMixer:
+    """
+    Drives every fade of one config entry from a single tick loop.
+
+    Each command target (a speaker or a natively grouped player) has at most one ramp.
+    A new fade on a target replaces the ramp in one step, and the older fade stops
+    commanding it; a fade left without ramps finishes.  Every tick computes all ramp
+    levels and sends one volume_set per distinct level, so speakers fading together share
+    a call instead of each fade running its own timer and calls.  The loop only runs
+    while a fade is active.
+
+    Running fades can be paused, resumed and aborted in place: a paused fade holds its
+    ramps at the last sent level, and an aborted one finishes there, so the caller
+    awaiting it carries on without being cancelled.
+
+    Ramps can also be suspended on single targets (while an announcement ducks them):
+    the owning fade keeps its clock but stops commanding those targets, and the ramp is
+    handed back on resume.  Overlay fades (the ducker's own) leave suspensions alone;
+    any other fade or volume_set on a target discards its suspended ramp.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        transport: MusicAssistantTransport | None = None,
+        shadow: VolumeShadow | None = None,
+        breakers: SpeakerBreakers | None = None,
+        volume_set_timeout: float = VOLUME_SET_CALL_TIMEOUT,
+    ) -> None:
+        """
+        :param hass: Home Assistant instance.
+        :param transport: Optional direct MA transport; may be assigned after creation.
+        :param shadow: Optional record of commanded levels, read for ramp start levels.
+        :param breakers: Optional per-speaker circuit breakers.
+        :param volume_set_timeout: Per-call timeout for each volume_set call.
+        """
+        self.hass = hass
+        self.transport = transport
+        self.shadow = shadow
+        self.breakers = breakers
+        self.volume_set_timeout = volume_set_timeout
+        self._ramps: dict[str, _Ramp] = {}
+        self._suspended: dict[str, _Ramp] = {}
+        self._fades: list[_MixerFade] = []
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self._listeners: list[Callable[[], None]] = []
+        self.ticks = 0
+        self.volume_set_calls = 0
+        self.last_tick_ms: float | None = None
+
+    async def async_fade(
+        self,
+        entity_ids: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        released: set[str] | None = None,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+        overlay: bool = False,
+    ) -> FadeResult:
+        """
+        Fade *entity_ids* to *target_volume* and return once the fade has finished.
+
+        Groups are resolved and speakers classified on every tick, as with a standalone
+        fade.  Each target ramps from its own known level to its own end level, all on
+        the same timing.  Cancelling the caller removes this fade's ramps immediately.
+
+        :param released: Live set of speakers handed over to another operation mid-fade;
+            re-read every tick and never commanded.
+        :param levels: Optional {entity_id: end level} overriding *target_volume*; a group
+            entry applies to members without their own entry.
+        :param offsets: Optional {entity_id: offset} added to the end level (clamped to
+            0.0–1.0); expanded over groups the same way.
+        :param overlay: Keep ramps suspended on the targets (see async_suspend) instead of
+            discarding them.
+        """
+        if not entity_ids:
+            return FadeResult()
+
+        fade = self._new_fade(entity_ids, target_volume, duration, curve, released, levels, offsets)
+        available = self._refresh(fade)
+        if not available:
+            _LOGGER.warning("All speakers unavailable; skipping fade")
+            return fade.result(self.breakers)
+
+        # Shorter than one tick (or ≤ 0): single immediate volume_set per level, no ramp
+        if duration < _STEP_INTERVAL:
+            self._drop(available, overlay)
+            batches: dict[float, list[str]] = {}
+            for key in available:
+                batches.setdefault(round(fade.target_for(key), _LEVEL_DECIMALS), []).append(key)
+            outcomes = await asyncio.gather(*(
+                self._send(keys, level) for level, keys in batches.items()
+            ))
+            fade.call_timeouts += sum(outcomes)
+            fade.commanded.update(available)
+            return fade.result(self.breakers)
+
+        fade.overlay = overlay
+        for key in available:
+            self._claim(fade, key)
+        _LOGGER.debug(
+            "Fade starting: entities=%s target=%.3f duration=%.1fs curve=%s",
+            available,
+            fade.target_volume,
+            duration,
+            curve,
         )
-        commanded.update(available)
-        return FadeResult(
-            commanded_speakers=sorted(commanded),
-            skipped_speakers=list(skipped_by_entity.items()),
-            call_timeouts=call_timeouts,
+        self._fades.append(fade)
+        self._notify()
+        self._wake.set()
+        if self._task is None or self._task.done():
+            # A background task, so a running fade never holds up Home Assistant's shutdown.
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "ambient_music_mixer"
+            )
+        try:
+            await fade.done
+        finally:
+            self._finish(fade)
+
+        if fade.aborted:
+            _LOGGER.debug("Fade aborted: entities=%s", sorted(fade.commanded))
+            return fade.result(self.breakers)
+        _LOGGER.debug(
+            "Fade complete: entities=%s final_vol=%.3f",
+            sorted(fade.commanded),
+            fade.target_volume,
         )
+        return fade.result(self.breakers)
 
-    start_volume = _get_current_volume(hass, available[0])
-    total_steps = max(int(_STEPS_PER_SECOND * duration), 1)
-
-    _LOGGER.debug(
-        "Fade starting: entities=%s start_vol=%.3f target=%.3f duration=%.1fs steps=%d curve=%s",
-        available,
-        start_volume,
-        target_volume,
-        duration,
-        total_steps,
-        curve,
-    )
+    async def async_set_volume(
+        self,
+        entity_ids: list[str],
+        volume_level: float,
+        skip_if_at_level: bool = False,
+        released: set[str] | None = None,
+    ) -> FadeResult:
+        """Cancel any ramps on the targets, then set *volume_level* at once (see volume_set)."""
+        resolved, _ = _resolve_volume_targets(self.hass, entity_ids, released)
+        self._drop(resolved)
+        return await volume_set(
+            self.hass,
+            entity_ids,
+            volume_level,
+            self.volume_set_timeout,
+            self.transport,
+            self.shadow,
+            skip_if_at_level,
+            released,
+            self.breakers,
+        )
+
+    def plan(
+        self,
+        entity_ids: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        levels: dict[str, float] | None = None,
+        offsets: dict[str, float] | None = None,
+        start_level: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Return the volume_set schedule a fade would send now, without sending anything.
+
+        Targets are resolved, classified and batched exactly as ``async_fade`` would on
+        its first tick.  All targets share the fade's timing, so the curve is evaluated
+        once per step and each distinct start/end pair is expanded once, which keeps
+        plans for hundreds of speakers cheap.
+
+        :param start_level: Level every target starts from, instead of its known level
+            (e.g. 0.0 for the fade-up after a playlist starts silenced).
+        :return: Per-target step tables (``at`` seconds from the start, ``level``, and
+            whether the step is ``sent`` or suppressed as below one noticeable step), the
+            grouped calls, and the skipped speakers and group modes.
+        """
+        fade = self._new_fade(entity_ids, target_volume, duration, curve, None, levels, offsets)
+        available = self._refresh(fade) if entity_ids else []
+        ramps = {
+            key: (
+                _get_current_volume(self.hass, key, self.shadow)
+                if start_level is None
+                else float(start_level),
+                fade.target_for(key),
+            )
+            for key in available
+        }
+        if duration < _STEP_INTERVAL:
+            step_interval = 0.0
+            times, factors = [0.0], [1.0]
+        else:
+            # Ticks land one interval apart from the start; the last one at the end.
+            step_interval = _step_interval(duration, curve, ramps.values())
+            steps = max(math.ceil(duration / step_interval - _TICK_SLACK), 1)
+            times = [k * step_interval for k in range(1, steps)] + [duration]
+            factors = [_compute_curve_factor(at / duration, curve) for at in times]
+
+        tables: dict[tuple[float, float], list[dict[str, Any]]] = {}
+        calls: dict[tuple[int, float], list[str]] = {}
+        suppressed = 0
+        speakers: dict[str, dict[str, Any]] = {}
+        for key, (start, target) in ramps.items():
+            table = tables.get((start, target))
+            if table is None:
+                table, sent = [], start
+                for k, factor in enumerate(factors):
+                    level = round(start + factor * (target - start), _LEVEL_DECIMALS)
+                    send = k == len(factors) - 1 or _noticeable(sent, level)
+                    if send:
+                        sent = level
+                    table.append({"at": round(times[k], 3), "level": level, "sent": send})
+                tables[(start, target)] = table
+            for k, step in enumerate(table):
+                if step["sent"]:
+                    calls.setdefault((k, step["level"]), []).append(key)
+                else:
+                    suppressed += 1
+            speakers[key] = {"start": start, "target": target, "steps": table}
+
+        return {
+            "duration": duration,
+            "curve": curve,
+            "step_interval": step_interval,
+            "speakers": speakers,
+            "calls": [
+                {"at": round(times[k], 3), "level": level, "entity_ids": keys}
+                for (k, level), keys in sorted(calls.items())
+            ],
+            "volume_set_calls": len(calls),
+            "suppressed_steps": suppressed,
+            "group_modes": fade.group_modes,
+            "skipped_speakers": [
+                {"entity_id": entity_id, "reason": reason}
+                for entity_id, reason in fade.skipped.items()
+            ],
+        }
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call *listener* when a fade starts, steps, is paused or resumed, or finishes."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def async_pause(self, entity_ids: list[str] | None = None) -> list[str]:
+        """
+        Hold the running fades on *entity_ids* (all fades if None) at their current level.
 
-    # Stepped fade loop — re-resolve and re-classify each step
-    for idx in range(total_steps):
-        step_resolved = _resolve_group_members(hass, entity_ids)
-        step_available, step_skipped = _classify_speakers(hass, step_resolved)
-        _record_skips(step_skipped)
+        :return: The command targets whose ramps were paused.
+        """
+        now = time.monotonic()
+        fades = [fade for fade in self._matching(entity_ids) if fade.paused_at is None]
+        for fade in fades:
+            fade.paused_at = now
+        return self._changed(fades)
 
-        if not step_available:
-            _LOGGER.warning("All speakers unavailable; stopping fade early")
-            break
+    @callback
+    def async_resume(self, entity_ids: list[str] | None = None) -> list[str]:
+        """
+        Continue paused fades on *entity_ids* (all if None) from where they were held.
 
-        t = (idx + 1) / total_steps
-        factor = _compute_curve_factor(t, curve)
-        vol_level = start_volume + factor * (target_volume - start_volume)
+        :return: The command targets whose ramps were resumed.
+        """
+        now = time.monotonic()
+        fades = [fade for fade in self._matching(entity_ids) if fade.paused_at is not None]
+        for fade in fades:
+            held = now - fade.paused_at
+            fade.paused_at = None
+            if fade.started is not None:
+                fade.started += held
+            if fade.next_tick is not None:
+                fade.next_tick += held
+        return self._changed(fades)
 
-        call_timeouts += await _guarded_volume_set(
-            hass, step_available, vol_level, volume_set_timeout
+    @callback
+    def async_abort(self, entity_ids: list[str] | None = None) -> list[str]:
+        """
+        Finish the fades on *entity_ids* (all if None), leaving speakers where they are.
+
+        :return: The command targets whose ramps were aborted.
+        """
+        fades = self._matching(entity_ids)
+        for fade in fades:
+            fade.aborted = True
+        keys = self._changed(fades)
+        for fade in fades:
+            self._finish(fade)
+        return keys
+
+    @callback
+    def async_suspend(self, entity_ids: list[str]) -> None:
+        """
+        Take the ramps on *entity_ids* (or groups containing them) away from their fades.
+
+        The owning fades keep running, so a suspended ramp is where it would have been
+        when it is handed back by :meth:`async_unsuspend`.  A native group ramp covering
+        only some of *entity_ids*' speakers is first split into per-member ramps, so the
+        other members keep following their fade.
+        """
+        wanted = set(entity_ids) | set(resolve_speakers(self.hass, entity_ids))
+        for key in self._keys_covering(entity_ids, self._ramps):
+            members = _group_members(self.hass, key)
+            if members and not wanted.issuperset(members):
+                self._split_group(key, members)
+        for key in self._keys_covering(entity_ids, self._ramps):
+            self._suspended[key] = self._ramps.pop(key)
+
+    @callback
+    def async_unsuspend(self, entity_ids: list[str]) -> None:
+        """Hand suspended ramps on *entity_ids* back to their fades, if still running."""
+        for key in self._keys_covering(entity_ids, self._suspended):
+            ramp = self._suspended.pop(key)
+            if ramp.fade in self._fades and key not in self._ramps:
+                # Sent on the next tick, whatever the level was before the suspension.
+                ramp.sent = None
+                self._ramps[key] = ramp
+        self._wake.set()
+
+    def suspended_level(self, entity_id: str, after: float = 0.0) -> float | None:
+        """
+        Return the level the ramp suspended on *entity_id* will be at *after* seconds from
+        now (its target once its fade has ended), or None if nothing is suspended there.
+        """
+        keys = self._keys_covering([entity_id], self._suspended)
+        if not keys:
+            return None
+        ramp = self._suspended[keys[0]]
+        fade = ramp.fade
+        if fade not in self._fades:
+            return ramp.target
+        t = min(fade.elapsed(time.monotonic() + after) / fade.duration, 1.0)
+        return ramp.start + _compute_curve_factor(t, fade.curve) * (ramp.target - ramp.start)
+
+    def progress(self) -> list[dict[str, Any]]:
+        """Level, progress and remaining seconds of every running fade."""
+        now = time.monotonic()
+        fades = []
+        for fade in self._fades:
+            ramps = {key: ramp for key, ramp in self._ramps.items() if ramp.fade is fade}
+            elapsed = fade.elapsed(now)
+            fades.append({
+                "entity_ids": sorted(ramps),
+                "levels": {key: ramp.sent for key, ramp in ramps.items()},
+                "targets": {key: ramp.target for key, ramp in ramps.items()},
+                "progress": round(min(elapsed / fade.duration, 1.0), 3),
+                "remaining": round(max(fade.duration - elapsed, 0.0), 1),
+                "paused": fade.paused_at is not None,
+            })
+        return fades
+
+    def async_stop(self) -> None:
+        """Finish every active fade and stop the tick loop (unloading or shutting down)."""
+        for fade in list(self._fades):
+            self._finish(fade)
+        self._suspended.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Loop counters and running fades for diagnostics."""
+        return {
+            "active_fades": len(self._fades),
+            "ramps": len(self._ramps),
+            "suspended_ramps": len(self._suspended),
+            "ticks": self.ticks,
+            "volume_set_calls": self.volume_set_calls,
+            "last_tick_ms": self.last_tick_ms,
+            "fades": self.progress(),
+        }
+
+    @callback
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    def _new_fade(
+        self,
+        entity_ids: list[str],
+        target_volume: float,
+        duration: float,
+        curve: str,
+        released: set[str] | None,
+        levels: dict[str, float] | None,
+        offsets: dict[str, float] | None,
+    ) -> _MixerFade:
+        fade = _MixerFade(
+            entity_ids,
+            target_volume,
+            duration,
+            curve,
+            released,
+            _expand_to_members(self.hass, levels),
+            _expand_to_members(self.hass, offsets),
         )
-        commanded.update(step_available)
-        await asyncio.sleep(_STEP_INTERVAL)
+        # A native group only takes one level, so members that need another are split out.
+        fade.individual = {
+            member
+            for entity_id in fade.entity_ids
+            for member in _group_members(self.hass, entity_id) or []
+            if abs(fade.target_for(member) - fade.target_for(entity_id)) > _LEVEL_TOLERANCE
+        }
+        return fade
+
+    def _matching(self, entity_ids: list[str] | None) -> list[_MixerFade]:
+        """Return the fades with a ramp on *entity_ids* or their speakers (all if None)."""
+        if entity_ids is None:
+            return list(self._fades)
+        wanted = set(entity_ids) | set(resolve_speakers(self.hass, entity_ids))
+        owners = {
+            id(ramp.fade): ramp.fade
+            for key, ramp in self._ramps.items()
+            if key in wanted or wanted & set(resolve_speakers(self.hass, [key]))
+        }
+        return [fade for fade in self._fades if id(fade) in owners]
 
-    # Final pin to exact target (guards against floating-point drift)
-    final_resolved = _resolve_group_members(hass, entity_ids)
-    final_available, final_skipped = _classify_speakers(hass, final_resolved)
-    _record_skips(final_skipped)
+    def _changed(self, fades: list[_MixerFade]) -> list[str]:
+        """Wake the loop and listeners after *fades* were paused, resumed or aborted."""
+        if not fades:
+            return []
+        self._wake.set()
+        self._notify()
+        return sorted(key for key, ramp in self._ramps.items() if ramp.fade in fades)
 
-    if final_available:
-        call_timeouts += await _guarded_volume_set(
-            hass, final_available, target_volume, volume_set_timeout
+    def _refresh(self, fade: _MixerFade) -> list[str]:
+        """Re-resolve and re-classify the fade's targets; return those available now."""
+        resolved, modes = _resolve_volume_targets(
+            self.hass, fade.entity_ids, fade.released, fade.individual
         )
-        commanded.update(final_available)
-    else:
-        _LOGGER.warning("All speakers unavailable; skipping final volume pin")
-
-    _LOGGER.debug(
-        "Fade complete: entities=%s final_vol=%.3f",
-        sorted(commanded),
-        target_volume,
-    )
+        fade.group_modes.update(modes)
+        available, skipped = _classify_speakers(self.hass, resolved, self.breakers)
+        fade.record_skips(skipped)
+        return available
 
-    return FadeResult(
-        commanded_speakers=sorted(commanded),
-        skipped_speakers=list(skipped_by_entity.items()),
-        call_timeouts=call_timeouts,
-    )
+    def _claim(self, fade: _MixerFade, key: str) -> None:
+        """Make *fade* the owner of *key*, replacing any ramp another fade had on it."""
+        if not fade.overlay:
+            self._discard_suspended([key])
+        known = get_known_volume(self.hass, key, self.shadow)
+        start = 0.0 if known is None else known
+        self._ramps[key] = _Ramp(fade, start, fade.target_for(key), sent=known)
+        fade.claimed.add(key)
+
+    def _split_group(self, key: str, members: list[str]) -> None:
+        """Replace the native group ramp on *key* with one ramp per member, on the same path."""
+        ramp = self._ramps.pop(key)
+        fade = ramp.fade
+        # Resolved per member from now on; see _resolve_volume_targets.
+        fade.individual.update(members)
+        fade.claimed.discard(key)
+        for member in members:
+            if member not in self._ramps:
+                self._ramps[member] = _Ramp(fade, ramp.start, ramp.target, sent=ramp.sent)
+            fade.claimed.add(member)
+
+    def _drop(self, keys: list[str], overlay: bool = False) -> None:
+        if not overlay:
+            self._discard_suspended(keys)
+        for key in keys:
+            self._ramps.pop(key, None)
+
+    def _discard_suspended(self, keys: list[str]) -> None:
+        for key in self._keys_covering(keys, self._suspended):
+            del self._suspended[key]
+
+    def _keys_covering(self, entity_ids: list[str], ramps: dict[str, "_Ramp"]) -> list[str]:
+        """Return the keys of *ramps* on *entity_ids*, their speakers, or their groups."""
+        if not ramps:
+            return []
+        wanted = set(entity_ids) | set(resolve_speakers(self.hass, entity_ids))
+        return [
+            key for key in ramps
+            if key in wanted or wanted & set(resolve_speakers(self.hass, [key]))
+        ]
+
+    def _finish(self, fade: _MixerFade) -> None:
+        if fade in self._fades:
+            self._fades.remove(fade)
+        for key in [k for k, ramp in self._ramps.items() if ramp.fade is fade]:
+            del self._ramps[key]
+        if not fade.done.done():
+            fade.done.set_result(None)
+        self._notify()
+
+    async def _send(self, entity_ids: list[str], volume_level: float) -> int:
+        self.volume_set_calls += 1
+        return await _guarded_volume_set(
+            self.hass,
+            entity_ids,
+            volume_level,
+            self.volume_set_timeout,
+            self.transport,
+            self.shadow,
+            self.breakers,
+        )
+
+    async def _async_run(self) -> None:
+        """Tick whenever a fade is due, sleeping in between; a new fade wakes the loop."""
+        while self._fades:
+            self._wake.clear()
+            tick_started = time.monotonic()
+            await self._async_tick(tick_started)
+            self.ticks += 1
+            self.last_tick_ms = round((time.monotonic() - tick_started) * 1000, 2)
+            if not self._fades:
+                break
+            running = [fade for fade in self._fades if fade.paused_at is None]
+            if not running:
+                # Everything is paused; wait for a resume, abort or new fade.
+                await self._wake.wait()
+                continue
+            due = min(fade.next_tick or tick_started for fade in running)
+            delay = due - time.monotonic()
+            if delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), delay)
+
+    async def _async_tick(self, now: float) -> None:
+        """Advance every due ramp to *now* and send one volume_set per distinct level."""
+        batches: dict[float, list[str]] = {}
+        owners: dict[str, _MixerFade] = {}
+        finished: list[_MixerFade] = []
+        for fade in list(self._fades):
+            if fade.paused_at is not None:
+                continue
+            if fade.next_tick is not None and fade.next_tick > now + _TICK_SLACK:
+                continue
+            available = self._refresh(fade)
+            for key in available:
+                if key not in fade.claimed:
+                    # A speaker that came back mid-fade ramps from its own level.
+                    self._claim(fade, key)
+            owned = [
+                key for key in available
+                if (ramp := self._ramps.get(key)) is not None and ramp.fade is fade
+            ]
+            if not owned:
+                if any(ramp.fade is fade for ramp in self._suspended.values()):
+                    # Every ramp is suspended; keep the clock running until they return.
+                    if fade.started is None:
+                        fade.started = now
+                    if fade.elapsed(now) >= fade.duration - _TICK_SLACK:
+                        finished.append(fade)
+                    fade.schedule_next(now)
+                    continue
+                if not available:
+                    _LOGGER.warning("All speakers unavailable; stopping fade early")
+                finished.append(fade)
+                continue
+            if fade.started is None:
+                fade.started = now
+                fade.step_interval = _step_interval(
+                    fade.duration,
+                    fade.curve,
+                    [(self._ramps[key].start, self._ramps[key].target) for key in owned],
+                )
+            fade.schedule_next(now)
+            fade_done = False
+            for key in owned:
+                ramp = self._ramps[key]
+                level, fade_done = fade.level_at(ramp, now)
+                level = round(level, _LEVEL_DECIMALS)
+                # Changes below the noticeable step are skipped; the final level is always sent.
+                if fade_done or ramp.sent is None or _noticeable(ramp.sent, level):
+                    ramp.sent = level
+                    batches.setdefault(level, []).append(key)
+                    owners[key] = fade
+            fade.commanded.update(owned)
+            if fade_done:
+                finished.append(fade)
+
+        levels = list(batches)
+        outcomes = await asyncio.gather(*(self._send(batches[level], level) for level in levels))
+        for level, timeouts in zip(levels, outcomes):
+            fades = {id(owners[key]): owners[key] for key in batches[level]}.values()
+            if len(fades) > 1:
+                for fade in fades:
+                    fade.merged = True
+            if timeouts:
+                for fade in fades:
+                    fade.call_timeouts += timeouts
+        for fade in finished:
+            self._finish(fade)
+        if batches:
+            self._notify()
+
+
+def _jnd_position(level: float) -> float:
+    """Return *level* on a scale where one unit is one just-noticeable step."""
+    if level <= _JND_KNEE:
+        return level / _JND_FLOOR
+    return _JND_KNEE / _JND_FLOOR + math.log(level / _JND_KNEE) / math.log(_JND_RATIO)
+
+
+def _noticeable(old: float, new: float) -> bool:
+    """Return True if going from *old* to *new* is at least one noticeable step."""
+    return abs(_jnd_position(new) - _jnd_position(old)) >= 1.0 - _JND_TOLERANCE
+
+
+def _step_interval(
+    duration: float, curve: str, ramps: Iterable[tuple[float, float]]
+) -> float:
+    """
+    Return the seconds between ticks for a fade of *ramps* ((start, end) pairs).
+
+    The steepest part of any ramp, measured in noticeable steps, moves about half a step
+    per tick; ticks that would not move a full step are skipped.  Ticks are never closer
+    than ``_STEP_INTERVAL`` nor further apart than ``_MAX_STEP_INTERVAL``: a 30-minute
+    fade from 0.05 to 0.35 ticks about every half minute instead of four times a second.
+    """
+    steepest = 0.0
+    for start, target in set(ramps):
+        prev = _jnd_position(start)
+        for i in range(1, _CURVE_SAMPLES + 1):
+            pos = _jnd_position(
+                start + _compute_curve_factor(i / _CURVE_SAMPLES, curve) * (target - start)
+            )
+            steepest = max(steepest, abs(pos - prev))
+            prev = pos
+    longest = min(max(duration, _STEP_INTERVAL), _MAX_STEP_INTERVAL)
+    if steepest <= 0.0:
+        return longest
+    interval = duration / (_CURVE_SAMPLES * steepest * _TICKS_PER_STEP)
+    return min(max(interval, _STEP_INTERVAL), longest)
+
+
+async def fade_volume(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    target_volume: float,
+    duration: float,
+    curve: str,
+    volume_set_timeout: float = VOLUME_SET_CALL_TIMEOUT,
+    transport: MusicAssistantTransport | None = None,
+    shadow: VolumeShadow | None = None,
+    released: set[str] | None = None,
+    breakers: SpeakerBreakers | None = None,
+) -> FadeResult:
+    """
+    Fade volume for the given entity IDs to target_volume over duration seconds.
+
+    Groups that support volume natively receive one command per step on the group
+    entity itself; other groups (those with a ``group_members`` attribute but no
+    volume support) are expanded and their members targeted individually.  Unavailable
+    speakers are skipped (and re-evaluated each step) so a single offline speaker never
+    blocks the fade; with *breakers*, neither does an online but unresponsive one.
+    The start level comes from *shadow* when a recent command exists,
+    so a fade that supersedes a cancelled one continues from where that one stopped.
+
+    This runs the fade on a private FadeMixer; integrations with many concurrent fades
+    share one mixer per entry and call FadeMixer.async_fade instead.
+
+    :param hass: Home Assistant instance.
+    :param entity_ids: Media-player entity IDs (may include groups).
+    :param target_volume: Desired end volume (0.0–1.0).
+    :param duration: Fade duration in seconds; anything shorter than one step (0.25 s)
+        jumps immediately.
+    :param curve: Easing curve — "logarithmic", "bezier", or "linear".
+    :param volume_set_timeout: Per-call timeout for each volume_set service call.
+    :param transport: Optional direct MA transport; speakers it cannot reach use HA services.
+    :param shadow: Optional record of commanded levels, read for the start level and updated
+        with every step.
+    :param released: Live set of speakers handed over to another operation mid-fade;
+        re-read every step and never commanded.
+    :param breakers: Optional per-speaker circuit breakers; quarantined speakers are skipped
+        with reason ``circuit_open`` until their half-open probe succeeds.
+    :return: FadeResult with details of commanded/skipped speakers, timeouts, the
+        volume path chosen for each group and any non-closed breakers.
+    """
+    mixer = FadeMixer(hass, transport, shadow, breakers, volume_set_timeout)
+    return await mixer.async_fade(entity_ids, target_volume, duration, curve, released)
 
 
 async def volume_set(
@@ -157,6 +1041,11 @@ async def volume_set(
     entity_ids: list[str],
     volume_level: float,
     volume_set_timeout: float = VOLUME_SET_CALL_TIMEOUT,
+    transport: MusicAssistantTransport | None = None,
+    shadow: VolumeShadow | None = None,
+    skip_if_at_level: bool = False,
+    released: set[str] | None = None,
+    breakers: SpeakerBreakers | None = None,
 ) -> FadeResult:
     """
     Availability-aware single volume_set — resolves groups, skips unavailable speakers.
@@ -168,12 +1057,17 @@ async def volume_set(
     :param entity_ids: Media-player entity IDs (may include groups).
     :param volume_level: Target volume (0.0–1.0).
     :param volume_set_timeout: Per-call timeout for the volume_set service call.
+    :param transport: Optional direct MA transport; speakers it cannot reach use HA services.
+    :param shadow: Optional record of commanded levels, updated with this command.
+    :param skip_if_at_level: Leave out speakers already known to be at *volume_level*.
+    :param released: Speakers handed over to another operation; never commanded.
+    :param breakers: Optional per-speaker circuit breakers; quarantined speakers are skipped.
     """
     if not entity_ids:
         return FadeResult()
 
-    resolved = _resolve_group_members(hass, entity_ids)
-    available, skipped = _classify_speakers(hass, resolved)
+    resolved, group_modes = _resolve_volume_targets(hass, entity_ids, released)
+    available, skipped = _classify_speakers(hass, resolved, breakers)
 
     if skipped:
         for entity_id, reason in skipped:
@@ -185,22 +1079,35 @@ async def volume_set(
 
     if not available:
         _LOGGER.warning("All speakers unavailable; skipping volume_set")
-        return FadeResult(skipped_speakers=skipped)
+        return FadeResult(skipped_speakers=skipped, group_modes=group_modes)
 
-    timeouts = await _guarded_volume_set(hass, available, volume_level, volume_set_timeout)
+    to_command = available
+    if skip_if_at_level:
+        to_command = [
+            eid for eid in available
+            if (known := get_known_volume(hass, eid, shadow)) is None
+            or abs(known - volume_level) > _LEVEL_TOLERANCE
+        ]
+        if not to_command:
+            _LOGGER.debug(
+                "volume_set skipped; speakers already at %.3f: %s", volume_level, available
+            )
+            return FadeResult(skipped_speakers=skipped, group_modes=group_modes)
+
+    timeouts = await _guarded_volume_set(
+        hass, to_command, volume_level, volume_set_timeout, transport, shadow, breakers
+    )
     return FadeResult(
-        commanded_speakers=sorted(available),
+        commanded_speakers=sorted(to_command),
         skipped_speakers=skipped,
         call_timeouts=timeouts,
+        group_modes=group_modes,
+        breaker_states=breakers.states_for(resolved) if breakers else {},
     )
 
 
-# ---------------------------------------------------------------------------
-# Private helpers
-# ---------------------------------------------------------------------------
-
-def _resolve_group_members(hass: HomeAssistant, entity_ids: list[str]) -> list[str]:
-    """Expand grouped media players into their individual members for per-speaker volume control."""
+def resolve_speakers(hass: HomeAssistant, entity_ids: list[str]) -> list[str]:
+    """Expand grouped media players into the physical speakers they contain."""
     resolved: list[str] = []
     for eid in entity_ids:
         state = hass.states.get(eid)
@@ -209,10 +1116,106 @@ def _resolve_group_members(hass: HomeAssistant, entity_ids: list[str]) -> list[s
             resolved.extend(m for m in members if isinstance(m, str))
         else:
             resolved.append(eid)
-    # Deduplicate while preserving order
+    return _dedupe(resolved)
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _resolve_volume_targets(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    released: set[str] | None = None,
+    individual: set[str] | None = None,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Resolve entity IDs to the entities that should receive volume commands.
+
+    A group that supports volume natively is kept as a single target and any of its
+    members listed alongside it are dropped, so each speaker is commanded once.  Other
+    groups are expanded into their members.  Speakers in *released* have been handed to
+    another operation and are never returned; a native group with a released member, or
+    with a member in *individual* (one that needs its own level), is controlled per
+    member instead.
+
+    :return: (command_targets, {group_entity_id: GROUP_MODE_NATIVE | GROUP_MODE_PER_MEMBER})
+    """
+    released = released or set()
+    individual = individual or set()
+    group_modes: dict[str, str] = {}
+    natively_covered: set[str] = set()
+    for eid in entity_ids:
+        members = _group_members(hass, eid)
+        if members is None:
+            continue
+        if (
+            released.isdisjoint(members)
+            and individual.isdisjoint(members)
+            and _supports_group_volume(hass, eid, members)
+        ):
+            group_modes[eid] = GROUP_MODE_NATIVE
+            natively_covered.update(members)
+        else:
+            group_modes[eid] = GROUP_MODE_PER_MEMBER
+
+    resolved: list[str] = []
+    for eid in entity_ids:
+        mode = group_modes.get(eid)
+        if mode == GROUP_MODE_NATIVE:
+            resolved.append(eid)
+        elif mode == GROUP_MODE_PER_MEMBER:
+            resolved.extend(m for m in _group_members(hass, eid) or [] if m not in natively_covered)
+        elif eid not in natively_covered:
+            resolved.append(eid)
+    return [eid for eid in _dedupe(resolved) if eid not in released], group_modes
+
+
+def _expand_to_members(
+    hass: HomeAssistant, values: dict[str, float] | None
+) -> dict[str, float]:
+    """Copy a per-entity map, giving group members the group's value unless listed."""
+    expanded = dict(values or {})
+    for entity_id, value in (values or {}).items():
+        for member in _group_members(hass, entity_id) or []:
+            expanded.setdefault(member, value)
+    return expanded
+
+
+def _group_members(hass: HomeAssistant, entity_id: str) -> list[str] | None:
+    """Return the string members of a grouped media player, or None if it is not a group."""
+    state = hass.states.get(entity_id)
+    members = state and state.attributes.get("group_members")
+    if members and isinstance(members, list):
+        return [m for m in members if isinstance(m, str)]
+    return None
+
+
+def _supports_group_volume(hass: HomeAssistant, entity_id: str, members: list[str]) -> bool:
+    """
+    Return True if a group entity can take a single volume command for all its members.
+
+    A sync leader lists itself in ``group_members`` and its volume_set only reaches its
+    own speaker, so only dedicated group players qualify.  The group must advertise
+    VOLUME_SET and report a volume level (MA sync groups do neither before playback).
+    """
+    if entity_id in members:
+        return False
+    state = hass.states.get(entity_id)
+    if state is None or state.attributes.get("volume_level") is None:
+        return False
+    try:
+        features = int(state.attributes.get("supported_features", 0))
+    except (TypeError, ValueError):
+        return False
+    return bool(features & MediaPlayerEntityFeature.VOLUME_SET)
+
+
+def _dedupe(entity_ids: list[str]) -> list[str]:
+    """Deduplicate entity IDs while preserving order."""
     seen: set[str] = set()
     unique: list[str] = []
-    for eid in resolved:
+    for eid in entity_ids:
         if eid not in seen:
             seen.add(eid)
             unique.append(eid)
@@ -222,6 +1225,7 @@ def _resolve_group_members(hass: HomeAssistant, entity_ids: list[str]) -> list[s
 def _classify_speakers(
     hass: HomeAssistant,
     entity_ids: list[str],
+    breakers: SpeakerBreakers | None = None,
 ) -> tuple[list[str], list[tuple[str, str]]]:
     """Split speakers into commandable and skipped groups with skip reasons."""
     available: list[str] = []
@@ -237,6 +1241,9 @@ def _classify_speakers(
         if state.state == "unknown":
             skipped.append((entity_id, "state_unknown"))
             continue
+        if breakers is not None and breakers.is_quarantined(entity_id):
+            skipped.append((entity_id, "circuit_open"))
+            continue
         available.append(entity_id)
     return available, skipped
 
@@ -246,16 +1253,72 @@ async def _guarded_volume_set(
     entity_ids: list[str],
     volume_level: float,
     call_timeout: float,
+    transport: MusicAssistantTransport | None = None,
+    shadow: VolumeShadow | None = None,
+    breakers: SpeakerBreakers | None = None,
 ) -> int:
     """
     Call media_player.volume_set with a timeout guard.
 
+    When a connected transport is given, MA players are commanded over it without
+    waiting for an ack and only the remaining entities go through the service call.
+    With *breakers*, half-open speakers are probed in their own short call alongside
+    the main batch, and timeouts are attributed to the speakers that did not report
+    the new level.
+
     :param hass: Home Assistant instance.
     :param entity_ids: Already-resolved, already-classified available entity IDs.
     :param volume_level: Target volume (0.0–1.0).
     :param call_timeout: Maximum seconds to wait for the service call.
-    :return: 1 if the call timed out, 0 otherwise.
+    :param transport: Optional direct MA transport.
+    :param shadow: Optional record of commanded levels, updated before the call is sent.
+    :param breakers: Optional per-speaker circuit breakers, updated with the outcome.
+    :return: Number of service calls that timed out.
     """
+    if shadow is not None:
+        shadow.record(entity_ids, volume_level)
+    if transport is not None:
+        entity_ids = await transport.volume_set(entity_ids, volume_level)
+    if not entity_ids:
+        return 0
+    if breakers is None:
+        return 0 if await _call_volume_set(hass, entity_ids, volume_level, call_timeout) else 1
+
+    normal, probes = breakers.split_probes(entity_ids)
+    batches = ([normal] if normal else []) + [[probe] for probe in probes]
+    outcomes = await asyncio.gather(*(
+        _call_volume_set(
+            hass,
+            batch,
+            volume_level,
+            call_timeout if batch is normal else min(call_timeout, _BREAKER_PROBE_TIMEOUT),
+        )
+        for batch in batches
+    ))
+
+    timeouts = 0
+    for batch, ok in zip(batches, outcomes):
+        if ok:
+            breakers.record_success(batch)
+            continue
+        timeouts += 1
+        responded = [
+            eid for eid in batch
+            if (known := get_known_volume(hass, eid)) is not None
+            and abs(known - volume_level) <= _LEVEL_TOLERANCE
+        ]
+        breakers.record_success(responded)
+        breakers.record_timeout([eid for eid in batch if eid not in responded])
+    return timeouts
+
+
+async def _call_volume_set(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    volume_level: float,
+    call_timeout: float,
+) -> bool:
+    """Send one blocking media_player.volume_set; return False if it timed out."""
     try:
         await asyncio.wait_for(
             hass.services.async_call(
@@ -266,25 +1329,39 @@ async def _guarded_volume_set(
             ),
             timeout=call_timeout,
         )
-        return 0
+        return True
     except asyncio.TimeoutError:
         _LOGGER.warning(
             "volume_set call timed out: entities=%s timeout=%.1fs",
             entity_ids,
             call_timeout,
         )
-        return 1
+        return False
 
 
-def _get_current_volume(hass: HomeAssistant, entity_id: str) -> float:
-    """Return current volume_level from HA state, defaulting to 0.0 if unavailable."""
+def _get_current_volume(
+    hass: HomeAssistant, entity_id: str, shadow: VolumeShadow | None = None
+) -> float:
+    """Return the speaker's known volume (see get_known_volume), defaulting to 0.0."""
+    level = get_known_volume(hass, entity_id, shadow)
+    return 0.0 if level is None else level
+
+
+def get_known_volume(
+    hass: HomeAssistant, entity_id: str, shadow: VolumeShadow | None = None
+) -> float | None:
+    """Return the recently commanded level if any, else volume_level from HA state, else None."""
+    if shadow is not None:
+        level = shadow.recent_level(entity_id)
+        if level is not None:
+            return level
     state = hass.states.get(entity_id)
     if state is None:
-        return 0.0
+        return None
     try:
-        return float(state.attributes.get("volume_level", 0.0))
-    except (TypeError, ValueError):
-        return 0.0
+        return float(state.attributes["volume_level"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def _compute_curve_factor(t: float, curve: str) -> float:
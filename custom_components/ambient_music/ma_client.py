@@ -0,0 +1,207 @@
+"""Direct Music Assistant websocket transport — pipelined volume and queue commands."""
+
+import asyncio
+import itertools
+import logging
+from typing import Iterable
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+MA_DOMAINS = ("music_assistant", "mass")
+
+_RECONNECT_DELAYS: tuple[int, ...] = (1, 2, 5, 10, 30, 60)
+_SERVER_INFO_TIMEOUT: float = 10.0
+_MAX_PENDING: int = 256
+
+
+def async_get_server_url(hass: HomeAssistant) -> str | None:
+    """Return the websocket URL of the first configured Music Assistant server, if any."""
+    for domain in MA_DOMAINS:
+        for ma_entry in hass.config_entries.async_entries(domain):
+            url = ma_entry.data.get("url")
+            if url:
+                return to_ws_url(url)
+    return None
+
+
+def to_ws_url(url: str) -> str:
+    """Convert an MA server base URL (http/https/ws/wss) into its ``/ws`` endpoint."""
+    ws_url = url.strip().rstrip("/")
+    if ws_url.startswith("http"):
+        ws_url = "ws" + ws_url[len("http"):]
+    if not ws_url.endswith("/ws"):
+        ws_url += "/ws"
+    return ws_url
+
+
+class MusicAssistantTransport:
+    """
+    Persistent websocket to a Music Assistant server.
+
+    Commands are written to the socket without waiting for the server's ack; acks are
+    consumed by the listener and only used to log errors.  Every public command returns
+    the entity IDs it could not handle (not connected, not an MA player, or a failed
+    write) so the caller can send those through Home Assistant services instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """
+        :param hass: Home Assistant instance.
+        :param url: Websocket URL of the MA server (e.g. ``ws://host:8095/ws``).
+        :param session: Optional aiohttp session; defaults to Home Assistant's shared one.
+        """
+        self.hass = hass
+        self.url = url
+        self._session = session
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._message_ids = itertools.count(1)
+        self._pending: dict[str, str] = {}
+        self._stopped = False
+        self.server_info: dict = {}
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the websocket is open and the server handshake has completed."""
+        return self._ws is not None and not self._ws.closed
+
+    async def async_run(self) -> None:
+        """Keep the websocket connected, reconnecting with backoff until stopped."""
+        attempt = 0
+        while not self._stopped:
+            try:
+                await self._connect_and_listen()
+                attempt = 0
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug("Music Assistant websocket error at %s: %s", self.url, err)
+            finally:
+                self._ws = None
+                self._pending.clear()
+
+            if self._stopped:
+                break
+            delay = _RECONNECT_DELAYS[min(attempt, len(_RECONNECT_DELAYS) - 1)]
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def async_stop(self) -> None:
+        """Stop reconnecting and close the websocket."""
+        self._stopped = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def _connect_and_listen(self) -> None:
+        """Connect, read the server-info handshake, then consume acks until the socket closes."""
+        session = self._session or async_get_clientsession(self.hass)
+        async with session.ws_connect(self.url, heartbeat=30) as ws:
+            self.server_info = await ws.receive_json(timeout=_SERVER_INFO_TIMEOUT)
+            self._ws = ws
+            _LOGGER.debug(
+                "Connected to Music Assistant at %s (server_version=%s)",
+                self.url,
+                self.server_info.get("server_version"),
+            )
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self._handle_message(msg.json())
+                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+
+    def _handle_message(self, data: dict) -> None:
+        """Match an ack to its pending command and log server-side errors; ignore events."""
+        message_id = data.get("message_id")
+        if message_id is None:
+            return
+        command = self._pending.pop(str(message_id), None)
+        if "error_code" in data:
+            _LOGGER.debug(
+                "Music Assistant command failed: command=%s error_code=%s details=%s",
+                command,
+                data.get("error_code"),
+                data.get("details"),
+            )
+
+    async def _send(self, command: str, **args) -> bool:
+        """Write one command to the socket without waiting for its ack; return False on failure."""
+        ws = self._ws
+        if ws is None or ws.closed:
+            return False
+        message_id = str(next(self._message_ids))
+        if len(self._pending) >= _MAX_PENDING:
+            self._pending.pop(next(iter(self._pending)))
+        self._pending[message_id] = command
+        try:
+            await ws.send_json({"message_id": message_id, "command": command, "args": args})
+        except (aiohttp.ClientError, ConnectionResetError) as err:
+            self._pending.pop(message_id, None)
+            _LOGGER.debug("Music Assistant send failed: command=%s error=%s", command, err)
+            return False
+        return True
+
+    def _player_ids(self, entity_ids: Iterable[str]) -> tuple[dict[str, str], list[str]]:
+        """Split entity IDs into {entity_id: ma_player_id} and those that are not MA players."""
+        ent_reg = er.async_get(self.hass)
+        mapped: dict[str, str] = {}
+        unmapped: list[str] = []
+        for entity_id in entity_ids:
+            reg_entry = ent_reg.async_get(entity_id)
+            if reg_entry and reg_entry.platform in MA_DOMAINS and reg_entry.unique_id:
+                mapped[entity_id] = reg_entry.unique_id
+            else:
+                unmapped.append(entity_id)
+        return mapped, unmapped
+
+    async def _fan_out(
+        self, entity_ids: Iterable[str], command: str, id_key: str, **args
+    ) -> list[str]:
+        """Send *command* once per MA player; return the entity IDs left for HA services."""
+        if not self.connected:
+            return list(entity_ids)
+        mapped, fallback = self._player_ids(entity_ids)
+        for entity_id, player_id in mapped.items():
+            if not await self._send(command, **{id_key: player_id}, **args):
+                fallback.append(entity_id)
+        return fallback
+
+    async def volume_set(self, entity_ids: Iterable[str], volume_level: float) -> list[str]:
+        """Set volume (0.0–1.0) on each player; return entity IDs that were not handled."""
+        return await self._fan_out(
+            entity_ids,
+            "players/cmd/volume_set",
+            "player_id",
+            volume_level=round(float(volume_level) * 100),
+        )
+
+    async def play_media(
+        self, entity_ids: Iterable[str], uri: str, radio_mode: bool = False
+    ) -> list[str]:
+        """Replace each player's queue with *uri*; return entity IDs that were not handled."""
+        return await self._fan_out(
+            entity_ids,
+            "player_queues/play_media",
+            "queue_id",
+            media=uri,
+            option="replace",
+            radio_mode=bool(radio_mode),
+        )
+
+    async def repeat(self, entity_ids: Iterable[str], mode: str) -> list[str]:
+        """Set the queue repeat mode; return entity IDs that were not handled."""
+        return await self._fan_out(
+            entity_ids, "player_queues/repeat", "queue_id", repeat_mode=str(mode)
+        )
+
+    async def shuffle(self, entity_ids: Iterable[str], shuffle: bool = True) -> list[str]:
+        """Enable or disable queue shuffle; return entity IDs that were not handled."""
+        return await self._fan_out(
+            entity_ids, "player_queues/shuffle", "queue_id", shuffle_enabled=bool(shuffle)
+        )
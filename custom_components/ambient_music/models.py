@@ -0,0 +1,28 @@
+"""Runtime objects shared by the services, platforms and diagnostics of one config entry."""
+
+from dataclasses import dataclass, field
+
+from .ducking import DuckController
+from .fade_engine import FadeMixer, SpeakerBreakers, VolumeShadow
+from .ma_client import MusicAssistantTransport
+from .playback import PlaybackZone
+from .scheduler import ScheduleEngine
+from .store import RuntimeStore
+from .watchers import StateWatchers
+
+
+@dataclass
+class AmbientMusicData:
+    """Per-entry runtime state, stored in ``hass.data[DOMAIN][entry_id]``."""
+
+    volume_shadow: VolumeShadow = field(default_factory=VolumeShadow)
+    breakers: SpeakerBreakers = field(default_factory=SpeakerBreakers)
+    transport: MusicAssistantTransport | None = None
+    mixer: FadeMixer | None = None
+    ducker: DuckController | None = None
+    scheduler: ScheduleEngine | None = None
+    store: RuntimeStore | None = None
+    options: dict = field(default_factory=dict)
+    setup_timings: dict[str, float] = field(default_factory=dict)
+    watchers: StateWatchers | None = None
+    zone: PlaybackZone | None = None
@@ -0,0 +1,149 @@
+"""Playback state machine — one zone per entry, collapsing playlist requests to the latest."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_IDLE = "idle"
+STATE_FADING_DOWN = "fading_down"
+STATE_STARTING = "starting"
+STATE_PLAYING = "playing"
+STATE_STOPPING = "stopping"
+
+
+class PlaybackZone:
+    """
+    Playback state of the speakers one config entry controls.
+
+    Every fade-down, start and stop runs as a phase (``fading_down``, ``starting``,
+    ``stopping``) that settles into ``idle`` or ``playing``.  Playlist requests are not
+    queued: only the latest one is kept, and it is acted on once no phase is running, so
+    clicking through five playlists fades down once and starts only the last.
+    """
+
+    def __init__(
+        self,
+        fade_down: Callable[[], Awaitable[Any]],
+        start: Callable[[], Awaitable[Any]],
+        can_start: Callable[[], bool],
+        is_audible: Callable[[], bool],
+    ) -> None:
+        """
+        :param fade_down: Coroutine function that silences and pauses the zone's speakers.
+        :param start: Coroutine function that starts the selected playlist; returns None
+            if nothing was started.
+        :param can_start: Return True while playback is allowed (blockers clear).
+        :param is_audible: Return True if any speaker is playing, used while ``idle`` to
+            catch playback this zone did not start (e.g. before a restart).
+        """
+        self._fade_down = fade_down
+        self._start = start
+        self._can_start = can_start
+        self._is_audible = is_audible
+        self.state = STATE_IDLE
+        self.requested: str | None = None
+        self.collapsed = 0
+        self._phase = 0
+        self._running_phases = 0
+        self._settled = asyncio.Event()
+        self._settled.set()
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call *listener* whenever the state or the pending request changes."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            _LOGGER.debug("Playback state %s -> %s", self.state, state)
+            self.state = state
+            self._notify()
+
+    async def async_run_phase(
+        self, state: str, job: Callable[[], Awaitable[Any]], settled_state: str
+    ) -> Any:
+        """
+        Run *job* as a *state* phase, settle into *settled_state* and return the job's result.
+
+        A job returning None did nothing, so the zone returns to its previous state.
+        When phases overlap (a service call taking speakers over), the newest one decides
+        the state.
+        """
+        self._phase += 1
+        phase = self._phase
+        previous = self.state
+        self._running_phases += 1
+        self._settled.clear()
+        self._set_state(state)
+        result = None
+        try:
+            result = await job()
+        finally:
+            self._running_phases -= 1
+            if self._running_phases == 0:
+                self._settled.set()
+            if self._phase == phase:
+                self._set_state(previous if result is None else settled_state)
+        return result
+
+    @callback
+    def async_request(self, option: str) -> None:
+        """Record *option* as the playlist to start, replacing any request still pending."""
+        if self.requested is not None:
+            self.collapsed += 1
+            _LOGGER.debug("Playlist request '%s' superseded by '%s'", self.requested, option)
+        self.requested = option
+        self._notify()
+
+    @callback
+    def async_clear_request(self) -> None:
+        """Drop the pending request (playback is being stopped)."""
+        if self.requested is not None:
+            self.requested = None
+            self._notify()
+
+    async def async_process_requests(self) -> None:
+        """
+        Act on the latest request at the next safe point.
+
+        Waits for the running phase to finish, fades the zone down if it is playing,
+        then starts whatever was requested last by the time the fade-down finished.
+        """
+        silenced = False
+        while self.requested is not None:
+            await self._settled.wait()
+            if self.requested is None:
+                return
+            if not self._can_start():
+                self.async_clear_request()
+                return
+            if not silenced and (
+                self.state == STATE_PLAYING
+                or (self.state == STATE_IDLE and self._is_audible())
+            ):
+                await self.async_run_phase(STATE_FADING_DOWN, self._fade_down, STATE_IDLE)
+                silenced = True
+                continue
+            self.async_clear_request()
+            await self.async_run_phase(STATE_STARTING, self._start, STATE_PLAYING)
+            silenced = False
+
+    def as_dict(self) -> dict:
+        """State summary for entity attributes and diagnostics."""
+        return {
+            "state": self.state,
+            "requested_playlist": self.requested,
+            "collapsed_requests": self.collapsed,
+        }
@@ -0,0 +1,125 @@
+"""Bulk playlist import — parses pasted lines, CSV/JSON files and library listings."""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .providers import PlaylistRecord, build_playlist_record, parse_playlist_input
+
+MAX_IMPORT_FILE_BYTES: int = 1_000_000
+_RADIO_TRUE = {"1", "true", "yes", "y", "on", "radio"}
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of validating one import batch.
+
+    :param playlists: Valid new playlists, {name: record}, in input order.
+    :param errors: Human-readable problems, one per rejected line.
+    """
+
+    playlists: dict[str, PlaylistRecord] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+
+def _split_line(line: str) -> list[str]:
+    """Split a pasted line on tab, pipe or comma (first one present), in that order."""
+    for delimiter in ("\t", "|"):
+        if delimiter in line:
+            return [part.strip() for part in line.split(delimiter)]
+    return [part.strip() for part in next(csv.reader([line]), [])]
+
+
+def rows_from_text(text: str) -> list[tuple[str, list[str]]]:
+    """
+    Turn pasted text or CSV content into (label, [name, id_or_url, radio]) rows.
+
+    Blank lines and lines starting with ``#`` are skipped, as is a leading
+    ``name,...`` header row.
+    """
+    rows: list[tuple[str, list[str]]] = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        parts = _split_line(stripped)
+        if not rows and parts and parts[0].lower() == "name":
+            continue
+        rows.append((f"Line {number}", parts))
+    return rows
+
+
+def rows_from_json(text: str) -> list[tuple[str, list[str]]]:
+    """
+    Turn JSON content into rows.
+
+    Accepts ``{name: id_or_url}`` or ``[{"name", "id" or "url", "radio_mode"}, ...]``.
+
+    :raises ValueError: If the content is not valid JSON of either shape.
+    """
+    data = json.loads(text)
+    if isinstance(data, dict):
+        return [(f"Entry '{name}'", [str(name), str(value)]) for name, value in data.items()]
+    if not isinstance(data, list):
+        raise ValueError("JSON must be an object or a list")
+    rows: list[tuple[str, list[str]]] = []
+    for index, item in enumerate(data, start=1):
+        if not isinstance(item, dict):
+            rows.append((f"Entry {index}", []))
+            continue
+        raw = item.get("url") or item.get("uri") or item.get("id") or ""
+        radio = "true" if item.get("radio_mode") else ""
+        rows.append((f"Entry {index}", [str(item.get("name", "")), str(raw), radio]))
+    return rows
+
+
+def rows_from_file(path: str) -> list[tuple[str, list[str]]]:
+    """
+    Read a local CSV or JSON file into rows (blocking; run in the executor).
+
+    :raises OSError: If the file cannot be read.
+    :raises ValueError: If the file is too large or its JSON is invalid.
+    """
+    with open(path, encoding="utf-8") as handle:
+        text = handle.read(MAX_IMPORT_FILE_BYTES + 1)
+    if len(text) > MAX_IMPORT_FILE_BYTES:
+        raise ValueError("file is larger than 1 MB")
+    if path.lower().endswith(".json") or text.lstrip().startswith(("{", "[")):
+        return rows_from_json(text)
+    return rows_from_text(text)
+
+
+def validate_rows(
+    rows: Iterable[tuple[str, list[str]]],
+    existing_names: Iterable[str],
+    default_radio_mode: bool = False,
+) -> ImportResult:
+    """
+    Validate every row in one pass with the provider parser.
+
+    Names must be non-empty and unique (case-insensitive) against existing playlists and
+    the rest of the batch; IDs/URLs must be recognised by a provider.
+    """
+    result = ImportResult()
+    taken = {name.lower() for name in existing_names}
+    for label, parts in rows:
+        name = parts[0] if parts else ""
+        raw = parts[1] if len(parts) > 1 else ""
+        if not name:
+            result.errors.append(f"{label}: missing playlist name")
+            continue
+        if name.lower() in taken:
+            result.errors.append(f"{label}: '{name}' already exists")
+            continue
+        provider_name, playlist_id = parse_playlist_input(raw)
+        if not playlist_id:
+            result.errors.append(f"{label}: '{raw}' is not a recognised playlist ID or URL")
+            continue
+        radio = default_radio_mode
+        if len(parts) > 2 and parts[2]:
+            radio = parts[2].strip().lower() in _RADIO_TRUE
+        taken.add(name.lower())
+        result.playlists[name] = build_playlist_record(playlist_id, provider_name, radio)
+    return result
@@ -1,8 +1,8 @@
-"""Playlist provider definitions — ID patterns, URL extraction, and URI templates."""
+"""Playlist providers — ID patterns, URL extraction, URI templates and stored records."""
 
 import re
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, NotRequired, Optional, TypedDict
 
 
 @dataclass
@@ -123,6 +123,12 @@ def get_provider_for_id(playlist_id: str) -> Optional[PlaylistProvider]:
     
     return None
 
+def matching_providers(playlist_id: str) -> list[str]:
+    """Return every provider whose id_pattern matches a bare ID (more than one is ambiguous)."""
+    if not playlist_id:
+        return []
+    return [name for name, p in PROVIDERS.items() if p.id_pattern.fullmatch(playlist_id)]
+
 def parse_playlist_input(text: str) -> tuple[Optional[str], str]:
     """
     Parse user input (bare ID or URL) into a (provider_name, playlist_id) tuple.
@@ -147,14 +153,64 @@ def parse_playlist_input(text: str) -> tuple[Optional[str], str]:
     
     return None, ""
 
-def playlist_id_to_uri(playlist_id: str) -> tuple[Optional[str], str]:
-    """Convert a bare playlist ID to a (provider_name, playback_uri) tuple."""
-    if not playlist_id:
-        return None, ""
-    
-    provider = get_provider_for_id(playlist_id)
-    if not provider:
-        return None, ""
-    
-    uri = provider.uri_template.format(id=playlist_id)
-    return provider.name, uri
+def build_playlist_uri(provider_name: str, playlist_id: str) -> str:
+    """Build the playback URI from a known provider's scheme; empty if either is unknown."""
+    provider = PROVIDERS.get(provider_name)
+    if provider is None or not playlist_id:
+        return ""
+    return provider.uri_template.format(id=playlist_id)
+
+
+class PlaylistRecord(TypedDict):
+    """Stored form of one configured playlist (options schema version 2 and later)."""
+
+    id: str
+    provider: str
+    uri: str
+    radio_mode: bool
+    provider_guessed: NotRequired[bool]
+
+
+def build_playlist_record(
+    playlist_id: str, provider_name: Optional[str], radio_mode: bool = False
+) -> PlaylistRecord:
+    """
+    Build the stored record for a playlist whose provider is already known.
+
+    :param playlist_id: Bare playlist ID.
+    :param provider_name: Provider key, as returned by parse_playlist_input.
+    :param radio_mode: Whether Music Assistant radio mode is enabled.
+    """
+    provider_name = provider_name if provider_name in PROVIDERS else ""
+    return PlaylistRecord(
+        id=playlist_id,
+        provider=provider_name,
+        uri=build_playlist_uri(provider_name, playlist_id),
+        radio_mode=bool(radio_mode),
+    )
+
+
+def repair_playlist_record(record: dict) -> tuple[PlaylistRecord, list[str]]:
+    """
+    Check a stored record against the provider patterns and fix its provider and URI.
+
+    A stored provider whose pattern matches the ID is trusted, unless the record is
+    flagged ``provider_guessed``.  Otherwise the provider is guessed from the ID alone;
+    the returned list holds the other candidates when that guess was ambiguous (e.g.
+    numeric IDs valid for Deezer and Qobuz), and the repaired record keeps the flag.
+    """
+    playlist_id = str(record.get("id", "") or "")
+    provider_name = record.get("provider")
+    candidates = matching_providers(playlist_id)
+    others: list[str] = []
+    if provider_name not in candidates:
+        provider_name = candidates[0] if candidates else ""
+        others = candidates[1:]
+    elif record.get("provider_guessed"):
+        others = [name for name in candidates if name != provider_name]
+    repaired = build_playlist_record(
+        playlist_id, provider_name, bool(record.get("radio_mode", False))
+    )
+    if others:
+        repaired["provider_guessed"] = True
+    return repaired, others
@@ -0,0 +1,351 @@
+"""Weekly schedule engine — turns playlist, volume and enabled windows into timed transitions."""
+
+import bisect
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    SCHEDULE_DAYS,
+    SCHEDULE_ENABLED,
+    SCHEDULE_END,
+    SCHEDULE_NAME,
+    SCHEDULE_PLAYLIST,
+    SCHEDULE_PRIORITY,
+    SCHEDULE_START,
+    SCHEDULE_VOLUME,
+    WEEKDAYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_DAY_SECONDS = 86400
+_WEEK_SECONDS = 7 * _DAY_SECONDS
+
+SELECT_ENTITY_ID = "select.ambient_music_playlists"
+VOLUME_ENTITY_ID = "number.ambient_music_default_volume"
+MASTER_SWITCH_ENTITY_ID = "switch.ambient_music_master_enable"
+
+
+def parse_time(value) -> int | None:
+    """Convert "HH:MM" or "HH:MM:SS" into seconds since midnight, or None if invalid."""
+    try:
+        parts = [int(p) for p in str(value).split(":")]
+    except ValueError:
+        return None
+    if len(parts) not in (2, 3):
+        return None
+    hours, minutes, seconds = parts[0], parts[1], parts[2] if len(parts) == 3 else 0
+    if not (0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 60):
+        return None
+    return hours * 3600 + minutes * 60 + seconds
+
+
+@dataclass(frozen=True)
+class ScheduleWindow:
+    """
+    One recurring window of the weekly schedule.
+
+    :param name: Display name.
+    :param days: Weekday indexes (0 = Monday) on which the window starts.
+    :param start: Start, in seconds since local midnight.
+    :param end: End, in seconds since local midnight; at or before *start* means it ends
+        the following day.
+    :param playlist: Playlist to select while active, or None to leave it alone.
+    :param volume: Default volume to set while active, or None.
+    :param enabled: Master enable state while active, or None.
+    :param priority: Higher priorities override lower ones field by field.
+    """
+
+    name: str
+    days: tuple[int, ...]
+    start: int
+    end: int
+    playlist: str | None = None
+    volume: float | None = None
+    enabled: bool | None = None
+    priority: int = 0
+
+    @classmethod
+    def from_option(cls, raw: dict) -> "ScheduleWindow | None":
+        """Build a window from its stored options dict; return None if it is malformed."""
+        start = parse_time(raw.get(SCHEDULE_START))
+        end = parse_time(raw.get(SCHEDULE_END))
+        days = tuple(sorted(
+            {WEEKDAYS.index(d) for d in raw.get(SCHEDULE_DAYS, []) if d in WEEKDAYS}
+        ))
+        if start is None or end is None or not days:
+            return None
+        volume = raw.get(SCHEDULE_VOLUME)
+        enabled = raw.get(SCHEDULE_ENABLED)
+        return cls(
+            name=str(raw.get(SCHEDULE_NAME, "")),
+            days=days,
+            start=start,
+            end=end,
+            playlist=raw.get(SCHEDULE_PLAYLIST) or None,
+            volume=float(volume) if volume is not None else None,
+            enabled=enabled if isinstance(enabled, bool) else None,
+            priority=int(raw.get(SCHEDULE_PRIORITY, 0) or 0),
+        )
+
+    def spans(self) -> list[tuple[int, int]]:
+        """Return the window's [start, end) intervals as seconds since Monday 00:00."""
+        length = (self.end - self.start) % _DAY_SECONDS or _DAY_SECONDS
+        spans: list[tuple[int, int]] = []
+        for day in self.days:
+            start = day * _DAY_SECONDS + self.start
+            end = start + length
+            if end > _WEEK_SECONDS:
+                spans.append((start, _WEEK_SECONDS))
+                spans.append((0, end - _WEEK_SECONDS))
+            else:
+                spans.append((start, end))
+        return spans
+
+
+@dataclass(frozen=True)
+class ScheduleSettings:
+    """Effective overrides at one point of the week; None means "not scheduled"."""
+
+    playlist: str | None = None
+    volume: float | None = None
+    enabled: bool | None = None
+    windows: tuple[str, ...] = field(default=(), compare=False)
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A point of the week (seconds since Monday 00:00 local) where the settings change."""
+
+    offset: int
+    settings: ScheduleSettings
+
+
+def _resolve_settings(active: list[ScheduleWindow]) -> ScheduleSettings:
+    """Merge active windows field by field, the highest priority winning each field."""
+    ordered = sorted(active, key=lambda w: -w.priority)
+    return ScheduleSettings(
+        playlist=next((w.playlist for w in ordered if w.playlist is not None), None),
+        volume=next((w.volume for w in ordered if w.volume is not None), None),
+        enabled=next((w.enabled for w in ordered if w.enabled is not None), None),
+        windows=tuple(w.name for w in ordered),
+    )
+
+
+def compile_timeline(windows: list[ScheduleWindow]) -> list[Transition]:
+    """
+    Compile windows into a sorted, cyclic list of transitions.
+
+    Every window start and end is a candidate boundary; boundaries where the merged
+    settings do not change are dropped, so each remaining entry is a real change.
+    """
+    spans = [(start, end, w) for w in windows for start, end in w.spans()]
+    if not spans:
+        return []
+    boundaries = sorted(
+        {start for start, _, _ in spans} | {end % _WEEK_SECONDS for _, end, _ in spans}
+    )
+    timeline = [
+        Transition(b, _resolve_settings([w for start, end, w in spans if start <= b < end]))
+        for b in boundaries
+    ]
+    changes = [t for i, t in enumerate(timeline) if t.settings != timeline[i - 1].settings]
+    return changes or timeline[:1]
+
+
+class ScheduleEngine:
+    """
+    Applies the compiled timeline with a single armed point-in-time trigger.
+
+    When a field becomes scheduled, the entity's current value is remembered and
+    restored once no window schedules that field any more (e.g. the playlist selected
+    before sleep mode comes back in the morning).
+    """
+
+    def __init__(self, hass: HomeAssistant, windows: list[ScheduleWindow]) -> None:
+        self.hass = hass
+        self.timeline: list[Transition] = []
+        self._offsets: list[int] = []
+        self._compile(windows)
+        self._current = ScheduleSettings()
+        self._restore: dict[str, object] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._next: tuple[datetime, Transition] | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def current(self) -> ScheduleSettings:
+        """Settings applied by the most recent transition."""
+        return self._current
+
+    @property
+    def next_transition(self) -> tuple[datetime, Transition] | None:
+        """The armed transition and when it fires, or None without a schedule."""
+        return self._next
+
+    async def async_start(self) -> None:
+        """Apply the settings in force right now and arm the next transition."""
+        if not self.timeline:
+            return
+        now = dt_util.now()
+        await self._async_apply(self._transition_at(now).settings)
+        self._arm(now)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the armed trigger."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._next = None
+
+    async def async_set_windows(self, windows: list[ScheduleWindow]) -> None:
+        """Swap in new windows without a reload: re-apply the settings in force and re-arm."""
+        self.async_stop()
+        self._compile(windows)
+        if self.timeline:
+            await self.async_start()
+            return
+        await self._async_apply(ScheduleSettings())
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call *listener* whenever a new transition is armed; return an unsubscribe callable."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def upcoming(
+        self, count: int, after: datetime | None = None
+    ) -> list[tuple[datetime, Transition]]:
+        """Return the next *count* transitions after *after* (default: now)."""
+        if not self.timeline:
+            return []
+        after = dt_util.as_local(after or dt_util.now())
+        week_start = _week_start(after)
+        idx = bisect.bisect_right(self._offsets, _week_offset(after))
+        result: list[tuple[datetime, Transition]] = []
+        while len(result) < count:
+            if idx == len(self.timeline):
+                idx = 0
+                week_start += timedelta(days=7)
+            transition = self.timeline[idx]
+            when = _offset_to_datetime(week_start, transition.offset)
+            if when > after:
+                result.append((when, transition))
+            idx += 1
+        return result
+
+    def _compile(self, windows: list[ScheduleWindow]) -> None:
+        self.timeline = compile_timeline(windows)
+        self._offsets = [t.offset for t in self.timeline]
+
+    def _transition_at(self, moment: datetime) -> Transition:
+        """Return the transition in force at *moment*."""
+        idx = bisect.bisect_right(self._offsets, _week_offset(dt_util.as_local(moment)))
+        return self.timeline[idx - 1]
+
+    @callback
+    def _arm(self, after: datetime) -> None:
+        """Arm one point-in-time trigger for the first transition after *after*."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        when, transition = self.upcoming(1, after)[0]
+        self._next = (when, transition)
+        self._unsub_timer = async_track_point_in_time(self.hass, self._handle_transition, when)
+        for listener in list(self._listeners):
+            listener()
+
+    async def _handle_transition(self, now: datetime) -> None:
+        """Apply the armed transition and arm the following one."""
+        self._unsub_timer = None
+        if self._next is None:
+            return
+        when, transition = self._next
+        _LOGGER.debug("Schedule transition at %s: %s", when, transition.settings)
+        await self._async_apply(transition.settings)
+        self._arm(when)
+
+    async def _async_apply(self, settings: ScheduleSettings) -> None:
+        """Drive the select, default-volume number and master switch toward *settings*."""
+        previous = self._current
+        self._current = settings
+
+        playlist = self._target("playlist", previous.playlist, settings.playlist, SELECT_ENTITY_ID)
+        if playlist is not None:
+            sel = self.hass.states.get(SELECT_ENTITY_ID)
+            if sel is None or playlist not in (sel.attributes.get("options") or []):
+                _LOGGER.warning("Scheduled playlist '%s' is not configured; skipping", playlist)
+            elif sel.state != playlist:
+                await self.hass.services.async_call(
+                    "select",
+                    "select_option",
+                    {"entity_id": SELECT_ENTITY_ID, "option": playlist},
+                    blocking=True,
+                )
+
+        volume = self._target("volume", previous.volume, settings.volume, VOLUME_ENTITY_ID)
+        if volume is not None:
+            await self.hass.services.async_call(
+                "number",
+                "set_value",
+                {"entity_id": VOLUME_ENTITY_ID, "value": float(volume)},
+                blocking=True,
+            )
+
+        enabled = self._target(
+            "enabled", previous.enabled, settings.enabled, MASTER_SWITCH_ENTITY_ID
+        )
+        if enabled is not None:
+            if isinstance(enabled, str):
+                enabled = enabled == "on"
+            await self.hass.services.async_call(
+                "switch",
+                "turn_on" if enabled else "turn_off",
+                {"entity_id": MASTER_SWITCH_ENTITY_ID},
+                blocking=True,
+            )
+
+    def _target(self, key: str, previous, new, entity_id: str):
+        """
+        Return the value to apply for one field, or None if nothing should change.
+
+        Remembers the entity's value when the field becomes scheduled and hands it back
+        when the field stops being scheduled.
+        """
+        if new is not None:
+            if previous is None:
+                state = self.hass.states.get(entity_id)
+                if state is not None and state.state not in ("unknown", "unavailable"):
+                    self._restore[key] = state.state
+            return new if new != previous else None
+        if previous is not None:
+            return self._restore.pop(key, None)
+        return None
+
+
+def _week_start(moment: datetime) -> datetime:
+    """Return local midnight of the Monday of *moment*'s week."""
+    monday = moment.date() - timedelta(days=moment.weekday())
+    return datetime.combine(monday, time(), tzinfo=moment.tzinfo)
+
+
+def _week_offset(moment: datetime) -> int:
+    """Return *moment* as seconds since its week's Monday 00:00 (wall-clock)."""
+    seconds = moment.hour * 3600 + moment.minute * 60 + moment.second
+    return moment.weekday() * _DAY_SECONDS + seconds
+
+
+def _offset_to_datetime(week_start: datetime, offset: int) -> datetime:
+    """Convert a week offset into an aware local datetime, keeping wall-clock time across DST."""
+    day = week_start.date() + timedelta(days=offset // _DAY_SECONDS)
+    seconds = offset % _DAY_SECONDS
+    wall = time(seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+    return datetime.combine(day, wall, tzinfo=week_start.tzinfo)
@@ -2,34 +2,25 @@
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DEVICE_INFO, CONF_PLAYLISTS, CONF_PLAYLIST_RADIO_MODE
-from .providers import playlist_id_to_uri
+from .const import (
+    DEVICE_INFO,
+    CONF_PLAYLISTS,
+    CONF_PLAYLIST_PROVIDER,
+    CONF_PLAYLIST_RADIO_MODE,
+    CONF_PLAYLIST_URI,
+    SIGNAL_OPTIONS_UPDATED,
+)
+from .providers import PlaylistRecord
 
 
-def _get_playlist_mapping(entry: ConfigEntry) -> dict[str, dict]:
-    """Return a normalised {name: {id, radio_mode}} mapping from config entry options."""
-    raw = entry.options.get(CONF_PLAYLISTS, {})
-    if not isinstance(raw, dict):
-        return {}
-    
-    mapping = {}
-    for k, v in raw.items():
-        if isinstance(v, dict):
-            mapping[str(k)] = v
-        else:
-            mapping[str(k)] = {"id": str(v), CONF_PLAYLIST_RADIO_MODE: False}
-    
-    return mapping
-
-def _playlist_to_id(playlist_data) -> str:
-    """Extract the raw playlist ID string from either a dict or legacy scalar value."""
-    if isinstance(playlist_data, dict):
-        return playlist_data.get("id", "")
-    return str(playlist_data) if playlist_data else ""
+def _get_playlist_mapping(entry: ConfigEntry) -> dict[str, PlaylistRecord]:
+    """Return the stored {name: playlist record} mapping from config entry options."""
+    return dict(entry.options.get(CONF_PLAYLISTS) or {})
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -37,7 +28,7 @@ async def async_setup_entry(
     """Set up the playlist select entity from the config entry."""
     mapping = _get_playlist_mapping(entry)
     playlists = list(mapping.keys())
-    entity = AmbientMusicPlaylistSelect(playlists, mapping)
+    entity = AmbientMusicPlaylistSelect(entry, playlists, mapping)
     async_add_entities([entity])
 
 class AmbientMusicPlaylistSelect(SelectEntity, RestoreEntity):
@@ -47,8 +38,19 @@ class AmbientMusicPlaylistSelect(SelectEntity, RestoreEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "playlists"
     _attr_unique_id = "ambient_music_playlists"
-
-    def __init__(self, options: list[str], mapping: dict[str, dict]):
+    # The per-playlist maps grow with the library and never change on their own; keep
+    # them out of the recorder (list_playlists returns them on demand).
+    _unrecorded_attributes = frozenset(
+        {"playlists", "playlist_uris", "playlist_providers", "playlist_radio_modes"}
+    )
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        options: list[str],
+        mapping: dict[str, PlaylistRecord],
+    ):
+        self._entry = entry
         self._attr_options = options
         self._mapping = mapping
         self._attr_current_option = None
@@ -58,6 +60,24 @@ class AmbientMusicPlaylistSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in (self._attr_options or []):
             self._attr_current_option = last.state
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self._handle_options_updated,
+            )
+        )
+
+    @callback
+    def _handle_options_updated(self, changed: set[str]) -> None:
+        """Pick up added, removed or edited playlists; drop the selection if it was removed."""
+        if CONF_PLAYLISTS not in changed:
+            return
+        self._mapping = _get_playlist_mapping(self._entry)
+        self._attr_options = list(self._mapping.keys())
+        if self._attr_current_option not in self._mapping:
+            self._attr_current_option = None
+        self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
         if option not in self._attr_options:
@@ -73,42 +93,21 @@ class AmbientMusicPlaylistSelect(SelectEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self):
-        """Publish per-playlist URI, provider, and radio-mode maps plus current-playlist shortcuts."""
-        uri_map: dict[str, str] = {}
-        provider_map: dict[str, str] = {}
-        radio_mode_map: dict[str, bool] = {}
-        
-        for name, playlist_data in self._mapping.items():
-            playlist_id = _playlist_to_id(playlist_data)
-            prov, uri = playlist_id_to_uri(playlist_id)
-            uri_map[name] = uri if prov else ""
-            provider_map[name] = prov if prov else ""
-            radio_mode_map[name] = bool(
-                playlist_data.get(CONF_PLAYLIST_RADIO_MODE, False)
-                if isinstance(playlist_data, dict) else False
-            )
-
-        attrs = {
-            "playlists": {},
-            "playlist_uris": uri_map,
-            "playlist_providers": provider_map,
-            "playlist_radio_modes": radio_mode_map,
+        """Publish per-playlist maps and current-playlist shortcuts."""
+        current = self._mapping.get(self._attr_current_option or "", {})
+        return {
+            "playlists": {name: rec.get("id", "") for name, rec in self._mapping.items()},
+            "playlist_uris": {
+                name: rec.get(CONF_PLAYLIST_URI, "") for name, rec in self._mapping.items()
+            },
+            "playlist_providers": {
+                name: rec.get(CONF_PLAYLIST_PROVIDER, "") for name, rec in self._mapping.items()
+            },
+            "playlist_radio_modes": {
+                name: bool(rec.get(CONF_PLAYLIST_RADIO_MODE, False))
+                for name, rec in self._mapping.items()
+            },
+            "current_playlist_id": current.get("id", ""),
+            "current_playlist_uri": current.get(CONF_PLAYLIST_URI, ""),
+            "current_playlist_radio_mode": bool(current.get(CONF_PLAYLIST_RADIO_MODE, False)),
         }
-
-        for name, playlist_data in self._mapping.items():
-            attrs["playlists"][name] = _playlist_to_id(playlist_data)
-
-        current_name = self._attr_current_option or ""
-        current_data = self._mapping.get(current_name, {})
-        current_cid = _playlist_to_id(current_data)
-        curr_prov, curr_uri = playlist_id_to_uri(current_cid)
-        current_radio_mode = bool(
-            current_data.get(CONF_PLAYLIST_RADIO_MODE, False)
-            if isinstance(current_data, dict) else False
-        )
-
-        attrs["current_playlist_id"] = current_cid
-        attrs["current_playlist_uri"] = curr_uri if curr_prov else ""
-        attrs["current_playlist_radio_mode"] = current_radio_mode
-
-        return attrs
@@ -0,0 +1,203 @@
+"""Sensors — playback state, the next scheduled transition and the progress of running fades."""
+
+import time
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DEVICE_INFO, DOMAIN, FADE_PROGRESS_UPDATE_INTERVAL, SCHEDULE_PREVIEW_COUNT
+from .fade_engine import FadeMixer
+from .models import AmbientMusicData
+from .playback import (
+    STATE_FADING_DOWN,
+    STATE_IDLE,
+    STATE_PLAYING,
+    STATE_STARTING,
+    STATE_STOPPING,
+    PlaybackZone,
+)
+from .scheduler import ScheduleEngine
+
+
+class AmbientMusicPlaybackSensor(SensorEntity):
+    """
+    Playback state of the zone, with the pending playlist request as an attribute.
+
+    Written on every phase change, so it carries nothing else; the playlist maps stay on
+    the select, which is only written when the selection or the playlists change.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+    _attr_translation_key = "playback"
+    _attr_unique_id = "ambient_music_playback"
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [
+        STATE_IDLE, STATE_FADING_DOWN, STATE_STARTING, STATE_PLAYING, STATE_STOPPING
+    ]
+
+    def __init__(self, zone: PlaybackZone | None):
+        self._zone = zone
+
+    @property
+    def device_info(self):
+        return DEVICE_INFO
+
+    @property
+    def native_value(self) -> str | None:
+        return self._zone.state if self._zone else None
+
+    @property
+    def extra_state_attributes(self):
+        return {"requested_playlist": self._zone.requested if self._zone else None}
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._zone is not None:
+            self.async_on_remove(self._zone.async_add_listener(self.async_write_ha_state))
+
+
+class AmbientMusicNextTransitionSensor(SensorEntity):
+    """Timestamp of the next schedule transition, with the next few precomputed as attributes."""
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+    _attr_translation_key = "next_transition"
+    _attr_unique_id = "ambient_music_next_transition"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, scheduler: ScheduleEngine | None):
+        self._scheduler = scheduler
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = {"upcoming": [], "active_windows": []}
+
+    @property
+    def device_info(self):
+        return DEVICE_INFO
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._scheduler is None:
+            return
+        self.async_on_remove(self._scheduler.async_add_listener(self._handle_rearm))
+        self._refresh()
+
+    @callback
+    def _handle_rearm(self) -> None:
+        self._refresh()
+        self.async_write_ha_state()
+
+    @callback
+    def _refresh(self) -> None:
+        """Recompute the preview once per armed transition rather than on every state read."""
+        upcoming = self._scheduler.upcoming(SCHEDULE_PREVIEW_COUNT)
+        self._attr_native_value = upcoming[0][0] if upcoming else None
+        self._attr_extra_state_attributes = {
+            "upcoming": [
+                {
+                    "at": when.isoformat(),
+                    "playlist": transition.settings.playlist,
+                    "volume": transition.settings.volume,
+                    "enabled": transition.settings.enabled,
+                    "windows": list(transition.settings.windows),
+                }
+                for when, transition in upcoming
+            ],
+            "active_windows": list(self._scheduler.current.windows),
+        }
+
+
+class AmbientMusicFadeProgressSensor(SensorEntity):
+    """Number of running fades, with each fade's level, progress and ETA as attributes."""
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+    _attr_translation_key = "fade_progress"
+    _attr_unique_id = "ambient_music_fade_progress"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"fades"})
+
+    def __init__(self, mixer: FadeMixer | None):
+        self._mixer = mixer
+        self._attr_native_value = 0
+        self._attr_extra_state_attributes = {"fades": []}
+        self._last_write = 0.0
+        self._pending_write = None
+
+    @property
+    def device_info(self):
+        return DEVICE_INFO
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._mixer is None:
+            return
+        self.async_on_remove(self._mixer.async_add_listener(self._handle_mixer_update))
+        self.async_on_remove(self._cancel_pending_write)
+
+    @callback
+    def _handle_mixer_update(self) -> None:
+        """Write at most once per interval; a change inside it is written when it ends."""
+        if self._pending_write is not None:
+            return
+        wait = self._last_write + FADE_PROGRESS_UPDATE_INTERVAL - time.monotonic()
+        if wait > 0:
+            self._pending_write = async_call_later(self.hass, wait, self._write_pending)
+            return
+        self._write()
+
+    @callback
+    def _write_pending(self, _now) -> None:
+        self._pending_write = None
+        self._write()
+
+    @callback
+    def _cancel_pending_write(self) -> None:
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+
+    @callback
+    def _write(self) -> None:
+        self._last_write = time.monotonic()
+        now = dt_util.utcnow()
+        fades = self._mixer.progress()
+        self._attr_native_value = len(fades)
+        self._attr_extra_state_attributes = {
+            "fades": [
+                {
+                    "entity_ids": fade["entity_ids"],
+                    "levels": fade["levels"],
+                    "targets": fade["targets"],
+                    "progress": fade["progress"],
+                    # A paused fade has no ETA until it is resumed.
+                    "ends_at": None if fade["paused"] else (
+                        now + timedelta(seconds=fade["remaining"])
+                    ).isoformat(),
+                    "paused": fade["paused"],
+                }
+                for fade in fades
+            ],
+        }
+        self.async_write_ha_state()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the playback, schedule and fade progress sensors from a config entry."""
+    data: AmbientMusicData = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        [
+            AmbientMusicPlaybackSensor(data.zone),
+            AmbientMusicNextTransitionSensor(data.scheduler),
+            AmbientMusicFadeProgressSensor(data.mixer),
+        ]
+    )
@@ -0,0 +1,128 @@
+"""Persistent runtime state — per-speaker volumes, last playlists and in-flight operations."""
+
+import time
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORE_SAVE_DELAY
+
+STORAGE_VERSION = 1
+STORAGE_KEY_PREFIX = f"{DOMAIN}.runtime"
+_DEFAULT_TOLERANCE: float = 0.001
+
+
+class RuntimeStore:
+    """
+    Store-backed runtime state with debounced writes.
+
+    Every mutation only updates memory and (re)arms one delayed save, so a fade that
+    records a volume four times a second per speaker still produces a single write per
+    ``STORE_SAVE_DELAY``.  Home Assistant flushes the pending save on shutdown.
+
+    Layout::
+
+        {
+            "speakers": {entity_id: {"volume", "updated", "pre_stop_volume", "pre_stop_default"}},
+            "players": {entity_id: {"playlist", "uri", "updated"}},
+            "operations": {operation_id: {"kind", "targets", ..., "started"}},
+        }
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}.{entry_id}")
+        self._data: dict[str, dict] = {"speakers": {}, "players": {}, "operations": {}}
+
+    async def async_load(self) -> None:
+        """Read the state file once; entity states are never scanned."""
+        stored = await self._store.async_load()
+        if isinstance(stored, dict):
+            for key in self._data:
+                if isinstance(stored.get(key), dict):
+                    self._data[key] = stored[key]
+
+    async def async_remove(self) -> None:
+        """Delete the state file (the config entry was removed)."""
+        await self._store.async_remove()
+
+    @callback
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._data, STORE_SAVE_DELAY)
+
+    def _speaker(self, entity_id: str) -> dict[str, Any]:
+        return self._data["speakers"].setdefault(entity_id, {})
+
+    @callback
+    def record_volumes(self, entity_ids: Iterable[str], volume_level: float) -> None:
+        """Remember the last volume commanded to each speaker."""
+        now = time.time()
+        for entity_id in entity_ids:
+            speaker = self._speaker(entity_id)
+            speaker["volume"] = float(volume_level)
+            speaker["updated"] = now
+        self._schedule_save()
+
+    @callback
+    def record_pre_stop(self, levels: dict[str, float], default_volume: float) -> None:
+        """
+        Remember each speaker's level right before a stop or switchover fade.
+
+        :param levels: {entity_id: level} of the speakers being silenced.
+        :param default_volume: The default volume at the time; a later change of the
+            default invalidates these levels.
+        """
+        for entity_id, level in levels.items():
+            speaker = self._speaker(entity_id)
+            speaker["pre_stop_volume"] = float(level)
+            speaker["pre_stop_default"] = float(default_volume)
+        self._schedule_save()
+
+    def pre_stop_volumes(
+        self, entity_ids: Iterable[str], default_volume: float
+    ) -> dict[str, float]:
+        """Return {entity_id: level} for speakers stopped while *default_volume* was in force."""
+        levels: dict[str, float] = {}
+        for entity_id in entity_ids:
+            speaker = self._data["speakers"].get(entity_id) or {}
+            level = speaker.get("pre_stop_volume")
+            default = speaker.get("pre_stop_default")
+            if level is None or default is None:
+                continue
+            if abs(float(default) - default_volume) <= _DEFAULT_TOLERANCE:
+                levels[entity_id] = float(level)
+        return levels
+
+    @callback
+    def record_playlist(self, entity_ids: Iterable[str], playlist: str, uri: str) -> None:
+        """Remember which playlist each player was last started with."""
+        now = time.time()
+        for entity_id in entity_ids:
+            self._data["players"][entity_id] = {"playlist": playlist, "uri": uri, "updated": now}
+        self._schedule_save()
+
+    def last_playlist(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the last playlist record for a player, if any."""
+        return self._data["players"].get(entity_id)
+
+    @callback
+    def begin_operation(self, operation_id: str, record: dict[str, Any]) -> None:
+        """Persist an operation's resume plan until it finishes."""
+        self._data["operations"][operation_id] = {**record, "started": time.time()}
+        self._schedule_save()
+
+    @callback
+    def end_operation(self, operation_id: str) -> None:
+        """Forget a finished, cancelled or superseded operation."""
+        if self._data["operations"].pop(operation_id, None) is not None:
+            self._schedule_save()
+
+    @callback
+    def pop_interrupted_operations(self) -> list[dict[str, Any]]:
+        """Return and forget operations left running by the previous Home Assistant run."""
+        operations = list(self._data["operations"].values())
+        if operations:
+            self._data["operations"] = {}
+            self._schedule_save()
+        return operations
@@ -1,97 +1,316 @@
-"""State-change watchers that trigger play/pause/stop in response to blocker or playlist changes."""
+"""Trigger watchers that play, stop or switch over in response to blockers, playlists and time."""
 
+import asyncio
 import logging
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Awaitable, Callable
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    TRIGGER_ACTION,
+    TRIGGER_ACTION_PLAY,
+    TRIGGER_ACTIONS,
+    TRIGGER_AT,
+    TRIGGER_DAYS,
+    TRIGGER_EVENT,
+    TRIGGER_EVENT_BLOCKERS_ACTIVE,
+    TRIGGER_EVENT_BLOCKERS_CLEAR,
+    TRIGGER_EVENT_PLAYLIST_CHANGED,
+    TRIGGER_EVENT_TIME,
+    TRIGGER_NAME,
+    WEEKDAYS,
+)
+from .playback import PlaybackZone
+from .scheduler import parse_time
 
 _LOGGER = logging.getLogger(__name__)
 
+BLOCKERS_CLEAR_ENTITY_ID = "binary_sensor.ambient_music_blockers_clear"
+SELECT_ENTITY_ID = "select.ambient_music_playlists"
+
+
+class WatcherTaskGroup:
+    """
+    Owns every task started by the watchers of one config entry.
+
+    Work is submitted under a key (e.g. "blockers", "playlist").  Each key runs at most
+    one task at a time and keeps at most one waiting job; a newer job for a busy key
+    replaces the waiting one (latest wins), so an event storm cannot queue unbounded
+    work.  Everything is cancelled when the entry unloads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._running: dict[str, asyncio.Task] = {}
+        self._waiting: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._closed = False
+        self.dropped = 0
+        self.completed = 0
+
+    @property
+    def active(self) -> int:
+        """Number of watcher tasks currently running."""
+        return len(self._running)
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for their key to become free."""
+        return len(self._waiting)
+
+    @callback
+    def submit(self, key: str, job: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run *job* for *key* now, or once the key's current task finishes.
+
+        :param key: Serialisation key; jobs with different keys run concurrently.
+        :param job: Zero-argument coroutine function, only called when the job starts, so
+            a replaced job never creates a coroutine.
+        """
+        if self._closed:
+            return
+        if key in self._running:
+            if key in self._waiting:
+                self.dropped += 1
+                _LOGGER.debug("Watcher job for '%s' superseded by a newer one", key)
+            self._waiting[key] = job
+            return
+        self._start(key, job)
+
+    @callback
+    def _start(self, key: str, job: Callable[[], Awaitable[None]]) -> None:
+        task = self.hass.async_create_task(job(), f"ambient_music_watcher_{key}")
+        self._running[key] = task
+        task.add_done_callback(lambda t, key=key: self._finished(key, t))
+
+    @callback
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._running.get(key) is task:
+            del self._running[key]
+        if not task.cancelled():
+            self.completed += 1
+            if (err := task.exception()) is not None:
+                _LOGGER.error("Watcher job for '%s' failed: %s", key, err)
+        if not self._closed and (job := self._waiting.pop(key, None)) is not None:
+            self._start(key, job)
+
+    @callback
+    def async_cancel_all(self) -> None:
+        """Drop waiting jobs and cancel running ones; no new work is accepted afterwards."""
+        self._closed = True
+        self.dropped += len(self._waiting)
+        self._waiting.clear()
+        for task in list(self._running.values()):
+            task.cancel()
+
+    def as_dict(self) -> dict[str, int]:
+        """Counts for diagnostics."""
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "completed": self.completed,
+        }
+
+
+@dataclass(frozen=True)
+class TriggerRule:
+    """
+    One native trigger rule: when *event* happens, run *action*.
+
+    :param name: Display name.
+    :param event: One of the ``TRIGGER_EVENT_*`` constants.
+    :param action: One of the actions ``TRIGGER_ACTIONS`` allows for *event*.
+    :param at: For time rules, seconds since local midnight.
+    :param days: For time rules, weekday indexes (0 = Monday) the rule fires on.
+    """
+
+    name: str
+    event: str
+    action: str
+    at: int | None = None
+    days: tuple[int, ...] = ()
 
-class _WatcherServiceCall:
-    """Minimal stand-in for ServiceCall so watcher-triggered handlers get a valid call object."""
+    @classmethod
+    def from_option(cls, raw: dict) -> "TriggerRule | None":
+        """Build a rule from its stored options dict; return None if it is malformed."""
+        event = raw.get(TRIGGER_EVENT)
+        action = raw.get(TRIGGER_ACTION)
+        if action not in TRIGGER_ACTIONS.get(event, []):
+            return None
+        at = None
+        days: tuple[int, ...] = ()
+        if event == TRIGGER_EVENT_TIME:
+            at = parse_time(raw.get(TRIGGER_AT))
+            days = tuple(sorted(
+                {WEEKDAYS.index(d) for d in raw.get(TRIGGER_DAYS, []) if d in WEEKDAYS}
+            ))
+            if at is None or not days:
+                return None
+        name = str(raw.get(TRIGGER_NAME, ""))
+        return cls(name=name, event=event, action=action, at=at, days=days)
 
-    def __init__(self):
-        self.data = {}
 
-async def async_setup_watchers(
-    hass: HomeAssistant,
-    entry_id: str,
-    play_handler: callable,
-    pause_handler: callable,
-    stop_handler: callable,
-    debouncer
-):
+class StateWatchers:
     """
-    Subscribe to blocker and playlist state changes and wire them to service handlers.
-
-    :param hass: Home Assistant instance.
-    :param entry_id: Config entry ID (reserved for future per-entry scoping).
-    :param play_handler: Coroutine called when playback should start.
-    :param pause_handler: Coroutine called when playback should pause (switchover).
-    :param stop_handler: Coroutine called when playback should stop.
-    :param debouncer: Service debouncer shared with the service layer.
-    :return: Cleanup callable that removes all subscriptions.
+    Native trigger rules of one config entry.
+
+    Rules are compiled into exactly the subscriptions they need: a state listener on the
+    blockers-clear sensor or the playlist select, or one time trigger per time rule.
+    Handlers are bound ``@callback`` methods, so Home Assistant runs them directly in
+    the event loop, with no automation or service call in between; all resulting work is
+    handed to the entry's WatcherTaskGroup, where play and stop share one key so the
+    latest wins.  The delay between a trigger firing and its work being dispatched is
+    recorded for diagnostics.
     """
-    unsubscribe_blockers = async_track_state_change_event(
-        hass,
-        "binary_sensor.ambient_music_blockers_clear",
-        lambda event: _handle_blockers_change(hass, event, stop_handler, play_handler, debouncer)
-    )
-
-    unsubscribe_playlist = async_track_state_change_event(
-        hass,
-        "select.ambient_music_playlists",
-        lambda event: _handle_playlist_change(hass, event, pause_handler, play_handler, debouncer)
-    )
-
-    def cleanup():
-        unsubscribe_blockers()
-        unsubscribe_playlist()
-
-    return cleanup
-
-@callback
-def _handle_blockers_change(hass: HomeAssistant, event, stop_handler: callable, play_handler: callable, debouncer):
-    """Stop playback when blockers activate; resume when they clear."""
-    new_state = event.data.get("new_state")
-    old_state = event.data.get("old_state")
-
-    if not new_state or not old_state:
-        return
-
-    if old_state.state == "on" and new_state.state == "off":
-        _LOGGER.debug("Blockers activated, triggering stop via watcher")
-        call = _WatcherServiceCall()
-        hass.loop.create_task(stop_handler(call))
-    elif old_state.state == "off" and new_state.state == "on":
-        _LOGGER.debug("Blockers cleared, triggering play via watcher")
-        call = _WatcherServiceCall()
-        hass.loop.create_task(play_handler(call))
-
-@callback
-def _handle_playlist_change(hass: HomeAssistant, event, pause_handler: callable, play_handler: callable, debouncer):
-    """Fade-down then start the new playlist when the active playlist select changes."""
-    new_state = event.data.get("new_state")
-    old_state = event.data.get("old_state")
-
-    if not new_state:
-        return
-
-    if old_state and new_state.state == old_state.state:
-        return
-
-    if new_state.state not in ("unknown", "unavailable"):
-        _LOGGER.debug(f"Playlist changed to {new_state.state}, triggering switchover via watcher")
-        call = _WatcherServiceCall()
-        
-        async def _switchover():
-            pause_debouncer_state_before = dict(debouncer.last_trigger_time)
-            await pause_handler(call)
-            pause_executed = debouncer.last_trigger_time.get("pause_for_switchover", 0) > pause_debouncer_state_before.get("pause_for_switchover", 0)
-            
-            if pause_executed:
-                await play_handler(call)
-            else:
-                _LOGGER.debug("Pause was debounced (automation likely already paused), skipping immediate play")
-        
-        hass.loop.create_task(_switchover())
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        play_handler: Callable[[], Awaitable[object]],
+        stop_handler: Callable[[], Awaitable[object]],
+        zone: PlaybackZone,
+        rules: list[TriggerRule],
+    ) -> None:
+        """
+        :param hass: Home Assistant instance.
+        :param play_handler: Coroutine function that starts playback if blockers allow it.
+        :param stop_handler: Coroutine function that stops playback.
+        :param zone: Playback state machine that performs playlist switchovers.
+        :param rules: Trigger rules to watch.
+        """
+        self.hass = hass
+        self._play_handler = play_handler
+        self._stop_handler = stop_handler
+        self._zone = zone
+        self.rules = list(rules)
+        self.tasks = WatcherTaskGroup(hass)
+        self._unsubs: list[Callable[[], None]] = []
+        self._on_event: dict[str, list[TriggerRule]] = {}
+        self.fired: dict[str, int] = {}
+        self.dispatches = 0
+        self.last_latency_ms: float | None = None
+        self.max_latency_ms: float = 0.0
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to what the rules need: blockers, the playlist select, time triggers."""
+        self._on_event = {}
+        for rule in self.rules:
+            self._on_event.setdefault(rule.event, []).append(rule)
+        if {TRIGGER_EVENT_BLOCKERS_CLEAR, TRIGGER_EVENT_BLOCKERS_ACTIVE} & self._on_event.keys():
+            self._unsubs.append(async_track_state_change_event(
+                self.hass, BLOCKERS_CLEAR_ENTITY_ID, self._handle_blockers_change
+            ))
+        if TRIGGER_EVENT_PLAYLIST_CHANGED in self._on_event:
+            self._unsubs.append(async_track_state_change_event(
+                self.hass, SELECT_ENTITY_ID, self._handle_playlist_change
+            ))
+        for rule in self._on_event.get(TRIGGER_EVENT_TIME, []):
+            self._unsubs.append(async_track_time_change(
+                self.hass,
+                partial(self._handle_time, rule),
+                hour=rule.at // 3600,
+                minute=rule.at // 60 % 60,
+                second=rule.at % 60,
+            ))
+
+    @callback
+    def async_set_rules(self, rules: list[TriggerRule]) -> None:
+        """Swap in new rules without a reload; running work is left alone."""
+        self._unsubscribe()
+        self.rules = list(rules)
+        self.async_start()
+
+    @callback
+    def async_stop(self) -> None:
+        """Remove all subscriptions and cancel watcher tasks."""
+        self._unsubscribe()
+        self.tasks.async_cancel_all()
+
+    def as_dict(self) -> dict:
+        """Rules, task counts and dispatch latency for diagnostics."""
+        return {
+            "rules": [
+                {"name": rule.name, "event": rule.event, "action": rule.action}
+                for rule in self.rules
+            ],
+            "fired": dict(self.fired),
+            "tasks": self.tasks.as_dict(),
+            "dispatches": self.dispatches,
+            "last_dispatch_latency_ms": self.last_latency_ms,
+            "max_dispatch_latency_ms": self.max_latency_ms,
+        }
+
+    @callback
+    def _unsubscribe(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _dispatch(self, fired: datetime, key: str, job: Callable[[], Awaitable[object]]) -> None:
+        """Submit *job* and record how long after *fired* it was dispatched."""
+        self.tasks.submit(key, job)
+        latency = round((dt_util.utcnow() - fired).total_seconds() * 1000, 3)
+        self.dispatches += 1
+        self.last_latency_ms = latency
+        self.max_latency_ms = max(self.max_latency_ms, latency)
+
+    @callback
+    def _run_rules(self, rules: list[TriggerRule], fired: datetime) -> None:
+        """Count *rules* as fired and dispatch each distinct play/stop action once."""
+        for rule in rules:
+            self.fired[rule.name] = self.fired.get(rule.name, 0) + 1
+        for action in dict.fromkeys(rule.action for rule in rules):
+            handler = self._play_handler if action == TRIGGER_ACTION_PLAY else self._stop_handler
+            self._dispatch(fired, "playback", handler)
+
+    @callback
+    def _handle_blockers_change(self, event: Event) -> None:
+        """Run the blocked / cleared rules when the blockers sensor flips."""
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+
+        if not new_state or not old_state:
+            return
+
+        if old_state.state == "on" and new_state.state == "off":
+            _LOGGER.debug("Blockers activated, running trigger rules")
+            self._run_rules(self._on_event.get(TRIGGER_EVENT_BLOCKERS_ACTIVE, []), event.time_fired)
+        elif old_state.state == "off" and new_state.state == "on":
+            _LOGGER.debug("Blockers cleared, running trigger rules")
+            self._run_rules(self._on_event.get(TRIGGER_EVENT_BLOCKERS_CLEAR, []), event.time_fired)
+
+    @callback
+    def _handle_time(self, rule: TriggerRule, now: datetime) -> None:
+        """Run a time rule's action if it is set for today."""
+        if dt_util.as_local(now).weekday() not in rule.days:
+            return
+        _LOGGER.debug("Time trigger '%s' fired, running %s", rule.name, rule.action)
+        self._run_rules([rule], now)
+
+    @callback
+    def _handle_playlist_change(self, event: Event) -> None:
+        """Request a switchover to the newly selected playlist; the zone keeps only the latest."""
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+
+        if not new_state:
+            return
+
+        if old_state and new_state.state == old_state.state:
+            return
+
+        if new_state.state in ("unknown", "unavailable"):
+            return
+
+        _LOGGER.debug("Playlist changed to %s, requesting switchover via watcher", new_state.state)
+        for rule in self._on_event.get(TRIGGER_EVENT_PLAYLIST_CHANGED, []):
+            self.fired[rule.name] = self.fired.get(rule.name, 0) + 1
+        self._zone.async_request(new_state.state)
+        self._dispatch(event.time_fired, "playlist", self._zone.async_process_requests)
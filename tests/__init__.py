@@ -0,0 +1 @@
+"""Tests for the Ambient Music integration."""
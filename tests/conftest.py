@@ -0,0 +1,11 @@
+"""Shared fixtures for the Ambient Music tests."""
+
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load custom_components/ambient_music in every test."""
+    yield
@@ -0,0 +1,57 @@
+"""Ducks suspend only the ducked speakers' share of a running fade."""
+
+import asyncio
+
+from homeassistant.components.media_player import MediaPlayerEntityFeature
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.ambient_music.ducking import DuckController
+from custom_components.ambient_music.fade_engine import FadeMixer, VolumeShadow
+
+GROUP = "media_player.downstairs"
+KITCHEN = "media_player.kitchen"
+LOUNGE = "media_player.lounge"
+
+
+async def test_duck_one_member_of_native_group(hass):
+    """The member that is not ducked keeps following the group's fade while the other is."""
+    for speaker in (KITCHEN, LOUNGE):
+        hass.states.async_set(speaker, "playing", {"volume_level": 0.2})
+    hass.states.async_set(
+        GROUP,
+        "playing",
+        {
+            "volume_level": 0.2,
+            "supported_features": MediaPlayerEntityFeature.VOLUME_SET,
+            "group_members": [KITCHEN, LOUNGE],
+        },
+    )
+    calls = async_mock_service(hass, "media_player", "volume_set")
+    shadow = VolumeShadow()
+    mixer = FadeMixer(hass, shadow=shadow)
+    ducker = DuckController(hass, mixer, shadow)
+
+    fade = hass.async_create_task(mixer.async_fade([GROUP], 0.8, 2.0, "linear"))
+    await asyncio.sleep(0.5)
+    assert calls[-1].data["entity_id"] == [GROUP]
+
+    await ducker.async_duck([KITCHEN], 0.05, 0.0, 0.5, 0.3)
+    assert shadow.get(KITCHEN)[0] == 0.05
+    ducked_at = len(calls)
+    await asyncio.sleep(0.4)
+    # The lounge still ramps on its own while the kitchen stays ducked.
+    during = calls[ducked_at:]
+    assert during
+    assert all(call.data["entity_id"] == [LOUNGE] for call in during)
+    lounge_levels = [call.data["volume_level"] for call in during]
+    assert lounge_levels == sorted(lounge_levels)
+    assert shadow.get(KITCHEN)[0] == 0.05
+    assert mixer.as_dict()["suspended_ramps"] == 1
+
+    await asyncio.wait_for(fade, 3)
+    await asyncio.sleep(0.5)
+    await hass.async_block_till_done()
+    assert shadow.get(LOUNGE)[0] == 0.8
+    assert shadow.get(KITCHEN)[0] == 0.8
+    assert ducker.as_dict()["speakers"] == {}
+    assert mixer.as_dict()["suspended_ramps"] == 0
@@ -0,0 +1,115 @@
+"""The direct Music Assistant transport against a local stand-in server."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.ambient_music.fade_engine import _guarded_volume_set
+from custom_components.ambient_music.ma_client import MusicAssistantTransport, to_ws_url
+
+
+class StandInServer:
+    """Minimal Music Assistant websocket endpoint: server info, then an ack per command."""
+
+    def __init__(self) -> None:
+        self.commands: list[dict] = []
+        self.sockets: list[web.WebSocketResponse] = []
+        app = web.Application()
+        app.router.add_get("/ws", self._handle)
+        self.server = TestServer(app)
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        await ws.send_json({"server_id": "stand-in", "server_version": "2.3.0"})
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                data = msg.json()
+                self.commands.append(data)
+                await ws.send_json({"message_id": data["message_id"], "result": None})
+        return ws
+
+    async def drop(self) -> None:
+        """Close every open client socket from the server side."""
+        for ws in self.sockets:
+            await ws.close()
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://ma.local:8095", "ws://ma.local:8095/ws"),
+        ("https://ma.local:8095/", "wss://ma.local:8095/ws"),
+        ("ws://ma.local:8095/ws", "ws://ma.local:8095/ws"),
+        (" wss://ma.local ", "wss://ma.local/ws"),
+    ],
+)
+def test_to_ws_url(url, expected):
+    """Server base URLs map onto the /ws endpoint with the matching scheme."""
+    assert to_ws_url(url) == expected
+
+
+async def test_commands_and_fallback(hass, socket_enabled):
+    """MA players are commanded over the socket; others, and all once it drops, use services."""
+    ent_reg = er.async_get(hass)
+    ma_player = ent_reg.async_get_or_create(
+        "media_player", "music_assistant", "ma_kitchen", suggested_object_id="kitchen"
+    ).entity_id
+    other_player = ent_reg.async_get_or_create(
+        "media_player", "sonos", "RINCON_1", suggested_object_id="hall"
+    ).entity_id
+    volume_calls = async_mock_service(hass, "media_player", "volume_set")
+
+    stand_in = StandInServer()
+    await stand_in.server.start_server()
+    session = aiohttp.ClientSession()
+    base_url = str(stand_in.server.make_url("/")).rstrip("/")
+    transport = MusicAssistantTransport(hass, to_ws_url(base_url), session=session)
+    run_task = hass.async_create_task(transport.async_run())
+    try:
+        await _wait_for(lambda: transport.connected)
+        assert transport.url == base_url.replace("http", "ws", 1) + "/ws"
+        assert transport.server_info["server_version"] == "2.3.0"
+
+        await _guarded_volume_set(hass, [ma_player, other_player], 0.42, 2.0, transport)
+        assert await transport.play_media([ma_player], "spotify://playlist/x", True) == []
+        await _wait_for(lambda: len(stand_in.commands) == 2)
+        volume_cmd, play_cmd = stand_in.commands
+        assert volume_cmd["command"] == "players/cmd/volume_set"
+        assert volume_cmd["args"] == {"player_id": "ma_kitchen", "volume_level": 42}
+        assert play_cmd["command"] == "player_queues/play_media"
+        assert play_cmd["args"] == {
+            "queue_id": "ma_kitchen",
+            "media": "spotify://playlist/x",
+            "option": "replace",
+            "radio_mode": True,
+        }
+        assert volume_cmd["message_id"] != play_cmd["message_id"]
+        assert [call.data["entity_id"] for call in volume_calls] == [[other_player]]
+
+        await stand_in.drop()
+        await _wait_for(lambda: not transport.connected)
+        await _guarded_volume_set(hass, [ma_player, other_player], 0.1, 2.0, transport)
+        assert volume_calls[-1].data == {
+            "entity_id": [ma_player, other_player],
+            "volume_level": 0.1,
+        }
+        assert len(stand_in.commands) == 2
+    finally:
+        await transport.async_stop()
+        run_task.cancel()
+        await asyncio.gather(run_task, return_exceptions=True)
+        await session.close()
+        await stand_in.server.close()
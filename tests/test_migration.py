@@ -0,0 +1,35 @@
+"""Version 1 options migrate to playlist records without hiding ambiguous provider guesses."""
+
+import logging
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ambient_music import _async_recheck_playlists, async_migrate_entry
+from custom_components.ambient_music.const import CONF_PLAYLISTS, DOMAIN
+
+
+async def test_ambiguous_numeric_id_is_flagged_and_warned(hass, caplog):
+    """An 8-digit ID valid for Deezer and Qobuz is logged at migration and on recheck."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=1,
+        options={CONF_PLAYLISTS: {"Dinner": "12345678", "Focus": {"id": "123456789"}}},
+    )
+    entry.add_to_hass(hass)
+
+    with caplog.at_level(logging.WARNING):
+        assert await async_migrate_entry(hass, entry)
+    assert entry.version == 2
+    playlists = entry.options[CONF_PLAYLISTS]
+    assert playlists["Dinner"]["provider"] == "deezer"
+    assert playlists["Dinner"]["provider_guessed"] is True
+    # Nine digits only fit Deezer, so that guess is not flagged.
+    assert "provider_guessed" not in playlists["Focus"]
+    assert "Playlist 'Dinner' has an ID valid for deezer, qobuz" in caplog.text
+    assert "'Focus'" not in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        await _async_recheck_playlists(hass, entry)
+    assert "Playlist 'Dinner' has an ID valid for deezer, qobuz" in caplog.text
+    assert entry.options[CONF_PLAYLISTS]["Dinner"]["provider_guessed"] is True
@@ -0,0 +1,64 @@
+"""Setup timing breakdown and entry-scoped orphan cleanup on a large entity registry."""
+
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ambient_music import PLATFORMS
+from custom_components.ambient_music.binary_sensor import playlist_sensor_unique_id
+from custom_components.ambient_music.const import DOMAIN
+
+FOREIGN_ENTITIES = 50_000
+# Orphan cleanup only walks this entry's registrations, so its cost must not grow with the
+# rest of the registry.  Scanning all 50k registrations takes several milliseconds on a
+# laptop; the entry-scoped walk takes a fraction of one.
+ORPHAN_CLEANUP_BOUND_MS = 3.0
+
+
+async def test_setup_timings_and_orphan_cleanup(hass):
+    """Setup times each phase and platform, and cleanup ignores other integrations."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        options={
+            "media_players": ["media_player.lounge"],
+            "playlists": {
+                "Chill": {"id": "abc", "provider": "spotify", "uri": "spotify://playlist/abc"}
+            },
+        },
+    )
+    entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(domain="other")
+    other_entry.add_to_hass(hass)
+
+    ent_reg = er.async_get(hass)
+    for index in range(FOREIGN_ENTITIES):
+        # Same unique-id shape as a stale playlist sensor, but owned by another entry.
+        ent_reg.async_get_or_create(
+            "binary_sensor", "other", f"ambient_music_{index}_enabled", config_entry=other_entry
+        )
+    kept = ent_reg.async_get_or_create(
+        "binary_sensor", DOMAIN, playlist_sensor_unique_id("Chill"), config_entry=entry
+    ).entity_id
+    orphan = ent_reg.async_get_or_create(
+        "binary_sensor", DOMAIN, playlist_sensor_unique_id("Deleted"), config_entry=entry
+    ).entity_id
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    timings = hass.data[DOMAIN][entry.entry_id].setup_timings
+    expected = {"store_load", "orphan_cleanup", "total"}
+    expected |= {f"platform.{platform}" for platform in PLATFORMS}
+    assert expected <= timings.keys()
+    assert all(value >= 0 for value in timings.values())
+    assert timings["orphan_cleanup"] < ORPHAN_CLEANUP_BOUND_MS
+    assert timings["total"] >= max(timings[f"platform.{platform}"] for platform in PLATFORMS)
+
+    assert ent_reg.async_get(kept) is not None
+    assert ent_reg.async_get(orphan) is None
+    assert len(er.async_entries_for_config_entry(ent_reg, other_entry.entry_id)) == (
+        FOREIGN_ENTITIES
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,45 @@
+"""Trigger watchers run in the event loop and dispatch without an executor hop."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from custom_components.ambient_music.const import DEFAULT_TRIGGERS
+from custom_components.ambient_music.watchers import (
+    BLOCKERS_CLEAR_ENTITY_ID,
+    StateWatchers,
+    TriggerRule,
+)
+
+
+async def test_state_change_dispatches_in_loop(hass):
+    """A blockers-clear state change reaches the play handler without the executor."""
+    loop_thread = threading.get_ident()
+    calls: list[int] = []
+
+    async def play() -> None:
+        calls.append(threading.get_ident())
+
+    async def stop() -> None:
+        pass
+
+    rules = [TriggerRule.from_option(raw) for raw in DEFAULT_TRIGGERS]
+    watchers = StateWatchers(hass, play, stop, MagicMock(), rules)
+    watchers.async_start()
+    hass.states.async_set(BLOCKERS_CLEAR_ENTITY_ID, "off")
+    await hass.async_block_till_done()
+
+    with (
+        patch.object(hass.loop, "run_in_executor", wraps=hass.loop.run_in_executor) as executor,
+        patch.object(hass, "async_add_executor_job", wraps=hass.async_add_executor_job) as job,
+    ):
+        hass.states.async_set(BLOCKERS_CLEAR_ENTITY_ID, "on")
+        await hass.async_block_till_done()
+
+    assert calls == [loop_thread]
+    executor.assert_not_called()
+    job.assert_not_called()
+    assert watchers.dispatches == 1
+    assert watchers.last_latency_ms is not None
+    # Dispatch happens in the same loop iteration as the state change.
+    assert watchers.last_latency_ms < 50
+    watchers.async_stop()